@@ -0,0 +1,120 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Cache files that hosts need on the controller, addressed by their sha256.
+
+Artifacts are downloaded once into the cache and uploaded to hosts from there.
+Uploads with files.put are skipped if the host already has the same file. To
+work offline, seed the cache by copying a file into it named by its sha256.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import urllib.request
+from pathlib import Path
+
+CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT = 60
+
+
+def default_artifact_dir() -> Path:
+    """
+    Get the default directory to cache artifacts in.
+
+    Returns:
+        Path: Directory for artifacts
+
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(cache_home) / "home-server" / "artifacts"
+
+
+def sha256_file(path: Path) -> str:
+    """
+    Get the sha256 of a file.
+
+    Args:
+        path (Path): Path to the file
+
+    Returns:
+        str: Hex digest of the file
+
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """Fetch artifacts once and keep them by their sha256."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Build an ArtifactCache instance.
+
+        Args:
+            path (Path): Directory to cache artifacts in
+
+        """
+        self.path = path
+
+    def get(self, url: str, sha256: str) -> Path:
+        """
+        Get the path to an artifact, downloading it if it isn't cached.
+
+        Args:
+            url (str): URL to download the artifact from
+            sha256 (str): Expected sha256 of the artifact
+
+        Raises:
+            ValueError: Raised if the artifact can't be downloaded or doesn't
+                match its sha256
+
+        Returns:
+            Path: Path to the cached artifact
+
+        """
+        sha256 = sha256.lower()
+        path = self.path / sha256
+        if path.exists():
+            if sha256_file(path) == sha256:
+                return path
+            # drop corrupt artifacts so they're fetched again
+            path.unlink()
+
+        if not url.startswith(("https://", "http://")):
+            err_msg = f"Cannot download artifact from {url}"
+            raise ValueError(err_msg)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.path, delete=False) as f:
+            tmp_path = Path(f.name)
+            try:
+                with urllib.request.urlopen(  # noqa: S310
+                    url, timeout=DOWNLOAD_TIMEOUT
+                ) as response:
+                    while chunk := response.read(CHUNK_SIZE):
+                        f.write(chunk)
+            except OSError as e:
+                tmp_path.unlink()
+                err_msg = (
+                    f"Cannot download artifact from {url}: {e}. To run "
+                    f"offline, copy it to {path}"
+                )
+                raise ValueError(err_msg) from e
+
+        actual = sha256_file(tmp_path)
+        if actual != sha256:
+            tmp_path.unlink()
+            err_msg = (
+                f"Artifact from {url} has sha256 {actual}, expected {sha256}"
+            )
+            raise ValueError(err_msg)
+        tmp_path.replace(path)
+        return path
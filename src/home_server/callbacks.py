@@ -0,0 +1,103 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Define common callbacks to hook into pyinfra's execution of ops."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, override
+
+from pyinfra.api.state import BaseStateCallback
+
+if TYPE_CHECKING:
+    from pyinfra.api import Host, State
+    from pyinfra.api.operation import OperationMeta
+
+
+class OpCompleteCallback(BaseStateCallback):
+    """
+    Notify subclasses when an op completes on a host.
+
+    pyinfra triggers its success and error callbacks before it fills in the
+    op's OperationMeta so its output and changes aren't available yet. Instead,
+    an op is reported complete when the next op starts on the same host or when
+    flush is called at the end of the run.
+    """
+
+    def __init__(self) -> None:
+        """Build an OpCompleteCallback instance."""
+        # host name -> (op hash, start time, end time)
+        self._last_op: dict[str, tuple[str, float, float | None]] = {}
+
+    def operation_host_complete(
+        self,
+        state: State,
+        host: Host,
+        op_meta: OperationMeta,
+        duration: float,
+    ) -> None:
+        """
+        Handle an op that has completed on a host.
+
+        Args:
+            state (State): State running the op
+            host (Host): Host the op ran on
+            op_meta (OperationMeta): Completed metadata of the op
+            duration (float): Seconds the op took to run on the host
+
+        """
+
+    def flush(self, state: State) -> None:
+        """
+        Report the last op on each host as complete.
+
+        Args:
+            state (State): State that ran the ops
+
+        """
+        for host in state.inventory:
+            self._complete(state, host)
+
+    @override
+    def operation_host_start(  # type: ignore[override]
+        self, state: State, host: Host, op_hash: str
+    ) -> None:
+        self._complete(state, host)
+        self._last_op[host.name] = (op_hash, time.perf_counter(), None)
+
+    @override
+    def operation_host_success(  # type: ignore[override]
+        self, state: State, host: Host, op_hash: str, retry_count: int = 0
+    ) -> None:
+        self._stop(host)
+
+    @override
+    def operation_host_error(  # type: ignore[override]
+        self,
+        state: State,
+        host: Host,
+        op_hash: str,
+        retry_count: int = 0,
+        max_retries: int = 0,
+    ) -> None:
+        self._stop(host)
+
+    def _stop(self, host: Host) -> None:
+        if host.name in self._last_op:
+            op_hash, start, _ = self._last_op[host.name]
+            self._last_op[host.name] = (op_hash, start, time.perf_counter())
+
+    def _complete(self, state: State, host: Host) -> None:
+        last_op = self._last_op.pop(host.name, None)
+        if last_op is None:
+            return
+        op_hash, start, end = last_op
+        op_data = state.ops[host].get(op_hash)
+        # skipped ops have no data for the host
+        if op_data is None or not op_data.operation_meta.is_complete():
+            return
+        duration = (end or time.perf_counter()) - start
+        self.operation_host_complete(
+            state, host, op_data.operation_meta, duration
+        )
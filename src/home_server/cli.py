@@ -0,0 +1,148 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Define CLI arguments shared by subcommands.
+
+This module is imported whenever arguments are parsed so it must not import
+pyinfra or the checks.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+
+def add_connect_arguments(parser: ArgumentParser) -> None:
+    """
+    Add the arguments that control connecting to hosts to a parser.
+
+    Args:
+        parser (ArgumentParser): Parser to add the arguments to
+
+    """
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=0,
+        help=(
+            "Number of hosts to connect to and run operations on at once. "
+            "Defaults to a value based on the CPU count and inventory size."
+        ),
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=int,
+        default=10,
+        help="Seconds to wait when connecting to a host. Defaults to '10'.",
+    )
+
+
+def add_run_arguments(parser: ArgumentParser) -> None:
+    """
+    Add the arguments that control how operations are run to a parser.
+
+    Args:
+        parser (ArgumentParser): Parser to add the arguments to
+
+    """
+    add_connect_arguments(parser)
+    parser.add_argument(
+        "--no-wait",
+        action="store_true",
+        help=(
+            "Run all operations on each host without waiting for other hosts "
+            "to finish each operation"
+        ),
+    )
+    parser.add_argument(
+        "--strategy",
+        choices=["parallel", "rolling"],
+        default="parallel",
+        help=(
+            "How to run operations across hosts. 'parallel' runs on all hosts "
+            "at once. 'rolling' runs on the canary hosts first and then on the "
+            "rest in batches, stopping if too many fail. Defaults to "
+            "'parallel'."
+        ),
+    )
+    parser.add_argument(
+        "--canary",
+        type=int,
+        default=1,
+        help=(
+            "Number of hosts that must all succeed before the rest of a "
+            "rolling run starts. Defaults to '1'."
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help=(
+            "Number of hosts to run on at once after the canaries in a rolling "
+            "run. A host starts as soon as another finishes. Defaults to "
+            "--parallel or all hosts."
+        ),
+    )
+    parser.add_argument(
+        "--max-failures",
+        type=int,
+        default=0,
+        help=(
+            "Number of hosts that may fail after the canaries before a rolling "
+            "run stops starting hosts. Defaults to '0'."
+        ),
+    )
+    parser.add_argument(
+        "--fact-cache-ttl",
+        type=float,
+        default=0,
+        help=(
+            "Reuse facts fetched from hosts in previous runs if they're newer "
+            "than this many seconds. Defaults to '0' which disables caching."
+        ),
+    )
+    parser.add_argument(
+        "--fact-cache-dir",
+        type=Path,
+        help=(
+            "Directory to cache facts in. Defaults to 'home-server/facts' in "
+            "the user's cache directory."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue the last run of this command on this inventory. Hosts "
+            "that completed are skipped and only the ops that didn't succeed "
+            "on the rest run again."
+        ),
+    )
+    parser.add_argument(
+        "--journal-dir",
+        type=Path,
+        help=(
+            "Directory to record the progress of runs in. Defaults to "
+            "'home-server/journals' in the user's state directory."
+        ),
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print the time spent connecting, planning and executing",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        help=(
+            "Write spans of connecting, fetching facts, planning and executing "
+            "on each host to this file in the Chrome trace format. Open it in "
+            "Perfetto or chrome://tracing to view it."
+        ),
+    )
@@ -10,6 +10,6 @@ class Preset(enum.StrEnum):
     PROXMOX_CONTAINER = "proxmox-container"
 
 
-from .main import configure_parser, main  # noqa: E402
+from .cli import configure_parser  # noqa: E402
 
-__all__ = ["configure_parser", "main"]
+__all__ = ["configure_parser"]
@@ -0,0 +1,74 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Define the home_server configure CLI.
+
+Parsing arguments shouldn't import pyinfra or the checks so they are only
+imported by main once the configure command runs.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from home_server.cli import add_run_arguments
+
+from . import Preset
+
+if TYPE_CHECKING:
+    import argparse
+    from argparse import ArgumentParser, _SubParsersAction
+
+
+def configure_parser(subparser: _SubParsersAction[ArgumentParser]) -> None:
+    """
+    Define the subparser for the configure command.
+
+    Args:
+        subparser (_SubParsersAction[ArgumentParser]): Parent parser
+
+    """
+    configure = subparser.add_parser(
+        "configure",
+        help="Configure the inventory hosts",
+    )
+    inventory_help = (
+        "Path to an inventory file, a directory of inventory files or "
+        "hostname/IP address to run commands on. Use @local to run on this "
+        "host."
+    )
+    configure.add_argument(
+        "inventory",
+        type=Path,
+        help=inventory_help,
+    )
+    configure.add_argument(
+        "--preset",
+        choices=[x.value for x in Preset],
+        type=Preset,
+        help="Presets to set a variety of options in one convenient flag",
+    )
+    configure.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Don't execute operations on target hosts",
+    )
+    configure.add_argument(
+        "--artifact-dir",
+        type=Path,
+        help=(
+            "Directory to cache downloaded artifacts in. Defaults to "
+            "'home-server/artifacts' in the user's cache directory."
+        ),
+    )
+    add_run_arguments(configure)
+    configure.set_defaults(func=main)
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for home_server configure CLI."""
+    from .main import main as configure  # noqa: PLC0415
+
+    configure(args)
@@ -10,56 +10,25 @@ preset.
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import TYPE_CHECKING
 
-from pyinfra.api import Config, State
-from pyinfra.api.connect import connect_all
-from pyinfra.api.operations import run_ops
 from pyinfra_cli.prints import print_meta
 
+from home_server.artifacts import ArtifactCache, default_artifact_dir
 from home_server.inventory import make_inventory
+from home_server.journal import make_journal
+from home_server.run import (
+    execute,
+    finish,
+    make_config,
+    make_state,
+    make_timer,
+)
 
 from . import Preset, proxmox_container, proxmox_host, proxmox_vm
 
 if TYPE_CHECKING:
     import argparse
-    from argparse import ArgumentParser, _SubParsersAction
-
-
-def configure_parser(subparser: _SubParsersAction[ArgumentParser]) -> None:
-    """
-    Define the subparser for the configure command.
-
-    Args:
-        subparser (_SubParsersAction[ArgumentParser]): Parent parser
-
-    """
-    configure = subparser.add_parser(
-        "configure",
-        help="Configure the inventory hosts",
-    )
-    inventory_help = (
-        "Path to an inventory file or hostname/IP address to run"
-        "commands on. Use @local to run on this host."
-    )
-    configure.add_argument(
-        "inventory",
-        type=Path,
-        help=inventory_help,
-    )
-    configure.add_argument(
-        "--preset",
-        choices=[x.value for x in Preset],
-        type=Preset,
-        help="Presets to set a variety of options in one convenient flag",
-    )
-    configure.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Don't execute operations on target hosts",
-    )
-    configure.set_defaults(func=main)
 
 
 def set_presets(args: argparse.Namespace) -> None:
@@ -75,26 +44,26 @@ def main(args: argparse.Namespace) -> None:
     """Entry point for home_server configure CLI."""
     set_presets(args)
 
-    inventory = make_inventory(args.inventory)
-
-    config = Config()
-    state = State(inventory, config)
-
-    connect_all(state)
+    inventory = make_inventory(args.inventory, make_config(args))
+    timer = make_timer(args)
+    journal = make_journal(args, args.preset)
+    state = make_state(inventory, args, timer, journal)
 
     print_meta(state)
-
-    if args.preset == Preset.PROXMOX_HOST:
-        proxmox_host.main(state)
-    elif args.preset == Preset.PROXMOX_VM:
-        proxmox_vm.main(state)
-    elif args.preset == Preset.PROXMOX_CONTAINER:
-        proxmox_container.main(state)
-    else:
-        err_msg = f"Unexpected configure preset {args.preset} passed."
-        raise ValueError(err_msg)
-
-    if args.dry_run:
-        return
-
-    run_ops(state)
+    artifacts = ArtifactCache(args.artifact_dir or default_artifact_dir())
+
+    with timer.phase("plan"):
+        if args.preset == Preset.PROXMOX_HOST:
+            proxmox_host.main(state)
+        elif args.preset == Preset.PROXMOX_VM:
+            proxmox_vm.main(state, artifacts)
+        elif args.preset == Preset.PROXMOX_CONTAINER:
+            proxmox_container.main(state)
+        else:
+            err_msg = f"Unexpected configure preset {args.preset} passed."
+            raise ValueError(err_msg)
+
+    if not args.dry_run:
+        execute(state, args, timer)
+
+    finish(state, args, timer)
@@ -7,15 +7,21 @@ Configure the Proxmox vm.
 This file defines how to configure the Proxmox VM after creation.
 """
 
+from pathlib import Path
+
 from pyinfra.api import State
 from pyinfra.api.operation import add_op
 from pyinfra.operations import server
 
+from home_server.operations import packages
+
 
 def main(state: State) -> None:
     """Entrypoint for configuring the Proxmox container."""
+    add_op(state, packages.proxy)
+    add_op(state, packages.transaction, ["samba", "acl"])
     add_op(
         state,
         server.script,
-        "src/home_server/configure/samba.sh",
+        str(Path(__file__).with_name("samba.sh")),
     )
@@ -7,38 +7,104 @@ Configure the Proxmox host.
 This file defines how to configure the Proxmox host after installation.
 """
 
+from pathlib import Path
+
 from pyinfra.api import State
 from pyinfra.api.operation import add_op
 from pyinfra.operations import apt, server
 
+from home_server.operations import packages, proxmox, qm
+
+CLOUD_IMAGE_URL = "https://cloud.debian.org/images/cloud/trixie/latest"
+CLOUD_IMAGE = "debian-13-generic-amd64.qcow2"
+STORAGE = "local-lvm"
+TEMPLATE_VM_ID = 8000
+VM_ID = 100
+# seconds before the package lists are updated again
+APT_CACHE_TIME = 3600
+VENDOR_CONFIG = "debian-13.yaml"
+# install the guest agent on first boot. Taken from
+# https://forum.proxmox.com/threads/combining-custom-cloud-init-with-auto-generated.59008/page-3#post-428772
+VENDOR_CONFIG_CONTENT = {
+    # for Proxmox, root login is needed
+    "disable_root": False,
+    "runcmd": [
+        "apt-get update",
+        "apt-get install -y qemu-guest-agent",
+        "reboot",
+    ],
+}
+
 
 def main(state: State) -> None:
     """Entrypoint for configuring the Proxmox host."""
     add_op(
         state,
         server.script,
-        "src/home_server/configure/install_pve.sh",
+        str(Path(__file__).with_name("install_pve.sh")),
     )
 
+    add_op(state, packages.proxy)
+    add_op(state, proxmox.apt_sources)
+    # dist_upgrade only upgrades if simulating it shows there are changes
+    add_op(state, apt.update, cache_time=APT_CACHE_TIME)
+    add_op(state, apt.dist_upgrade)
     add_op(
-        state, apt.packages, ["proxmox-ve", "postfix", "open-iscsi", "chrony"]
+        state,
+        proxmox.host_packages,
+        ["proxmox-ve", "postfix", "open-iscsi", "chrony"],
+        ["os-prober"],
     )
-    add_op(state, apt.packages, ["os-prober"], present=False)
+
+    add_op(state, proxmox.no_subscription_nag)
+    add_op(state, proxmox.disable_ha)
 
     add_op(
-        state,
-        server.script,
-        "src/home_server/configure/proxmox_community_scripts/microcode.sh",
+        state, proxmox.cloudinit_snippet, VENDOR_CONFIG, VENDOR_CONFIG_CONTENT
     )
-
     add_op(
         state,
-        server.script,
-        "src/home_server/configure/proxmox_community_scripts/post-pve-install.sh",
+        qm.cloudinit_template,
+        TEMPLATE_VM_ID,
+        "debian-13-template",
+        f"{CLOUD_IMAGE_URL}/{CLOUD_IMAGE}",
+        f"{CLOUD_IMAGE_URL}/SHA512SUMS",
+        storage=STORAGE,
+        disk_options="cache=writethrough,iothread=1,ssd=1,discard=on",
+        memory=2048,
+        balloon=768,
+        cpu="host",
+        cores=2,
+        numa=1,
+        bios="ovmf",
+        machine="q35",
+        net0="virtio,bridge=vmbr0",
+        agent="enabled=1,fstrim_cloned_disks=1",
+        ostype="l26",
+        scsihw="virtio-scsi-single",
+        efidisk0=f"{STORAGE}:0,efitype=4m,pre-enrolled-keys=1,size=1M",
+        tags="template,debian-template,debian,debian-13",
+        scsi1=f"{STORAGE}:cloudinit",
+        rng0="source=/dev/urandom",
+        ciuser="varunsh",
+        cipassword="insecure",
+        boot="order=scsi0",
+        tablet=0,
+        ipconfig0="ip=dhcp,ip6=dhcp",
+        sshkeys="/root/.ssh/authorized_keys",
+        cicustom=f"vendor=local:snippets/{VENDOR_CONFIG}",
+        description="Some notes",
     )
-
     add_op(
         state,
-        server.script,
-        "src/home_server/configure/cloudinit_debian_13.sh",
+        qm.clone,
+        TEMPLATE_VM_ID,
+        VM_ID,
+        "main",
+        resize={"scsi0": "50G"},
+        start=True,
+        tags="debian,debian-13",
+        cores=4,
+        memory=8192,
+        balloon=2048,
     )
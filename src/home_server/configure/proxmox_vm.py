@@ -7,24 +7,29 @@ Configure the Proxmox vm.
 This file defines how to configure the Proxmox VM after creation.
 """
 
-import tempfile
-
 from pyinfra.api import State
 from pyinfra.api.operation import add_op
 from pyinfra.operations import files, server
 
+from home_server.artifacts import ArtifactCache
+from home_server.operations import packages
 
-def main(state: State) -> None:
-    """Entrypoint for configuring the Proxmox VM."""
-    with tempfile.NamedTemporaryFile() as f:
-        add_op(
-            state,
-            files.download,
-            # https://github.com/OpenMediaVault-Plugin-Developers/installScript/blob/master/install
-            "https://github.com/OpenMediaVault-Plugin-Developers/installScript/raw/master/install",
-            f.name,
-            mode="777",
-            sha256sum="c994d336a3fd66f463b2fc5cda18aa8619baf639448c6545c92e2012f5fb9020",
-        )
+# https://github.com/OpenMediaVault-Plugin-Developers/installScript/blob/master/install
+OMV_INSTALL_URL = "https://github.com/OpenMediaVault-Plugin-Developers/installScript/raw/master/install"
+OMV_INSTALL_SHA256 = (
+    "c994d336a3fd66f463b2fc5cda18aa8619baf639448c6545c92e2012f5fb9020"
+)
+OMV_INSTALL_DEST = "/usr/local/sbin/omv-install"
 
-        add_op(state, server.shell, [f"{f.name} -r -f"])
+
+def main(state: State, artifacts: ArtifactCache) -> None:
+    """Entrypoint for configuring the Proxmox VM."""
+    add_op(state, packages.proxy)
+    add_op(
+        state,
+        files.put,
+        str(artifacts.get(OMV_INSTALL_URL, OMV_INSTALL_SHA256)),
+        OMV_INSTALL_DEST,
+        mode="755",
+    )
+    add_op(state, server.shell, [f"{OMV_INSTALL_DEST} -r -f"])
@@ -10,9 +10,6 @@ SAMBA_PASSWORD="changeme"
 groupadd -g "10000" "$SAMBA_GROUP" 2>/dev/null
 useradd -u "1000" -s /usr/sbin/nologin -M -G "$SAMBA_GROUP" "$SAMBA_USER" 2>/dev/null
 
-apt-get update
-apt-get install -y samba acl
-
 printf '%s\n%s\n' "$SAMBA_PASSWORD" "$SAMBA_PASSWORD" | smbpasswd -s -a "$SAMBA_USER"
 
 # Create share directories with correct ownership
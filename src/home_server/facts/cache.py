@@ -0,0 +1,275 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Persist host facts between runs.
+
+Facts are cached per host on disk and reused until they're older than the TTL.
+Any operation that executes commands on a host invalidates the host's cached
+facts since it may have changed their values. A host's cache file is removed
+before its first op runs and written again once the run finishes so a run that
+stops part way doesn't leave facts from before its changes behind.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+from home_server.callbacks import OpCompleteCallback
+from home_server.facts.util import connector_arguments
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from pyinfra.api import FactBase, Host, State
+    from pyinfra.api.operation import OperationMeta
+
+
+# connector arguments that change the user or environment a fact runs as, so a
+# fact can have different values with them. Passwords and env aren't included
+# so they're never written to the cache.
+IDENTITY_ARGUMENTS = frozenset(
+    {
+        "_sudo",
+        "_sudo_user",
+        "_use_sudo_login",
+        "_su_user",
+        "_use_su_login",
+        "_su_shell",
+        "_doas",
+        "_doas_user",
+        "_dzdo",
+        "_dzdo_user",
+        "_shell_executable",
+        "_chdir",
+    }
+)
+
+
+def cache_key(
+    host: Host,
+    cls: type[FactBase[Any]],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str:
+    """
+    Get the key of a fact in a host's cache.
+
+    Args:
+        host (Host): Host the fact is fetched from
+        cls (type[FactBase[Any]]): Fact to get
+        args (tuple[Any, ...]): Positional arguments to the fact
+        kwargs (dict[str, Any]): Keyword arguments to the fact, which may
+            include global arguments e.g. _sudo
+
+    Returns:
+        str: Key of the fact with the arguments it's fetched with
+
+    """
+    arguments = connector_arguments(host.state, host)
+    arguments.update(
+        (key, value) for key, value in kwargs.items() if key.startswith("_")
+    )
+    identity = sorted(
+        (key, value)
+        for key, value in arguments.items()
+        if key in IDENTITY_ARGUMENTS and value
+    )
+    fact_kwargs = sorted(
+        (key, value) for key, value in kwargs.items() if not key.startswith("_")
+    )
+    return f"{cls.name}:{args!r}:{fact_kwargs!r}:{identity!r}"
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the default directory to store cached facts in.
+
+    Returns:
+        Path: Directory for cached facts
+
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(cache_home) / "home-server" / "facts"
+
+
+class FactCache(OpCompleteCallback):
+    """Cache the facts fetched from hosts on disk with a TTL."""
+
+    def __init__(self, cache_dir: Path, ttl: float) -> None:
+        """
+        Build a FactCache instance.
+
+        Args:
+            cache_dir (Path): Directory to store cached facts in
+            ttl (float): Seconds a cached fact stays valid for
+
+        """
+        super().__init__()
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        # host name -> fact key -> (time fetched, value)
+        self.facts: dict[str, dict[str, tuple[float, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+        # hosts whose cache file has been removed since ops started on them
+        self._removed: set[str] = set()
+
+    def install(self, state: State) -> None:
+        """
+        Route fact lookups for all hosts in the state through this cache.
+
+        Args:
+            state (State): State to install the cache in
+
+        """
+        state.add_callback_handler(self)
+        for host in state.inventory:
+            host.get_fact = functools.partial(  # type: ignore[method-assign]
+                self.get_fact, host, host.get_fact
+            )
+
+    def get_fact[T](
+        self,
+        host: Host,
+        fetch: Callable[..., T],
+        cls: type[FactBase[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Get a fact from the cache, fetching it from the host if needed.
+
+        Args:
+            host (Host): Host to get the fact for
+            fetch (Callable[..., T]): Uncached get_fact function of the host
+            cls (type[FactBase[T]]): Fact to get
+            args (Any): Positional arguments to the fact
+            kwargs (Any): Keyword arguments to the fact
+
+        Returns:
+            T: Value of the fact
+
+        """
+        key = cache_key(host, cls, args, kwargs)
+        found, cached = self.lookup(host.name, key)
+        if found:
+            self.hits += 1
+            cached_value: T = cached
+            return cached_value
+
+        self.misses += 1
+        value = fetch(cls, *args, **kwargs)
+        # failed fetches return the fact's default so don't keep them
+        if host not in host.state.failed_hosts:
+            self.store(host.name, key, value)
+        return value
+
+    def lookup(self, host_name: str, key: str) -> tuple[bool, Any]:
+        """
+        Get a fact from the cache if it's still valid.
+
+        Args:
+            host_name (str): Name of the host
+            key (str): Key of the fact from cache_key
+
+        Returns:
+            tuple[bool, Any]: Whether the fact was found and its value
+
+        """
+        cached = self._load(host_name).get(key)
+        if cached is None or time.time() - cached[0] >= self.ttl:
+            return False, None
+        return True, cached[1]
+
+    def store(self, host_name: str, key: str, value: Any) -> None:  # noqa: ANN401
+        """
+        Add a fact fetched from a host to the cache.
+
+        Args:
+            host_name (str): Name of the host
+            key (str): Key of the fact from cache_key
+            value (Any): Value of the fact
+
+        """
+        self._load(host_name)[key] = (time.time(), value)
+
+    def invalidate(self, host_name: str) -> None:
+        """
+        Drop all cached facts for a host.
+
+        Args:
+            host_name (str): Name of the host
+
+        """
+        self._load(host_name).clear()
+
+    @override
+    def operation_host_start(  # type: ignore[override]
+        self, state: State, host: Host, op_hash: str
+    ) -> None:
+        super().operation_host_start(state, host, op_hash)
+        if host.name not in self._removed:
+            # kept in memory to be written back by save
+            self._load(host.name)
+            self._path(host.name).unlink(missing_ok=True)
+            self._removed.add(host.name)
+
+    @override
+    def operation_host_complete(
+        self,
+        state: State,
+        host: Host,
+        op_meta: OperationMeta,
+        duration: float,
+    ) -> None:
+        if op_meta.executed:
+            self.invalidate(host.name)
+
+    def save(self, state: State) -> None:
+        """
+        Write the cached facts to disk.
+
+        Args:
+            state (State): State the cache was installed in
+
+        """
+        self.flush(state)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for host_name, host_facts in self.facts.items():
+            now = time.time()
+            valid = {
+                key: cached
+                for key, cached in host_facts.items()
+                if now - cached[0] < self.ttl
+            }
+            path = self._path(host_name)
+            with path.open("wb") as f:
+                pickle.dump(valid, f)
+            path.chmod(0o600)
+
+    def _path(self, host_name: str) -> Path:
+        return self.cache_dir / f"{host_name.replace('/', '_')}.pickle"
+
+    def _load(self, host_name: str) -> dict[str, tuple[float, Any]]:
+        if host_name in self.facts:
+            return self.facts[host_name]
+
+        host_facts: dict[str, tuple[float, Any]] = {}
+        path = self._path(host_name)
+        if path.exists():
+            try:
+                with path.open("rb") as f:
+                    # the cache is only written by this user to their own cache
+                    host_facts = pickle.load(f)  # noqa: S301
+            except (OSError, pickle.UnpicklingError, EOFError):
+                host_facts = {}
+        self.facts[host_name] = host_facts
+        return host_facts
@@ -0,0 +1,65 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Define facts that cheaply summarize the state of a host."""
+
+from __future__ import annotations
+
+from typing import override
+
+from pyinfra.api import FactBase
+
+from home_server.facts.kernel import FIND_FS_MODULES
+from home_server.facts.util import SECTION_PREFIX, split_sections
+
+# fingerprint components mapped to the command whose output they hash
+COMPONENTS: dict[str, str] = {
+    "kernel_release": "uname -r",
+    "kernel_modules": "awk '{print $1}' /proc/modules | sort",
+    # the blacklist and install lines from every modprobe.d directory
+    "modprobe_config": (
+        "modprobe --showconfig 2>/dev/null"
+        " | grep -Ei '^[[:space:]]*(blacklist|install)[[:space:]]+'"
+    ),
+    "mounts": "awk '{print $3}' /proc/mounts | sort -u",
+    # the filesystem modules on disk that FilesystemModules looks for
+    "module_files": f"{FIND_FS_MODULES} 2>/dev/null | sort",
+}
+
+
+class Fingerprint(FactBase):  # type: ignore[misc]
+    """
+    Return a hash of each part of the host's state that checks depend on.
+
+    All the components in COMPONENTS are hashed on the host in one command so
+    only the hashes are transferred. Components that couldn't be hashed are
+    left out.
+
+    .. code:: python
+
+        {
+            component: sha256, ...
+        }
+    """
+
+    @override
+    def command(self) -> str:
+        commands = []
+        for component, command in COMPONENTS.items():
+            commands.append(f"echo '{SECTION_PREFIX}{component}'")
+            commands.append(f"{{ {command}; }} | sha256sum")
+        return "; ".join(commands)
+
+    @override
+    def requires_command(self) -> str:
+        return "sha256sum"
+
+    default = dict
+
+    @override
+    def process(self, output: list[str]) -> dict[str, str]:
+        fingerprint = {}
+        for component, lines in split_sections(output).items():
+            if component in COMPONENTS and lines and lines[0].split():
+                fingerprint[component] = lines[0].split()[0]
+        return fingerprint
@@ -0,0 +1,31 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Define facts about the host's hardware."""
+
+from __future__ import annotations
+
+from typing import override
+
+from pyinfra.api import FactBase
+
+
+class CpuVendor(FactBase):  # type: ignore[misc]
+    """
+    Return the vendor ID of the host's CPU e.g. GenuineIntel or AuthenticAMD.
+
+    The vendor is read from /proc/cpuinfo so it doesn't depend on lscpu or on
+    the version of pyinfra.
+    """
+
+    @override
+    def command(self) -> str:
+        return "grep -m 1 '^vendor_id' /proc/cpuinfo || true"
+
+    @override
+    def process(self, output: list[str]) -> str | None:
+        for line in output:
+            _, sep, vendor = line.partition(":")
+            if sep and vendor.strip():
+                return vendor.strip()
+        return None
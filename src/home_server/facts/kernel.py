@@ -0,0 +1,99 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Define facts about the Linux kernel."""
+
+from __future__ import annotations
+
+import re
+from pathlib import PurePosixPath
+from typing import override
+
+from pyinfra.api import FactBase
+
+from home_server.facts.util import SECTION_PREFIX, split_sections
+
+# directory of the installed kernels' modules
+MODULES_DIR = "$(readlink -e /usr/lib/modules/ || readlink -e /lib/modules/)"
+# finds the filesystem modules of every installed kernel
+FIND_FS_MODULES = (
+    f'find -L "{MODULES_DIR}"/*/kernel/fs/ -mindepth 2 -maxdepth 2 -type f'
+)
+
+
+class FilesystemModules(FactBase):  # type: ignore[misc]
+    """
+    Return the filesystem kernel modules that are available for use.
+
+    This implements the audit for CIS 1.1.1.11. The mounted filesystems, loaded
+    modules, modprobe config and the filesystem modules on disk are collected in
+    one command and compared locally.
+
+    .. code:: python
+
+        {
+            "mounted": [module, ...],
+            "loaded": [module, ...],
+            "loadable": [module, ...],
+        }
+    """
+
+    @override
+    def command(self) -> str:
+        return "; ".join(
+            [
+                f"echo '{SECTION_PREFIX}mounted'",
+                "findmnt -Dkerno fstype | sort -u",
+                f"echo '{SECTION_PREFIX}loaded'",
+                "lsmod | awk '{print $1}'",
+                f"echo '{SECTION_PREFIX}config'",
+                (
+                    "modprobe --showconfig | grep -Ei"
+                    " '^[[:space:]]*(blacklist|install)[[:space:]]+'"
+                ),
+                f"echo '{SECTION_PREFIX}available'",
+                f"{FIND_FS_MODULES} || true",
+            ]
+        )
+
+    @override
+    def requires_command(self) -> str:
+        return "modprobe"
+
+    @staticmethod
+    @override
+    def default() -> dict[str, list[str]]:
+        return {"mounted": [], "loaded": [], "loadable": []}
+
+    @override
+    def process(self, output: list[str]) -> dict[str, list[str]]:
+        sections = split_sections(output)
+        mounted = " ".join(sections.get("mounted", []))
+        loaded = " ".join(sections.get("loaded", []))
+        config = " ".join(sections.get("config", []))
+
+        available = set()
+        for path_str in sections.get("available", []):
+            path = PurePosixPath(path_str)
+            if path.parent.name != "nls":
+                available.add(path.name.split(".")[0])
+
+        result = self.default()
+        for module in sorted(available):
+            name = re.escape(module)
+            if re.search(rf"\b{name}\b", mounted, re.IGNORECASE):
+                result["mounted"].append(module)
+            elif re.search(rf"\b{name}\b", loaded, re.IGNORECASE):
+                result["loaded"].append(module)
+            else:
+                # modprobe config normalizes dashes in module names
+                name = re.escape(module.replace("-", "_"))
+                installed = re.search(
+                    rf"\binstall\s+{name}\s+\S+", config, re.IGNORECASE
+                )
+                blacklisted = re.search(
+                    rf"\bblacklist\s+{name}\b", config, re.IGNORECASE
+                )
+                if not installed or not blacklisted:
+                    result["loadable"].append(module)
+        return result
@@ -0,0 +1,285 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Fetch the facts a run will need from each host in one command.
+
+Operations get facts one at a time as they're planned so each fact is a round
+trip to the host. Facts that are known to be needed ahead of time are instead
+run together in one command per host with their output split into sections.
+The prefetched values are used until an operation executes on the host, after
+which facts are fetched from the host again. If a FactCache is installed, facts
+it has are taken from it instead and prefetched facts are added to it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import inspect
+from typing import TYPE_CHECKING, override
+
+from pyinfra.api import StringCommand
+from pyinfra.api.exceptions import FactProcessError
+from pyinfra.context import ctx_host
+
+from home_server.callbacks import OpCompleteCallback
+from home_server.facts.cache import FactCache, cache_key
+from home_server.facts.util import (
+    connector_arguments,
+    join_hosts,
+    split_sections,
+)
+from home_server.trace import Tracer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from contextlib import AbstractContextManager
+    from typing import Any
+
+    from pyinfra.api import FactBase, Host, State
+    from pyinfra.api.operation import OperationMeta
+
+# a fact and the keyword arguments it's called with
+type FactRequest = tuple[type[FactBase[Any]], dict[str, Any]]
+
+# separates the output of each fact. Facts may use SECTION_PREFIX themselves.
+PREFETCH_PREFIX = "##home-server-prefetch:"
+# printed instead of a fact's output if its required command isn't installed
+MISSING_COMMAND = "##home-server-missing-command"
+
+
+def fact_key(
+    fact_cls: type[FactBase[Any]], args: Iterable[Any], kwargs: dict[str, Any]
+) -> str | None:
+    """
+    Get a key that identifies a fact with arguments however they're passed.
+
+    Args:
+        fact_cls (type[FactBase[Any]]): Fact to get
+        args (Iterable[Any]): Positional arguments to the fact
+        kwargs (dict[str, Any]): Keyword arguments to the fact
+
+    Returns:
+        str | None: Key of the fact or None if it has global arguments e.g.
+            _sudo that change how it runs
+
+    """
+    if any(key.startswith("_") for key in kwargs):
+        return None
+    try:
+        call_args = inspect.getcallargs(fact_cls().command, *args, **kwargs)
+    except TypeError:
+        return None
+    call_args.pop("self", None)
+    return f"{fact_cls.name}:{sorted(call_args.items())!r}"
+
+
+class FactPrefetch(OpCompleteCallback):
+    """Fetch facts from hosts in bulk to use in place of fetching each."""
+
+    def __init__(self) -> None:
+        """Build a FactPrefetch instance."""
+        super().__init__()
+        # host name -> fact key -> value
+        self.facts: dict[str, dict[str, Any]] = {}
+        # host name -> connector arguments the facts were fetched with
+        self.arguments: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.cache: FactCache | None = None
+        self.tracer: Tracer | None = None
+
+    def install(self, state: State) -> None:
+        """
+        Route fact lookups for all hosts in the state through the prefetch.
+
+        A FactCache or Tracer must be installed first for the prefetch to use
+        it.
+
+        Args:
+            state (State): State to install the prefetch in
+
+        """
+        for handler in state.callback_handlers:
+            if isinstance(handler, FactCache):
+                self.cache = handler
+            elif isinstance(handler, Tracer):
+                self.tracer = handler
+        state.add_callback_handler(self)
+        for host in state.inventory:
+            host.get_fact = functools.partial(  # type: ignore[method-assign]
+                self.get_fact, host, host.get_fact
+            )
+
+    def fetch(
+        self, state: State, hosts: list[Host], requests: Iterable[FactRequest]
+    ) -> None:
+        """
+        Fetch facts from hosts in parallel with one command per host.
+
+        Facts that can't be fetched this way, such as ones whose command failed,
+        are left to be fetched on their own when they're needed. Hosts that
+        can't be reached are failed.
+
+        Args:
+            state (State): State the hosts belong to
+            hosts (list[Host]): Hosts to fetch the facts from
+            requests (Iterable[FactRequest]): Facts to fetch
+
+        """
+        requests = list(requests)
+        if not requests:
+            return
+        join_hosts(
+            state,
+            {
+                host: state.fact_pool.spawn(
+                    self._fetch_host, state, host, requests
+                )
+                for host in hosts
+            },
+        )
+
+    def get_fact[T](
+        self,
+        host: Host,
+        fetch: Callable[..., T],
+        fact_cls: type[FactBase[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Get a prefetched fact, fetching it from the host if it wasn't.
+
+        Args:
+            host (Host): Host to get the fact for
+            fetch (Callable[..., T]): Function that gets the fact from the host
+            fact_cls (type[FactBase[T]]): Fact to get
+            args (Any): Positional arguments to the fact
+            kwargs (Any): Keyword arguments to the fact
+
+        Returns:
+            T: Value of the fact
+
+        """
+        host_facts = self.facts.get(host.name)
+        key = fact_key(fact_cls, args, kwargs)
+        if host_facts is None or key is None:
+            return fetch(fact_cls, *args, **kwargs)
+        # there are no arguments while the prefetch command is being built
+        arguments = self.arguments.get(host.name)
+        if key in host_facts and (
+            arguments is None
+            or arguments == connector_arguments(host.state, host)
+        ):
+            self.hits += 1
+            cached: T = host_facts[key]
+            return cached
+
+        value = fetch(fact_cls, *args, **kwargs)
+        # facts needed to build the prefetch command are kept as well
+        if arguments is None:
+            host_facts[key] = value
+        return value
+
+    @override
+    def operation_host_complete(
+        self,
+        state: State,
+        host: Host,
+        op_meta: OperationMeta,
+        duration: float,
+    ) -> None:
+        if op_meta.executed:
+            self.facts.pop(host.name, None)
+
+    def _fetch_host(
+        self, state: State, host: Host, requests: list[FactRequest]
+    ) -> None:
+        host_facts: dict[str, Any] = {}
+        self.facts[host.name] = host_facts
+        self.arguments.pop(host.name, None)
+        with ctx_host.use(host):
+            arguments = connector_arguments(state, host)
+            # section name -> fact, its key and its key in the cache
+            facts: dict[str, tuple[FactBase[Any], str, str]] = {}
+            keys = set()
+            commands = []
+            for fact_cls, kwargs in requests:
+                key = fact_key(fact_cls, (), kwargs)
+                if key is None or key in keys:
+                    continue
+                keys.add(key)
+                cached_key = cache_key(host, fact_cls, (), kwargs)
+                if self.cache is not None:
+                    found, value = self.cache.lookup(host.name, cached_key)
+                    if found:
+                        host_facts[key] = value
+                        continue
+                fact = fact_cls()
+                command = self._command(fact, kwargs)
+                if command is None:
+                    continue
+                section = str(len(facts))
+                facts[section] = (fact, key, cached_key)
+                commands.append(
+                    f"echo '{PREFETCH_PREFIX}{section}'; {command}; "
+                    f'echo "{PREFETCH_PREFIX}{section}:$?"'
+                )
+            if not commands:
+                self.arguments[host.name] = arguments
+                return
+            with self._span(host, len(commands)):
+                status, output = host.run_shell_command(
+                    StringCommand("; ".join(commands)),
+                    print_output=state.print_fact_output,
+                    print_input=state.print_fact_input,
+                    **arguments,
+                )
+        self.arguments[host.name] = arguments
+        if status:
+            self._process(host, facts, output.stdout_lines)
+
+    def _process(
+        self,
+        host: Host,
+        facts: dict[str, tuple[FactBase[Any], str, str]],
+        output: list[str],
+    ) -> None:
+        host_facts = self.facts[host.name]
+        sections = split_sections(output, PREFETCH_PREFIX)
+        for section, (fact, key, cached_key) in facts.items():
+            lines = sections.get(section)
+            # sections without an exit status were cut short
+            if lines is None or f"{section}:0" not in sections:
+                continue
+            if lines == [MISSING_COMMAND]:
+                continue
+            try:
+                value = fact.process(lines) if lines else fact.default()
+            except FactProcessError:
+                # left for the fact to report when it's fetched on its own
+                continue
+            host_facts[key] = value
+            if self.cache is not None:
+                self.cache.store(host.name, cached_key, value)
+
+    def _span(self, host: Host, count: int) -> AbstractContextManager[None]:
+        if self.tracer is None:
+            return contextlib.nullcontext()
+        return self.tracer.span("FactPrefetch", "fact", host.name, facts=count)
+
+    @staticmethod
+    def _command(fact: FactBase[Any], kwargs: dict[str, Any]) -> str | None:
+        command = fact.command(**kwargs)
+        requires_command = fact.requires_command(**kwargs)
+        if isinstance(command, StringCommand):
+            command = command.get_raw_value()
+        if not isinstance(command, str):
+            return None
+        if requires_command:
+            return (
+                f"if command -v {requires_command} >/dev/null 2>&1; "
+                f"then ( {command} ); else echo '{MISSING_COMMAND}'; fi"
+            )
+        return f"( {command} )"
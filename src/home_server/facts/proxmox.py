@@ -0,0 +1,71 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Define facts about Proxmox VE clusters."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, override
+
+from pyinfra.api import FactBase
+
+if TYPE_CHECKING:
+    from typing import Any
+
+# tags are stored separated by ; but , and spaces are also accepted
+TAG_SEPARATOR = re.compile(r"[;, ]+")
+
+
+class ClusterGuests(FactBase):  # type: ignore[misc]
+    """
+    Return the VMs and containers of the host's cluster.
+
+    Templates aren't included since they can't run.
+
+    .. code:: python
+
+        [
+            {
+                "id": VM_ID,
+                "name": name,
+                "node": node,
+                "type": "qemu" or "lxc",
+                "status": status,
+                "tags": [tag, ...],
+            },
+            ...
+        ]
+    """
+
+    @override
+    def command(self) -> str:
+        return "pvesh get /cluster/resources --type vm --output-format json"
+
+    @override
+    def requires_command(self) -> str:
+        return "pvesh"
+
+    default = list
+
+    @override
+    def process(self, output: list[str]) -> list[dict[str, Any]]:
+        guests = []
+        for resource in json.loads("\n".join(output) or "[]"):
+            if resource.get("template"):
+                continue
+            guests.append(
+                {
+                    "id": int(resource["vmid"]),
+                    "name": resource.get("name", str(resource["vmid"])),
+                    "node": resource["node"],
+                    "type": resource["type"],
+                    "status": resource.get("status", ""),
+                    "tags": sorted(
+                        set(TAG_SEPARATOR.split(resource.get("tags", "")))
+                        - {""}
+                    ),
+                }
+            )
+        return sorted(guests, key=lambda guest: guest["id"])
@@ -5,75 +5,197 @@
 
 from __future__ import annotations
 
+import json
+import re
 from typing import TYPE_CHECKING, override
 
-from pyinfra.api import FactBase
+from pyinfra.api import FactBase, ShortFactBase
+
+from home_server.facts.util import SECTION_PREFIX, split_sections
 
 if TYPE_CHECKING:
     from typing import Any
 
+# directory of the config files of the VMs on the local node
+CONFIG_DIR = "/etc/pve/qemu-server"
+DISK_KEY = re.compile(r"^(ide|sata|scsi|virtio|efidisk|tpmstate|unused)\d+$")
+NIC_KEY = re.compile(r"^net\d+$")
+NIC_MODELS = {"e1000", "e1000e", "rtl8139", "virtio", "vmxnet3"}
+MIB = 1024**2
+GIB = 1024**3
+
 
-class List(FactBase):  # type: ignore[misc]
+def parse_property_string(value: str, default_key: str) -> dict[str, str]:
     """
-    Return a list of VMs on the host.
+    Parse a Proxmox property string e.g. 'local:vm-100-disk-0,size=8G'.
+
+    Args:
+        value (str): Property string
+        default_key (str): Key to use for an item without one
+
+    Returns:
+        dict[str, str]: Keys mapped to their values
+
+    """
+    properties = {}
+    for item in value.split(","):
+        key, sep, item_value = item.partition("=")
+        if sep:
+            properties[key] = item_value
+        else:
+            properties[default_key] = key
+    return properties
+
+
+def parse_config(lines: list[str]) -> dict[str, str]:
+    """
+    Parse the current config of a VM from its config file.
+
+    Args:
+        lines (list[str]): Lines of the config file
+
+    Returns:
+        dict[str, str]: Config keys mapped to their values
+
+    """
+    config = {}
+    for line in lines:
+        # snapshots and pending changes follow the current config
+        if line.startswith("["):
+            break
+        key, sep, value = line.partition(":")
+        if sep and not key.startswith("#"):
+            config[key.strip()] = value.strip()
+    return config
+
+
+def parse_nic(value: str) -> dict[str, str]:
+    """
+    Parse the config of a network device.
+
+    Args:
+        value (str): Value of a netN config key
+
+    Returns:
+        dict[str, str]: Properties of the device with its model and MAC address
+
+    """
+    nic = parse_property_string(value, "model")
+    for model in NIC_MODELS & nic.keys():
+        nic["mac"] = nic.pop(model)
+        nic["model"] = model
+    return nic
+
+
+class Vms(FactBase):  # type: ignore[misc]
+    """
+    Return the VMs on the host with their status and config.
+
+    The status of all VMs is fetched as JSON from pvesh and the config files of
+    all VMs are read in the same command.
 
     .. code:: python
 
-        [
-            (VM_ID, name, status, memory [MB], boot_disk [GB], PID), ...
-        ]
+        {
+            VM_ID: {
+                "id": VM_ID,
+                "name": name,
+                "status": status,
+                "mem": memory [MB],
+                "boot_disk": boot_disk [GB],
+                "pid": PID or None,
+                "config": {key: value, ...},
+                "disks": {key: {"volume": volume, option: value, ...}, ...},
+                "nics": {key: {"model": model, "mac": MAC, ...}, ...},
+            },
+            ...
+        }
     """
 
     @override
     def command(self) -> str:
-        return "qm list"
+        return "; ".join(
+            [
+                f"echo '{SECTION_PREFIX}status'",
+                "pvesh get /nodes/localhost/qemu --output-format json",
+                f"for conf in {CONFIG_DIR}/*.conf",
+                (
+                    'do [ -e "$conf" ] || continue; '
+                    f'echo "{SECTION_PREFIX}config:$(basename "$conf" .conf)"; '
+                    'cat "$conf"; echo'
+                ),
+                "done",
+            ]
+        )
 
     @override
     def requires_command(self) -> str:
-        return "qm"
+        return "pvesh"
 
-    default = list
+    default = dict
 
     @override
-    def process(self, output: list[str]) -> list[dict[str, Any]]:
-        vms = []
-        header = ["id", "name", "status", "mem", "boot_disk", "pid"]
-        # first row is header so skip it
-        for row in output[1:]:
-            row_split = row.split()
-            if len(header) != len(row_split):
-                err_msg = "Unexpected output size of 'qm list'"
-                raise ValueError(err_msg)
-            vms.append(
-                {
-                    "id": int(row_split[0]),
-                    "name": row_split[1],
-                    "status": row_split[2],
-                    "mem": int(row_split[3]),
-                    "boot_disk": float(row_split[4]),
-                    "pid": int(row_split[5]),
-                }
-            )
-        return vms
-
-
-class VmIdExists(FactBase):  # type: ignore[misc]
+    def process(self, output: list[str]) -> dict[int, dict[str, Any]]:
+        sections = split_sections(output)
+        vms = {}
+        for status in json.loads("\n".join(sections.get("status", [])) or "[]"):
+            vm_id = int(status["vmid"])
+            config = parse_config(sections.get(f"config:{vm_id}", []))
+            pid = status.get("pid")
+            vms[vm_id] = {
+                "id": vm_id,
+                "name": status.get("name", config.get("name", "")),
+                "status": status.get("status", ""),
+                "mem": int(status.get("maxmem", 0)) // MIB,
+                "boot_disk": int(status.get("maxdisk", 0)) / GIB,
+                "pid": None if pid is None else int(pid),
+                "config": config,
+                "disks": {
+                    key: parse_property_string(value, "volume")
+                    for key, value in config.items()
+                    if DISK_KEY.match(key)
+                },
+                "nics": {
+                    key: parse_nic(value)
+                    for key, value in config.items()
+                    if NIC_KEY.match(key)
+                },
+            }
+        return dict(sorted(vms.items()))
+
+
+class List(ShortFactBase):  # type: ignore[misc]
     """
-    Returns True if a VM with the given ID exists.
+    Return a list of VMs on the host.
 
-    Usage: host.get_fact(VmIdExists, vm_id=8000)
+    .. code:: python
+
+        [
+            (VM_ID, name, status, memory [MB], boot_disk [GB], PID), ...
+        ]
     """
 
-    @override
-    def command(self, vm_id: int) -> str:
-        return (
-            "qm list | awk '{print $1}' | grep -q ^{vm_id}$ && echo 1 || echo 0"
-        )
+    fact = Vms
 
     @override
-    def requires_command(self) -> str:
-        return "qm"
+    def process_data(self, data: dict[int, dict[str, Any]]) -> list[Any]:
+        keys = ["id", "name", "status", "mem", "boot_disk"]
+        # qm list shows stopped VMs with a PID of 0
+        return [
+            {**{key: vm[key] for key in keys}, "pid": vm["pid"] or 0}
+            for vm in data.values()
+        ]
+
+
+class VmIds(ShortFactBase):  # type: ignore[misc]
+    """
+    Return the IDs of the VMs on the host.
+
+    Usage: 8000 in host.get_fact(VmIds)
+    """
+
+    fact = Vms
 
     @override
-    def process(self, output: list[str]) -> bool:
-        return bool(int(output[0].strip()))
+    def process_data(self, data: dict[int, dict[str, Any]]) -> frozenset[int]:
+        return frozenset(data)
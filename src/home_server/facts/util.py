@@ -0,0 +1,98 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Define helpers shared by facts."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import gevent
+from pyinfra import logger
+from pyinfra.api.arguments import CONNECTOR_ARGUMENT_KEYS, pop_global_arguments
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from pyinfra.api import Host, State
+
+# separates the output of each command in a fact that runs several at once
+SECTION_PREFIX = "##home-server:"
+
+
+def split_sections(
+    output: list[str], prefix: str = SECTION_PREFIX
+) -> dict[str, list[str]]:
+    """
+    Split the output of a fact into the sections marked by a prefix.
+
+    Args:
+        output (list[str]): Lines of output from the fact's command
+        prefix (str): Prefix of the lines that start sections. Defaults to
+            SECTION_PREFIX.
+
+    Returns:
+        dict[str, list[str]]: Section names mapped to their lines
+
+    """
+    sections: dict[str, list[str]] = {}
+    lines: list[str] = []
+    for line in output:
+        if line.startswith(prefix):
+            lines = sections.setdefault(line.removeprefix(prefix), [])
+        else:
+            lines.append(line)
+    return sections
+
+
+def join_hosts(
+    state: State, greenlets: dict[Host, gevent.Greenlet]
+) -> dict[Host, Any]:
+    """
+    Wait for greenlets that each get facts from a host and get their results.
+
+    Hosts whose greenlet raised are failed, as pyinfra does for facts that
+    can't be fetched, rather than stopping the other hosts.
+
+    Args:
+        state (State): State the hosts belong to
+        greenlets (dict[Host, gevent.Greenlet]): Hosts mapped to the greenlet
+            working on them
+
+    Returns:
+        dict[Host, Any]: Hosts whose greenlet succeeded mapped to its result
+
+    """
+    gevent.joinall(list(greenlets.values()))
+    results = {}
+    failed = set()
+    for host, greenlet in greenlets.items():
+        if greenlet.successful():
+            results[host] = greenlet.value
+        else:
+            logger.error(f"{host.print_prefix}{greenlet.exception}")
+            failed.add(host)
+    state.fail_hosts(failed)
+    return results
+
+
+def connector_arguments(state: State, host: Host) -> dict[str, Any]:
+    """
+    Get the arguments that control how a fact's command runs on a host.
+
+    Args:
+        state (State): State the host belongs to
+        host (Host): Host to run the command on
+
+    Returns:
+        dict[str, Any]: Arguments to pass to the host's connector
+
+    """
+    arguments = host.current_op_global_arguments
+    if arguments is None:
+        arguments, _ = pop_global_arguments(state, host, {})
+    return {
+        key: value
+        for key, value in arguments.items()
+        if key in CONNECTOR_ARGUMENT_KEYS
+    }
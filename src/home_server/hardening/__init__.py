@@ -16,6 +16,6 @@ class Preset(enum.StrEnum):
     AZURE = "azure"
 
 
-from .main import configure_parser, main  # noqa: E402
+from .cli import configure_parser  # noqa: E402
 
-__all__ = ["configure_parser", "main"]
+__all__ = ["configure_parser"]
@@ -0,0 +1,196 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Run audits on each host on its own and report results as they finish.
+
+Running ops across an inventory waits for every host to finish each op so one
+slow host holds back the results of all the others. Audits don't depend on
+each other so instead each host plans and runs all of its audits in its own
+greenlet, with a limit on how many hosts are audited at once. Each result is
+reported as soon as the audit finishes on the host. A host that takes longer
+than the timeout has the audits it didn't finish reported as timed out.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING
+
+import gevent
+from gevent.pool import Pool
+from pyinfra.api.exceptions import PyinfraError
+from pyinfra.api.operations import run_host_op
+from pyinfra.context import ctx_host, ctx_state
+
+from home_server.facts.prefetch import FactPrefetch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pyinfra.api import Host, State
+
+    from home_server.trace import Tracer
+
+    from .checks import Check, CheckMeta
+
+
+class AuditResult:
+    """Result of an audit on one host."""
+
+    def __init__(
+        self,
+        host_name: str,
+        check_name: str,
+        status: str,
+        duration: float,
+        meta: CheckMeta | None = None,
+    ) -> None:
+        """
+        Build an AuditResult instance.
+
+        Args:
+            host_name (str): Host the audit ran on
+            check_name (str): Name of the audit's check
+            status (str): One of 'success', 'error' or 'timeout'
+            duration (float): Seconds the audit took on the host
+            meta (CheckMeta | None): Metadata of the check if it finished
+
+        """
+        self.host_name = host_name
+        self.check_name = check_name
+        self.status = status
+        self.duration = duration
+        self.meta = meta
+
+    def print(self) -> None:
+        """Print the result."""
+        print(f"{self.host_name} {self.check_name}: {self.status}")
+        if self.meta is None:
+            return
+        if self.host_name in self.meta.facts:
+            print(
+                json.dumps(
+                    self.meta.facts[self.host_name], indent=2, default=str
+                )
+            )
+        for op_meta in self.meta.op_metas.get(self.host_name, []):
+            if op_meta.is_complete():
+                print(op_meta.stdout)
+
+
+class AuditExecutor:
+    """Audit hosts independently, streaming each result as it finishes."""
+
+    def __init__(
+        self,
+        state: State,
+        checks: list[type[Check]],
+        *,
+        concurrency: int = 0,
+        timeout: float | None = None,
+        tracer: Tracer | None = None,
+    ) -> None:
+        """
+        Build an AuditExecutor instance.
+
+        Args:
+            state (State): Connected state of the hosts to audit
+            checks (list[type[Check]]): Audits to run on each host in order
+            concurrency (int): Number of hosts to audit at once. If 0, all
+                hosts are audited at once.
+            timeout (float | None): Seconds each host may take to run all its
+                audits. If None, hosts may take as long as they need.
+            tracer (Tracer | None): Tracer to record each audit in
+
+        """
+        self.state = state
+        self.checks = checks
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.tracer = tracer
+        self.prefetch = FactPrefetch()
+        self.prefetch.install(state)
+
+    def run(self, on_result: Callable[[AuditResult], None]) -> None:
+        """
+        Audit all active hosts.
+
+        Args:
+            on_result (Callable[[AuditResult], None]): Called with each result
+                as soon as it's available
+
+        """
+        hosts = list(self.state.inventory.get_active_hosts())
+        if not hosts:
+            return
+        pool = Pool(self.concurrency or len(hosts))
+        with ctx_state.use(self.state):
+            for host in hosts:
+                pool.spawn(self._audit_host, host, on_result)
+            pool.join(raise_error=True)
+
+    def _audit_host(
+        self, host: Host, on_result: Callable[[AuditResult], None]
+    ) -> None:
+        start = time.perf_counter()
+        finished = 0
+        timeout = gevent.Timeout(self.timeout)
+        try:
+            with timeout, ctx_host.use(host):
+                self.prefetch.fetch(
+                    self.state,
+                    [host],
+                    [
+                        request
+                        for check in self.checks
+                        for request in check.prefetch
+                    ],
+                )
+                if host in self.state.failed_hosts:
+                    duration = time.perf_counter() - start
+                    for check in self.checks:
+                        on_result(
+                            AuditResult(
+                                host.name, check.name, "error", duration
+                            )
+                        )
+                    return
+                for check in self.checks:
+                    on_result(self._audit(host, check))
+                    finished += 1
+        except gevent.Timeout as e:
+            if e is not timeout:
+                raise
+            duration = time.perf_counter() - start
+            for check in self.checks[finished:]:
+                on_result(
+                    AuditResult(host.name, check.name, "timeout", duration)
+                )
+
+    def _audit(self, host: Host, check: type[Check]) -> AuditResult:
+        start = time.perf_counter()
+        planned = len(host.op_hash_order)
+        meta = None
+        status = "success"
+        try:
+            meta = check.run(self.state, [host])
+            # the ops the check added for the host in the order they were added
+            for op_hash in host.op_hash_order[planned:]:
+                if not run_host_op(self.state, host, op_hash):
+                    status = "error"
+                    break
+        except PyinfraError:
+            status = "error"
+        end = time.perf_counter()
+        if self.tracer is not None:
+            self.tracer.add_span(
+                check.name,
+                "check",
+                host.name,
+                start=start,
+                end=end,
+                args={"status": status},
+            )
+        return AuditResult(host.name, check.name, status, end - start, meta)
@@ -5,20 +5,42 @@ from __future__ import annotations
 
 import abc
 import enum
+import json
+import time
 from typing import TYPE_CHECKING
 
 from pyinfra.api.operation import add_op as pyinfra_add_op
+from pyinfra.context import ctx_host
+from pyinfra.facts.files import Directory, File, FileContents
+from pyinfra.facts.server import Kernel, KernelModules
+from pyinfra.operations import server
+
+from home_server.facts.fingerprint import COMPONENTS
+from home_server.facts.util import join_hosts
+from home_server.operations import modprobe
 
 if TYPE_CHECKING:
-    from pyinfra.api import State
+    from pyinfra.api import FactBase, Host, State
     from pyinfra.api.operation import OperationMeta
 
+    from home_server.facts.prefetch import FactRequest
     from home_server.hardening import Feature
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from typing import Any
 
+MODPROBE_CONF = "/etc/modprobe.d/cis.conf"
+# facts the ops of add_kernel_module_ops get from each host
+KERNEL_MODULE_FACTS: tuple[FactRequest, ...] = (
+    (Kernel, {}),
+    (KernelModules, {}),
+    (File, {"path": MODPROBE_CONF}),
+    (FileContents, {"path": MODPROBE_CONF}),
+    (Directory, {"path": MODPROBE_CONF}),
+    (Directory, {"path": "/etc/modprobe.d"}),
+)
+
 
 class Profile(enum.Enum):
     """Hardening profiles that are allowed."""
@@ -36,6 +58,15 @@ class Level(enum.IntEnum):
     L2 = 2
 
 
+# profiles mapped to the profiles whose checks they also run
+PROFILE_INCLUDES: dict[Profile, frozenset[Profile]] = {
+    Profile.S1: frozenset({Profile.S1}),
+    Profile.S2: frozenset({Profile.S1, Profile.S2}),
+    Profile.WS1: frozenset({Profile.WS1}),
+    Profile.WS2: frozenset({Profile.WS1, Profile.WS2}),
+}
+
+
 def get_profile(platform: str, level: int) -> Profile:
     """
     Parse the user CLI arguments as a profile enum.
@@ -60,29 +91,74 @@ def get_profile(platform: str, level: int) -> Profile:
         raise ValueError(err_msg)
     if platform == "workstation":
         if level == Level.L1:
-            return Profile.S1
+            return Profile.WS1
         if level == Level.L2:
-            return Profile.S2
-        err_msg = f"Unexpected level for server: {level}"
+            return Profile.WS2
+        err_msg = f"Unexpected level for workstation: {level}"
         raise ValueError(err_msg)
     err_msg = f"Unexpected platform: {platform}"
     raise ValueError(err_msg)
 
 
+def get_facts(
+    state: State,
+    hosts: list[Host],
+    fact_cls: type[FactBase[Any]],
+    *args: Any,
+    **kwargs: Any,
+) -> dict[str, tuple[Any, float]]:
+    """
+    Get a fact from hosts in parallel.
+
+    Hosts the fact can't be fetched from are failed and left out of the result.
+
+    Args:
+        state (State): State the hosts belong to
+        hosts (list[Host]): Hosts to get the fact from
+        fact_cls (type[FactBase[Any]]): Fact to get
+        args (Any): Positional arguments to the fact
+        kwargs (Any): Keyword arguments to the fact
+
+    Returns:
+        dict[str, tuple[Any, float]]: Host names mapped to the fact's value and
+            the seconds it took to get
+
+    """
+
+    def get_fact(host: Host) -> tuple[Any, float]:
+        start = time.perf_counter()
+        with ctx_host.use(host):
+            value = host.get_fact(fact_cls, *args, **kwargs)
+        return value, time.perf_counter() - start
+
+    greenlets = {host: state.fact_pool.spawn(get_fact, host) for host in hosts}
+    return {
+        host.name: result
+        for host, result in join_hosts(state, greenlets).items()
+    }
+
+
 class CheckMeta:
     """Stores the OperationMeta objects associated with a particular check."""
 
-    def __init__(self, state: State) -> None:
+    def __init__(self, state: State, hosts: list[Host]) -> None:
         """
         Build a CheckMeta instance.
 
         Args:
             state (State): State to use for all ops
+            hosts (list[Host]): Hosts to run the check on
 
         """
         self.state = state
+        self.hosts = hosts
 
+        # names of hosts the check was skipped on
+        self.skipped: list[str] = []
         self.op_metas: dict[str, list[OperationMeta]] = {}
+        self.facts: dict[str, Any] = {}
+        self.fact_durations: dict[str, float] = {}
+        self.kernel_modules: list[str] = []
 
     def add_op[**P, R](
         self,
@@ -91,10 +167,51 @@ class CheckMeta:
         **kwargs: Any,
     ) -> None:
         """Add a PyInfra op to this check."""
-        self._add_op_meta(pyinfra_add_op(self.state, op_func, *args, **kwargs))
+        self._add_op_meta(
+            pyinfra_add_op(
+                self.state, op_func, *args, host=self.hosts, **kwargs
+            )
+        )
 
-    def _add_op_meta(self, retval: dict[str, OperationMeta]) -> None:
-        for host_name, op_meta in retval.items():
+    def add_fact(
+        self,
+        fact_cls: type[FactBase[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Get a fact from the check's hosts in parallel as its result.
+
+        Audits implemented as facts are evaluated immediately rather than when
+        the ops run.
+
+        Args:
+            fact_cls (type[FactBase[Any]]): Fact to get
+            args (Any): Positional arguments to the fact
+            kwargs (Any): Keyword arguments to the fact
+
+        """
+        results = get_facts(self.state, self.hosts, fact_cls, *args, **kwargs)
+        for host_name, (value, duration) in results.items():
+            self.facts[host_name] = value
+            self.fact_durations[host_name] = duration
+
+    def blacklist_kernel_module(self, name: str) -> None:
+        """
+        Request a kernel module be removed and blacklisted.
+
+        The module isn't handled here. Instead, all requested modules across
+        checks are batched into shared ops by add_kernel_module_ops.
+
+        Args:
+            name (str): Name of the kernel module
+
+        """
+        self.kernel_modules.append(name)
+
+    def _add_op_meta(self, retval: dict[Host, OperationMeta]) -> None:
+        for host, op_meta in retval.items():
+            host_name = host.name
             if host_name not in self.op_metas:
                 self.op_metas[host_name] = []
             self.op_metas[host_name].append(op_meta)
@@ -104,7 +221,68 @@ class CheckMeta:
         for host_name, op_metas in self.op_metas.items():
             print(host_name)
             for op_meta in op_metas:
-                print(op_meta.stdout)
+                # ops don't run on hosts after they fail or a run stops
+                if op_meta.is_complete():
+                    print(op_meta.stdout)
+        for host_name, fact in self.facts.items():
+            print(host_name)
+            print(json.dumps(fact, indent=2, default=str))
+
+
+def add_kernel_module_ops(state: State, metas: dict[str, CheckMeta]) -> None:
+    """
+    Remove and blacklist all kernel modules requested by checks.
+
+    Rather than editing the modprobe config line by line per module, all the
+    modules are unloaded in one op and the lines blacklisting them are added to
+    the config in another. Lines already in the config, such as those of checks
+    that aren't selected in this run or added by hand, are kept. The ops only
+    run on the hosts of the requesting checks. The resulting ops are attributed
+    to each check that requested a module on the hosts the check runs on.
+
+    Args:
+        state (State): State to add the ops to
+        metas (dict[str, CheckMeta]): Check names mapped to their metadata
+
+    """
+    requesting_metas = {
+        check_name: meta
+        for check_name, meta in metas.items()
+        if meta.kernel_modules
+    }
+    if not requesting_metas:
+        return
+
+    modules = [
+        module
+        for meta in requesting_metas.values()
+        for module in meta.kernel_modules
+    ]
+    hosts = list(
+        dict.fromkeys(
+            host for meta in requesting_metas.values() for host in meta.hosts
+        )
+    )
+    if not hosts:
+        return
+
+    retvals = [
+        pyinfra_add_op(
+            state, server.modprobe, modules, present=False, host=hosts
+        ),
+        pyinfra_add_op(
+            state, modprobe.blacklist, modules, MODPROBE_CONF, host=hosts
+        ),
+    ]
+    for meta in requesting_metas.values():
+        for retval in retvals:
+            meta._add_op_meta(  # noqa: SLF001
+                {
+                    host: op_meta
+                    for host, op_meta in retval.items()
+                    if host in meta.hosts
+                }
+            )
 
 
 class Check(abc.ABC):
@@ -116,6 +294,13 @@ class Check(abc.ABC):
 
     name = ""
     audit = False
+    # components of the host's fingerprint the check's result depends on. The
+    # check is skipped on hosts where these haven't changed since it last
+    # succeeded. Checks that don't set any always run.
+    fingerprint: tuple[str, ...] = ()
+    # facts the check gets from each host. They're fetched from all hosts in
+    # one command before planning.
+    prefetch: tuple[FactRequest, ...] = ()
 
     @classmethod
     def validate(cls) -> None:
@@ -126,6 +311,10 @@ class Check(abc.ABC):
         if not cls.description():
             err_msg = "Check subclasses must set a description as a docstring"
             raise TypeError(err_msg)
+        unknown = set(cls.fingerprint) - COMPONENTS.keys()
+        if unknown:
+            err_msg = f"Unknown fingerprint components in {cls.name}: {unknown}"
+            raise TypeError(err_msg)
 
     @classmethod
     def enabled(
@@ -148,17 +337,7 @@ class Check(abc.ABC):
 
         """
         # make sure the set profile includes the check
-        min_profile_exceeded = False
-        profiles = cls._minimum_profiles()
-        if profile in profiles:
-            min_profile_exceeded = True
-
-        if profile == Profile.S2 and Profile.S1 in profiles:
-            min_profile_exceeded = True
-        if profile == Profile.WS2 and Profile.WS1 in profiles:
-            min_profile_exceeded = True
-
-        if not min_profile_exceeded:
+        if PROFILE_INCLUDES[profile].isdisjoint(cls._minimum_profiles()):
             return False
 
         # if the check negatively affects any feature that has been requested,
@@ -173,7 +352,7 @@ class Check(abc.ABC):
         return audit == cls.audit
 
     @classmethod
-    def features(cls) -> set[Feature]:
+    def features(cls) -> frozenset[Feature]:
         """
         Get the features this check helps enable.
 
@@ -182,22 +361,23 @@ class Check(abc.ABC):
         a check affects, that check can be removed from execution if that
         feature is desired.
         """
-        return set()
+        return frozenset()
 
     @classmethod
     @abc.abstractmethod
-    def run(cls, state: State) -> CheckMeta:
+    def run(cls, state: State, hosts: list[Host]) -> CheckMeta:
         """
         Add the check to the current state.
 
         Args:
             state (State): State to add the check to
+            hosts (list[Host]): Hosts to run the check on
 
         """
 
     @staticmethod
     @abc.abstractmethod
-    def _minimum_profiles() -> set[Profile]: ...
+    def _minimum_profiles() -> frozenset[Profile]: ...
 
     @classmethod
     def description(cls) -> str | None:
@@ -209,3 +389,73 @@ class Check(abc.ABC):
 
         """
         return cls.__doc__
+
+
+class CheckIndex:
+    """
+    Precompute which checks run for each profile and feature.
+
+    Selecting checks with Check.enabled evaluates every check on every run. The
+    index evaluates each check once when built and then answers selections with
+    lookups.
+    """
+
+    def __init__(self, checks: Iterable[type[Check]]) -> None:
+        """
+        Build a CheckIndex instance.
+
+        Args:
+            checks (Iterable[type[Check]]): Checks to index in execution order
+
+        """
+        # (profile, audit) -> checks to run in order
+        self.plans: dict[tuple[Profile, bool], tuple[type[Check], ...]] = {}
+        # feature -> checks to skip if the feature is requested
+        self.feature_checks: dict[Feature, frozenset[type[Check]]] = {}
+
+        plans: dict[tuple[Profile, bool], list[type[Check]]] = {
+            (profile, audit): []
+            for profile in Profile
+            for audit in (False, True)
+        }
+        feature_checks: dict[Feature, set[type[Check]]] = {}
+        for check in checks:
+            minimum_profiles = check._minimum_profiles()  # noqa: SLF001
+            for profile, included in PROFILE_INCLUDES.items():
+                if not included.isdisjoint(minimum_profiles):
+                    plans[(profile, check.audit)].append(check)
+            for feature in check.features():
+                feature_checks.setdefault(feature, set()).add(check)
+
+        self.plans = {key: tuple(value) for key, value in plans.items()}
+        self.feature_checks = {
+            key: frozenset(value) for key, value in feature_checks.items()
+        }
+
+    def select(
+        self,
+        profile: Profile,
+        requested_features: set[Feature],
+        *,
+        audit: bool,
+    ) -> list[type[Check]]:
+        """
+        Get the checks to run, matching what Check.enabled would return.
+
+        Args:
+            profile (Profile): Profile of checks to run
+            requested_features (set[Feature]): Features that should be enabled
+            audit (bool): True if running in audit mode
+
+        Returns:
+            list[type[Check]]: Checks to run in order
+
+        """
+        excluded: set[type[Check]] = set()
+        for feature in requested_features:
+            excluded |= self.feature_checks.get(feature, frozenset())
+        return [
+            check
+            for check in self.plans[(profile, audit)]
+            if check not in excluded
+        ]
@@ -3,13 +3,24 @@
 
 from __future__ import annotations
 
+import importlib
 from typing import TYPE_CHECKING
 
+from home_server.hardening.checks import CheckIndex
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from home_server.hardening.checks import Check
 
 REGISTRY: list[type[Check]] = []
 
+# CIS sections mapped to the modules that define their checks. Modules are only
+# imported when their section is selected.
+SECTIONS: dict[str, str] = {
+    "1.1.1": "cis_1_1_1_x",
+}
+
 
 def register_check(check: type[Check]) -> type[Check]:
     """
@@ -27,4 +38,69 @@ def register_check(check: type[Check]) -> type[Check]:
     return check
 
 
-from . import cis_1_1_1_x as cis_1_1_1_x  # noqa: E402
+def in_sections(name: str, sections: Iterable[str]) -> bool:
+    """
+    Check if a check or section name is part of any of the sections.
+
+    Args:
+        name (str): Name of the check or section e.g. 1.1.1.1
+        sections (Iterable[str]): Sections to search e.g. 1.1
+
+    Returns:
+        bool: True if the name is in any of the sections
+
+    """
+    return any(name == s or name.startswith(f"{s}.") for s in sections)
+
+
+def load_checks(sections: Iterable[str] | None = None) -> CheckIndex:
+    """
+    Import the checks of the sections and index them.
+
+    Args:
+        sections (Iterable[str] | None, optional): Sections to load. Defaults
+            to None to load all sections.
+
+    Raises:
+        ValueError: Raised if a section doesn't have any checks
+
+    Returns:
+        CheckIndex: Index of the checks in the sections
+
+    """
+    if sections is None:
+        modules = list(SECTIONS.values())
+    else:
+        sections = list(sections)
+        # a section's module is needed if the section is part of a requested
+        # one or a requested one is part of the section
+        modules = [
+            module
+            for section, module in SECTIONS.items()
+            if in_sections(section, sections)
+            or any(in_sections(s, [section]) for s in sections)
+        ]
+
+    for module in modules:
+        importlib.import_module(f"{__name__}.{module}")
+
+    if sections is None:
+        return CheckIndex(REGISTRY)
+
+    unknown = [
+        section
+        for section in sections
+        if not any(in_sections(check.name, [section]) for check in REGISTRY)
+    ]
+    if unknown:
+        for module in SECTIONS.values():
+            importlib.import_module(f"{__name__}.{module}")
+        valid = ", ".join([*SECTIONS, *(check.name for check in REGISTRY)])
+        err_msg = (
+            f"Unknown sections: {', '.join(unknown)}. Valid sections and "
+            f"checks are: {valid}"
+        )
+        raise ValueError(err_msg)
+    return CheckIndex(
+        check for check in REGISTRY if in_sections(check.name, sections)
+    )
@@ -5,232 +5,144 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, override
-
-from pyinfra.operations import files, server
+from typing import TYPE_CHECKING, NamedTuple, override
 
+from home_server.facts.kernel import FilesystemModules
 from home_server.hardening import Feature
-from home_server.hardening.checks import Check, CheckMeta, Profile
+from home_server.hardening.checks import (
+    KERNEL_MODULE_FACTS,
+    Check,
+    CheckMeta,
+    Profile,
+)
 from home_server.hardening.checks.debian_13 import register_check
 
 if TYPE_CHECKING:
-    from pyinfra.api import State
+    from pyinfra.api import Host, State
+
+# a kernel module check only changes if the kernel, the loaded modules or the
+# modprobe config do
+KERNEL_MODULE_FINGERPRINT = (
+    "kernel_release",
+    "kernel_modules",
+    "modprobe_config",
+)
 
 
-def remove_and_blacklist_kernel_module(name: str, state: State) -> CheckMeta:
+def remove_and_blacklist_kernel_module(
+    name: str, state: State, hosts: list[Host]
+) -> CheckMeta:
     """
     Remove and blacklist a kernel module.
 
+    The ops themselves are batched with other checks' kernel modules by
+    add_kernel_module_ops to avoid repeated edits to the same modprobe config.
+
     Args:
         name (str): Name of the kernel module
         state (State): State to add the step to
+        hosts (list[Host]): Hosts to run the step on
 
     """
-    meta = CheckMeta(state)
-    meta.add_op(server.modprobe, name, present=False)
-    meta.add_op(
-        files.line,
-        "/etc/modprobe.d/cis.conf",
-        f"install {name} /bin/false",
-        present=True,
-    )
-    meta.add_op(
-        files.line,
-        "/etc/modprobe.d/cis.conf",
-        f"blacklist {name}",
-        present=True,
-    )
+    meta = CheckMeta(state, hosts)
+    meta.blacklist_kernel_module(name)
     return meta
 
 
-@register_check
-class CIS1(Check):
-    """Ensure cramfs kernel module is not available."""
-
-    name = "1.1.1.1"
-
-    @classmethod
-    @override
-    def run(cls, state: State) -> CheckMeta:
-        return remove_and_blacklist_kernel_module("cramfs", state)
-
-    @staticmethod
-    @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S1, Profile.WS1}
-
-
-@register_check
-class CIS2(Check):
-    """Ensure freevxfs kernel module is not available."""
-
-    name = "1.1.1.2"
-
-    @classmethod
-    @override
-    def run(cls, state: State) -> CheckMeta:
-        return remove_and_blacklist_kernel_module("freevxfs", state)
-
-    @staticmethod
-    @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S1, Profile.WS1}
-
-
-@register_check
-class CIS3(Check):
-    """Ensure hfs kernel module is not available."""
+class KernelModuleRule(NamedTuple):
+    """A rule that a kernel module must not be available."""
 
-    name = "1.1.1.3"
+    # name of the CIS rule e.g. 1.1.1.1
+    name: str
+    # kernel module to remove and blacklist
+    module: str
+    # lowest profiles that include the rule
+    profiles: frozenset[Profile]
+    # features that blacklisting the module breaks
+    features: frozenset[Feature] = frozenset()
 
-    @classmethod
-    @override
-    def run(cls, state: State) -> CheckMeta:
-        return remove_and_blacklist_kernel_module("hfs", state)
-
-    @staticmethod
-    @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S1, Profile.WS1}
-
-
-@register_check
-class CIS4(Check):
-    """Ensure hfsplus kernel module is not available."""
-
-    name = "1.1.1.4"
-
-    @classmethod
-    @override
-    def run(cls, state: State) -> CheckMeta:
-        return remove_and_blacklist_kernel_module("hfsplus", state)
-
-    @staticmethod
-    @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S1, Profile.WS1}
-
-
-@register_check
-class CIS5(Check):
-    """Ensure jffs2 kernel module is not available."""
-
-    name = "1.1.1.5"
-
-    @classmethod
-    @override
-    def run(cls, state: State) -> CheckMeta:
-        return remove_and_blacklist_kernel_module("jffs2", state)
-
-    @staticmethod
-    @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S1, Profile.WS1}
-
-
-@register_check
-class CIS6(Check):
-    """Ensure overlay kernel module is not available."""
-
-    name = "1.1.1.6"
-
-    @classmethod
-    @override
-    def run(cls, state: State) -> CheckMeta:
-        return remove_and_blacklist_kernel_module("overlay", state)
-
-    @classmethod
-    @override
-    def features(cls) -> set[Feature]:
-        return {Feature.CONTAINERS}
-
-    @staticmethod
-    @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S2, Profile.WS2}
-
-
-@register_check
-class CIS7(Check):
-    """Ensure squashfs kernel module is not available."""
-
-    name = "1.1.1.7"
-
-    @classmethod
-    @override
-    def run(cls, state: State) -> CheckMeta:
-        return remove_and_blacklist_kernel_module("squashfs", state)
-
-    @classmethod
-    @override
-    def features(cls) -> set[Feature]:
-        return {Feature.SNAP}
-
-    @staticmethod
-    @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S2, Profile.WS2}
 
+class KernelModuleCheck(Check):
+    """
+    Base of the checks generated from KernelModuleRule entries.
 
-@register_check
-class CIS8(Check):
-    """Ensure udf kernel module is not available."""
+    The profiles and features of the check are built once from its rule so
+    selecting checks doesn't build new sets.
+    """
 
-    name = "1.1.1.8"
+    module = ""
+    rule_profiles: frozenset[Profile] = frozenset()
+    rule_features: frozenset[Feature] = frozenset()
+    fingerprint = KERNEL_MODULE_FINGERPRINT
+    prefetch = KERNEL_MODULE_FACTS
 
     @classmethod
     @override
-    def run(cls, state: State) -> CheckMeta:
-        return remove_and_blacklist_kernel_module("udf", state)
+    def run(cls, state: State, hosts: list[Host]) -> CheckMeta:
+        return remove_and_blacklist_kernel_module(cls.module, state, hosts)
 
     @classmethod
     @override
-    def features(cls) -> set[Feature]:
-        return {Feature.SNAP}
-
-    @staticmethod
-    @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S2, Profile.WS2}
-
-
-@register_check
-class CIS9(Check):
-    """Ensure firewire-core kernel module is not available."""
-
-    name = "1.1.1.9"
+    def features(cls) -> frozenset[Feature]:
+        return cls.rule_features
 
     @classmethod
     @override
-    def run(cls, state: State) -> CheckMeta:
-        return remove_and_blacklist_kernel_module("firewire-core", state)
+    def _minimum_profiles(cls) -> frozenset[Profile]:
+        return cls.rule_profiles
 
-    @staticmethod
-    @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S1, Profile.WS2}
 
+def make_kernel_module_check(rule: KernelModuleRule) -> type[Check]:
+    """
+    Generate the check of a kernel module rule.
 
-@register_check
-class CIS10(Check):
-    """Ensure usb-storage kernel module is not available."""
+    Args:
+        rule (KernelModuleRule): Rule to check
 
-    name = "1.1.1.10"
+    Returns:
+        type[Check]: Check that removes and blacklists the rule's module
 
-    @classmethod
-    @override
-    def run(cls, state: State) -> CheckMeta:
-        return remove_and_blacklist_kernel_module("usb-storage", state)
+    """
+    return type(
+        f"CIS{rule.name.replace('.', '_')}",
+        (KernelModuleCheck,),
+        {
+            "__doc__": f"Ensure {rule.module} kernel module is not available.",
+            "__module__": __name__,
+            "name": rule.name,
+            "module": rule.module,
+            "rule_profiles": rule.profiles,
+            "rule_features": rule.features,
+        },
+    )
 
-    @classmethod
-    @override
-    def features(cls) -> set[Feature]:
-        return {Feature.USB_STORAGE}
 
-    @staticmethod
-    @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S1, Profile.WS2}
+LEVEL_1 = frozenset({Profile.S1, Profile.WS1})
+SERVER_1_WORKSTATION_2 = frozenset({Profile.S1, Profile.WS2})
+LEVEL_2 = frozenset({Profile.S2, Profile.WS2})
+
+KERNEL_MODULE_RULES = (
+    KernelModuleRule("1.1.1.1", "cramfs", LEVEL_1),
+    KernelModuleRule("1.1.1.2", "freevxfs", LEVEL_1),
+    KernelModuleRule("1.1.1.3", "hfs", LEVEL_1),
+    KernelModuleRule("1.1.1.4", "hfsplus", LEVEL_1),
+    KernelModuleRule("1.1.1.5", "jffs2", LEVEL_1),
+    KernelModuleRule(
+        "1.1.1.6", "overlay", LEVEL_2, frozenset({Feature.CONTAINERS})
+    ),
+    KernelModuleRule("1.1.1.7", "squashfs", LEVEL_2, frozenset({Feature.SNAP})),
+    KernelModuleRule("1.1.1.8", "udf", LEVEL_2, frozenset({Feature.SNAP})),
+    KernelModuleRule("1.1.1.9", "firewire-core", SERVER_1_WORKSTATION_2),
+    KernelModuleRule(
+        "1.1.1.10",
+        "usb-storage",
+        SERVER_1_WORKSTATION_2,
+        frozenset({Feature.USB_STORAGE}),
+    ),
+)
+
+for _rule in KERNEL_MODULE_RULES:
+    register_check(make_kernel_module_check(_rule))
 
 
 @register_check
@@ -239,18 +151,22 @@ class CIS11(Check):
 
     name = "1.1.1.11"
     audit = True
+    fingerprint = (
+        "mounts",
+        "kernel_modules",
+        "modprobe_config",
+        "module_files",
+    )
+    prefetch = ((FilesystemModules, {}),)
 
     @classmethod
     @override
-    def run(cls, state: State) -> CheckMeta:
-        meta = CheckMeta(state)
-        meta.add_op(
-            server.script,
-            "src/home_server/hardening/checks/debian_13/cis_1_1_1_11.sh",
-        )
+    def run(cls, state: State, hosts: list[Host]) -> CheckMeta:
+        meta = CheckMeta(state, hosts)
+        meta.add_fact(FilesystemModules)
         return meta
 
     @staticmethod
     @override
-    def _minimum_profiles() -> set[Profile]:
-        return {Profile.S1, Profile.WS1}
+    def _minimum_profiles() -> frozenset[Profile]:
+        return LEVEL_1
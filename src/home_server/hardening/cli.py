@@ -0,0 +1,155 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Define the home_server harden CLI.
+
+Parsing arguments shouldn't import pyinfra or the checks so they are only
+imported by main once the harden command runs.
+"""
+
+from __future__ import annotations
+
+import textwrap
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from home_server.cli import add_run_arguments
+
+from . import Feature, Preset
+
+if TYPE_CHECKING:
+    import argparse
+    from argparse import ArgumentParser, _SubParsersAction
+
+
+def add_check_arguments(parser: ArgumentParser) -> None:
+    """
+    Add the arguments that select which checks run to a parser.
+
+    Args:
+        parser (ArgumentParser): Parser to add the arguments to
+
+    """
+    parser.add_argument(
+        "--platform",
+        choices=["server", "workstation"],
+        default="server",
+        help="Choose the CIS platform type to harden. Defaults to 'server'.",
+    )
+    parser.add_argument(
+        "--level",
+        type=int,
+        choices=[1, 2],
+        default=1,
+        help="Enable CIS rules up to a level. Defaults to '1'.",
+    )
+    feature_help = textwrap.dedent("""
+        Some hardening rules interfere with features you may want to use. Pass
+        any features you want to keep to disable rules that affect them, even if
+        the default CIS platform/level enable them.""")
+    parser.add_argument(
+        "--features",
+        choices=[x.value for x in Feature],
+        action="extend",
+        nargs="+",
+        help=feature_help,
+        default=[],
+    )
+    parser.add_argument(
+        "--preset",
+        choices=[x.value for x in Preset],
+        help="Presets to set a variety of options in one convenient flag",
+    )
+    parser.add_argument(
+        "--sections",
+        action="extend",
+        nargs="+",
+        help=(
+            "Only run checks in these CIS sections e.g. '1.1.1'. Defaults to "
+            "all sections."
+        ),
+    )
+
+
+def configure_parser(subparser: _SubParsersAction[ArgumentParser]) -> None:
+    """
+    Define the subparser for the harden command.
+
+    Args:
+        subparser (_SubParsersAction[ArgumentParser]): Parent parser
+
+    """
+    harden = subparser.add_parser(
+        "harden",
+        help="Run CIS Benchmark hardening checks",
+    )
+    inventory_help = (
+        "Path to an inventory file, a directory of inventory files or "
+        "hostname/IP address to run commands on. Use @local to run on this "
+        "host."
+    )
+    harden.add_argument(
+        "inventory",
+        type=Path,
+        nargs="?",
+        help=inventory_help,
+    )
+    add_check_arguments(harden)
+    harden.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Don't execute operations on target hosts",
+    )
+    harden.add_argument(
+        "--audit",
+        action="store_true",
+        help="Audit the system and view any manual fixes needed",
+    )
+    harden.add_argument(
+        "--host-timeout",
+        type=float,
+        help=(
+            "Seconds a host may take to run all audits before the rest of its "
+            "audits are reported as timed out. Only used with --audit. "
+            "Defaults to no limit."
+        ),
+    )
+    harden.add_argument(
+        "--list-checks",
+        action="store_true",
+        help="Print the checks that would run without connecting to hosts",
+    )
+    harden.add_argument(
+        "--output",
+        type=Path,
+        help=(
+            "Write the result of each check on each host to this file as JSON "
+            "Lines instead of printing the results"
+        ),
+    )
+    harden.add_argument(
+        "--full",
+        action="store_true",
+        help=(
+            "Run every check on every host. By default, checks are skipped on "
+            "hosts that haven't changed since the check last succeeded."
+        ),
+    )
+    harden.add_argument(
+        "--fingerprint-dir",
+        type=Path,
+        help=(
+            "Directory to record host fingerprints in. Defaults to "
+            "'home-server/fingerprints' in the user's state directory."
+        ),
+    )
+    add_run_arguments(harden)
+    harden.set_defaults(func=main)
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for home_server harden CLI."""
+    from .main import main as harden  # noqa: PLC0415
+
+    harden(args)
@@ -0,0 +1,194 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Skip checks on hosts that haven't changed since the checks last succeeded.
+
+Before planning, a cheap fingerprint is fetched from each host. A check is
+skipped on a host if the components of the fingerprint it depends on match the
+ones recorded when it last succeeded there. After a run, the fingerprints are
+fetched again and recorded for each check that succeeded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from home_server.facts.fingerprint import Fingerprint
+
+from .checks import get_facts
+
+if TYPE_CHECKING:
+    from pyinfra.api import Host, State
+
+    from .checks import Check, CheckMeta
+
+
+def default_fingerprint_dir() -> Path:
+    """
+    Get the default directory to store fingerprints in.
+
+    Returns:
+        Path: Directory for fingerprints
+
+    """
+    state_home = os.environ.get(
+        "XDG_STATE_HOME", Path.home() / ".local" / "state"
+    )
+    return Path(state_home) / "home-server" / "fingerprints"
+
+
+def fetch_fingerprints(
+    state: State, hosts: list[Host]
+) -> dict[str, dict[str, str]]:
+    """
+    Get the fingerprints of hosts in parallel.
+
+    Args:
+        state (State): State the hosts belong to
+        hosts (list[Host]): Hosts to get the fingerprints of
+
+    Returns:
+        dict[str, dict[str, str]]: Host names mapped to their fingerprints
+
+    """
+    return {
+        host_name: value
+        for host_name, (value, _) in get_facts(
+            state, hosts, Fingerprint
+        ).items()
+    }
+
+
+def check_fingerprint(
+    check: type[Check], fingerprint: dict[str, str]
+) -> str | None:
+    """
+    Get the fingerprint of a check on a host.
+
+    Args:
+        check (type[Check]): Check to get the fingerprint of
+        fingerprint (dict[str, str]): Fingerprint of the host
+
+    Returns:
+        str | None: Hash of the components the check depends on or None if the
+            check doesn't have one or any of its components are missing
+
+    """
+    if not check.fingerprint:
+        return None
+    parts = [check.name]
+    for component in check.fingerprint:
+        if component not in fingerprint:
+            return None
+        parts.append(f"{component}={fingerprint[component]}")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class FingerprintStore:
+    """Record the fingerprint of each check that succeeded on each host."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Build a FingerprintStore instance.
+
+        Args:
+            path (Path): Directory to store fingerprints in
+
+        """
+        self.path = path
+        # host name -> check name -> fingerprint
+        self.fingerprints: dict[str, dict[str, str]] = {}
+
+    def unchanged(
+        self, host_name: str, check: type[Check], fingerprint: dict[str, str]
+    ) -> bool:
+        """
+        Determine if a check can be skipped on a host.
+
+        Args:
+            host_name (str): Name of the host
+            check (type[Check]): Check to run
+            fingerprint (dict[str, str]): Current fingerprint of the host
+
+        Returns:
+            bool: Whether the check's fingerprint matches the recorded one
+
+        """
+        current = check_fingerprint(check, fingerprint)
+        if current is None:
+            return False
+        return self._load(host_name).get(check.name) == current
+
+    def record(
+        self,
+        state: State,
+        checks: list[type[Check]],
+        metas: dict[str, CheckMeta],
+    ) -> None:
+        """
+        Record the fingerprints of the checks that succeeded on each host.
+
+        Only hosts that ran a check are fingerprinted again as the others
+        haven't been changed by the run.
+
+        Args:
+            state (State): State that ran the checks
+            checks (list[type[Check]]): Checks that were planned
+            metas (dict[str, CheckMeta]): Check names mapped to their metadata
+
+        """
+        hosts = [
+            host
+            for host in state.inventory
+            if host not in state.failed_hosts
+            and any(host in meta.hosts for meta in metas.values())
+        ]
+        fingerprints = fetch_fingerprints(state, hosts)
+        for host in hosts:
+            if host in state.failed_hosts:
+                continue
+            host_checks = self._load(host.name)
+            for check in checks:
+                meta = metas[check.name]
+                if host not in meta.hosts:
+                    continue
+                # ops of hosts a run stopped before aren't complete
+                succeeded = all(
+                    op_meta.is_complete() and op_meta.did_succeed()
+                    for op_meta in meta.op_metas.get(host.name, [])
+                )
+                current = check_fingerprint(check, fingerprints[host.name])
+                if succeeded and current is not None:
+                    host_checks[check.name] = current
+                else:
+                    host_checks.pop(check.name, None)
+
+    def save(self) -> None:
+        """Write the recorded fingerprints to disk."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        for host_name, host_checks in self.fingerprints.items():
+            self._path(host_name).write_text(
+                json.dumps(host_checks, indent=2, sort_keys=True) + "\n"
+            )
+
+    def _path(self, host_name: str) -> Path:
+        return self.path / f"{host_name.replace('/', '_')}.json"
+
+    def _load(self, host_name: str) -> dict[str, str]:
+        if host_name in self.fingerprints:
+            return self.fingerprints[host_name]
+
+        host_checks: dict[str, str] = {}
+        path = self._path(host_name)
+        if path.exists():
+            try:
+                host_checks = json.loads(path.read_text())
+            except (OSError, json.JSONDecodeError):
+                host_checks = {}
+        self.fingerprints[host_name] = host_checks
+        return host_checks
@@ -11,87 +11,43 @@ settings to configure on the target host machine.
 
 from __future__ import annotations
 
-import textwrap
-from pathlib import Path
 from typing import TYPE_CHECKING
 
-from pyinfra.api import Config, State
-from pyinfra.api.connect import connect_all
-from pyinfra.api.operations import run_ops
 from pyinfra_cli.prints import print_meta
 
+from home_server.facts.fingerprint import Fingerprint
+from home_server.facts.prefetch import FactPrefetch
 from home_server.inventory import make_inventory
+from home_server.journal import make_journal
+from home_server.run import (
+    PhaseTimer,
+    execute,
+    finish,
+    make_config,
+    make_state,
+    make_timer,
+)
 
 from . import Feature, Preset
-from .checks import CheckMeta, get_profile
-from .checks.debian_13 import REGISTRY
+from .audit import AuditExecutor, AuditResult
+from .checks import CheckMeta, add_kernel_module_ops, get_profile
+from .checks.debian_13 import load_checks
+from .fingerprints import (
+    FingerprintStore,
+    default_fingerprint_dir,
+    fetch_fingerprints,
+)
+from .report import JsonlReport
 
 if TYPE_CHECKING:
     import argparse
-    from argparse import ArgumentParser, _SubParsersAction
 
+    from pyinfra.api import Host, State
 
-def configure_parser(subparser: _SubParsersAction[ArgumentParser]) -> None:
-    """
-    Define the subparser for the harden command.
+    from home_server.facts.prefetch import FactRequest
+    from home_server.journal import RunJournal
 
-    Args:
-        subparser (_SubParsersAction[ArgumentParser]): Parent parser
-
-    """
-    harden = subparser.add_parser(
-        "harden",
-        help="Run CIS Benchmark hardening checks",
-    )
-    inventory_help = (
-        "Path to an inventory file or hostname/IP address to run"
-        "commands on. Use @local to run on this host."
-    )
-    harden.add_argument(
-        "inventory",
-        type=Path,
-        help=inventory_help,
-    )
-    harden.add_argument(
-        "--platform",
-        choices=["server", "workstation"],
-        default="server",
-        help="Choose the CIS platform type to harden. Defaults to 'server'.",
-    )
-    harden.add_argument(
-        "--level",
-        choices=[1, 2],
-        default=1,
-        help="Enable CIS rules up to a level. Defaults to '1'.",
-    )
-    feature_help = textwrap.dedent("""
-        Some hardening rules interfere with features you may want to use. Pass
-        any features you want to keep to disable rules that affect them, even if
-        the default CIS platform/level enable them.""")
-    harden.add_argument(
-        "--features",
-        choices=[x.value for x in Feature],
-        action="extend",
-        nargs="+",
-        help=feature_help,
-        default=[],
-    )
-    harden.add_argument(
-        "--preset",
-        choices=[x.value for x in Preset],
-        help="Presets to set a variety of options in one convenient flag",
-    )
-    harden.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Don't execute operations on target hosts",
-    )
-    harden.add_argument(
-        "--audit",
-        action="store_true",
-        help="Audit the system and view any manual fixes needed",
-    )
-    harden.set_defaults(func=main)
+    from .checks import Check, Profile
 
 
 def set_presets(args: argparse.Namespace) -> None:
@@ -104,37 +60,259 @@ def set_presets(args: argparse.Namespace) -> None:
         args.features.append(Feature.PHYSICAL_MEDIA)
 
 
-def main(args: argparse.Namespace) -> None:
-    """Entry point for home_server harden CLI."""
-    set_presets(args)
+def list_checks(checks: list[type[Check]]) -> None:
+    """
+    Print the checks that would run.
 
-    profile = get_profile(args.platform, args.level)
+    Args:
+        checks (list[type[Check]]): Checks to print
+
+    """
+    for check in checks:
+        description = check.description() or ""
+        line = f"{check.name:<12}{description.strip()}"
+        features = sorted(check.features())
+        if features:
+            line += f" (affects: {', '.join(features)})"
+        print(line)
 
-    inventory = make_inventory(args.inventory)
 
-    config = Config()
-    state = State(inventory, config)
+def make_fingerprint_store(
+    args: argparse.Namespace,
+) -> FingerprintStore | None:
+    """
+    Get the store of fingerprints to skip unchanged hosts with.
+
+    Audits always run on every host so they report the current state.
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments
+
+    Returns:
+        FingerprintStore | None: Fingerprint store or None if every check
+            should run on every host
+
+    """
+    if args.audit or args.full:
+        return None
+    return FingerprintStore(args.fingerprint_dir or default_fingerprint_dir())
+
+
+def make_harden_journal(
+    args: argparse.Namespace, profile: Profile
+) -> RunJournal | None:
+    """
+    Get the journal to record the progress of the run in.
+
+    Audits don't change hosts so there's nothing to resume.
 
-    connect_all(state)
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments
+        profile (Profile): Profile of checks to run
+
+    Returns:
+        RunJournal | None: Journal or None if the run isn't recorded
+
+    """
+    if args.audit:
+        return None
+    return make_journal(
+        args,
+        profile.name,
+        sorted(args.features),
+        sorted(args.sections or []),
+    )
+
+
+def prefetch_facts(
+    state: State,
+    hosts: list[Host],
+    checks: list[type[Check]],
+    store: FingerprintStore | None,
+) -> None:
+    """
+    Fetch the facts the checks need from each host in one command.
+
+    Args:
+        state (State): State the hosts belong to
+        hosts (list[Host]): Hosts to fetch the facts from
+        checks (list[type[Check]]): Checks that will be planned
+        store (FingerprintStore | None): Fingerprints to skip unchanged hosts
+            with. If set, the hosts' fingerprints are fetched too.
+
+    """
+    requests: list[FactRequest] = []
+    if store is not None:
+        requests.append((Fingerprint, {}))
+    for check in checks:
+        requests.extend(check.prefetch)
+
+    prefetch = FactPrefetch()
+    prefetch.install(state)
+    prefetch.fetch(state, hosts, requests)
+
+
+def plan_checks(
+    state: State,
+    checks: list[type[Check]],
+    store: FingerprintStore | None,
+    timer: PhaseTimer,
+) -> dict[str, CheckMeta]:
+    """
+    Add the checks to the state.
+
+    Args:
+        state (State): State to add the checks to
+        checks (list[type[Check]]): Checks to add in order
+        store (FingerprintStore | None): Fingerprints to skip unchanged hosts
+            with. If None, all checks run on all hosts.
+        timer (PhaseTimer): Timer to record the run's phases
+
+    Returns:
+        dict[str, CheckMeta]: Check names mapped to their metadata
+
+    """
+    hosts = state.inventory.get_active_hosts()
+    with timer.phase("prefetch"):
+        prefetch_facts(state, hosts, checks, store)
+
+    fingerprints: dict[str, dict[str, str]] = {}
+    if store is not None:
+        with timer.phase("fingerprint"):
+            fingerprints = fetch_fingerprints(state, hosts)
+    # hosts that failed while their facts were fetched aren't planned
+    hosts = [host for host in hosts if host not in state.failed_hosts]
 
-    requested_features = set(args.features)
     op_metas: dict[str, CheckMeta] = {}
+    with timer.phase("plan"):
+        for check in checks:
+            check_hosts = hosts
+            skipped = []
+            if store is not None:
+                check_hosts = []
+                for host in hosts:
+                    if store.unchanged(
+                        host.name, check, fingerprints[host.name]
+                    ):
+                        skipped.append(host.name)
+                    else:
+                        check_hosts.append(host)
+            with timer.span(check.name, "plan", hosts=len(check_hosts)):
+                op_metas[check.name] = check.run(state, check_hosts)
+            op_metas[check.name].skipped = skipped
+        with timer.span("kernel modules", "plan"):
+            add_kernel_module_ops(state, op_metas)
+    if timer.tracer is not None:
+        timer.tracer.add_checks(op_metas)
+    return op_metas
+
+
+def run_checks(
+    state: State,
+    checks: list[type[Check]],
+    args: argparse.Namespace,
+    timer: PhaseTimer,
+) -> None:
+    """
+    Plan the checks across all hosts and then run them.
+
+    Args:
+        state (State): Connected state of the hosts to run the checks on
+        checks (list[type[Check]]): Checks to run in order
+        args (argparse.Namespace): Parsed CLI arguments
+        timer (PhaseTimer): Timer to record the run's phases
 
-    for check in REGISTRY:
-        if check.enabled(profile, requested_features, audit=args.audit):
-            op_meta = check.run(state)
-            op_metas[check.name] = op_meta
+    """
+    store = make_fingerprint_store(args)
+    op_metas = plan_checks(state, checks, store, timer)
 
     print_meta(state)
 
-    if args.dry_run:
+    report = None
+    if args.output is not None:
+        report = JsonlReport(args.output)
+        state.add_callback_handler(report)
+        for check_name, meta in op_metas.items():
+            report.add_check(check_name, meta)
+
+    if not args.dry_run:
+        execute(state, args, timer)
+
+    if report is not None:
+        report.close(state)
+    elif not args.dry_run:
+        for check_name, meta in op_metas.items():
+            print(check_name)
+            meta.print()
+
+    if store is not None and not args.dry_run:
+        store.record(state, checks, op_metas)
+        store.save()
+
+
+def audit_checks(
+    state: State,
+    checks: list[type[Check]],
+    args: argparse.Namespace,
+    timer: PhaseTimer,
+) -> None:
+    """
+    Run audits on each host, reporting results as each host finishes them.
+
+    Args:
+        state (State): Connected state of the hosts to audit
+        checks (list[type[Check]]): Audits to run in order
+        args (argparse.Namespace): Parsed CLI arguments
+        timer (PhaseTimer): Timer to record the run's phases
+
+    """
+    executor = AuditExecutor(
+        state,
+        checks,
+        concurrency=args.parallel,
+        timeout=args.host_timeout,
+        tracer=timer.tracer,
+    )
+    if args.output is None:
+        with timer.phase("audit"):
+            executor.run(AuditResult.print)
+        return
+
+    report = JsonlReport(args.output)
+    try:
+        with timer.phase("audit"):
+            executor.run(report.add_result)
+    finally:
+        report.close(state)
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for home_server harden CLI."""
+    set_presets(args)
+
+    profile = get_profile(args.platform, args.level)
+    index = load_checks(args.sections)
+    checks = index.select(profile, set(args.features), audit=args.audit)
+
+    if args.list_checks:
+        list_checks(checks)
         return
 
-    run_ops(state)
+    if args.inventory is None:
+        err_msg = "An inventory is required unless listing checks"
+        raise ValueError(err_msg)
+
+    inventory = make_inventory(args.inventory, make_config(args))
+    timer = make_timer(args)
+    journal = make_harden_journal(args, profile)
+    state = make_state(inventory, args, timer, journal)
+
+    if args.audit and not args.dry_run:
+        audit_checks(state, checks, args, timer)
+    else:
+        run_checks(state, checks, args, timer)
 
-    for check_name, meta in op_metas.items():
-        print(check_name)
-        meta.print()
+    finish(state, args, timer)
 
     # ruff: disable[ERA001]
     # for check_name, retval in cmd_outputs.items():
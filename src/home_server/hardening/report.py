@@ -0,0 +1,164 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Report the results of checks in a machine-readable format.
+
+Each line of the report is a JSON record of one check's result on one host.
+Records are written as soon as all the check's ops complete on the host so
+reports of large inventories can be consumed while the run is in progress.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, override
+
+from home_server.callbacks import OpCompleteCallback
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+    from pyinfra.api import Host, State
+    from pyinfra.api.operation import OperationMeta
+
+    from .audit import AuditResult
+    from .checks import CheckMeta
+
+
+class JsonlReport(OpCompleteCallback):
+    """Stream a JSON Lines record per check and host to a file."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Build a JsonlReport instance.
+
+        Args:
+            path (Path): Path to write the report to
+
+        """
+        super().__init__()
+        self.file = path.open("w")
+        # host name -> op -> names of the checks that include the op
+        self._op_checks: dict[str, dict[OperationMeta, list[str]]] = {}
+        # (host name, check name) -> record waiting for ops to complete
+        self._pending: dict[tuple[str, str], dict[str, Any]] = {}
+        self._remaining: dict[tuple[str, str], int] = {}
+
+    def add_check(self, check_name: str, meta: CheckMeta) -> None:
+        """
+        Add a check to the report.
+
+        Results that are already available, including hosts the check was
+        skipped on, are written immediately. The rest are written once their
+        ops complete.
+
+        Args:
+            check_name (str): Name of the check
+            meta (CheckMeta): Metadata of the check
+
+        """
+        for host_name in meta.skipped:
+            record = self._record(host_name, check_name)
+            record["status"] = "skipped"
+            self._write(record)
+
+        for host_name, value in meta.facts.items():
+            host = meta.state.inventory.get_host(host_name)
+            record = self._record(host_name, check_name)
+            if host in meta.state.failed_hosts:
+                record["status"] = "error"
+            record["duration"] = meta.fact_durations.get(host_name)
+            record["result"] = value
+            self._write(record)
+
+        for host_name, op_metas in meta.op_metas.items():
+            key = (host_name, check_name)
+            self._pending[key] = self._record(host_name, check_name)
+            self._remaining[key] = len(op_metas)
+            host_ops = self._op_checks.setdefault(host_name, {})
+            for op_meta in op_metas:
+                host_ops.setdefault(op_meta, []).append(check_name)
+
+    def add_result(self, result: AuditResult) -> None:
+        """
+        Write the result of an audit that has finished on a host.
+
+        Args:
+            result (AuditResult): Result of the audit
+
+        """
+        record = self._record(result.host_name, result.check_name)
+        record["status"] = result.status
+        record["duration"] = result.duration
+        meta = result.meta
+        if meta is not None:
+            record["result"] = meta.facts.get(result.host_name)
+            for op_meta in meta.op_metas.get(result.host_name, []):
+                if not op_meta.is_complete():
+                    continue
+                record["changed"] = record["changed"] or op_meta.did_change()
+                record["stdout"] += op_meta.stdout_lines
+                record["stderr"] += op_meta.stderr_lines
+        self._write(record)
+
+    @override
+    def operation_host_complete(
+        self,
+        state: State,
+        host: Host,
+        op_meta: OperationMeta,
+        duration: float,
+    ) -> None:
+        check_names = self._op_checks.get(host.name, {}).pop(op_meta, [])
+        for check_name in check_names:
+            key = (host.name, check_name)
+            record = self._pending[key]
+            if not op_meta.did_succeed():
+                record["status"] = "error"
+            record["changed"] = record["changed"] or op_meta.did_change()
+            record["duration"] += duration
+            record["stdout"] += op_meta.stdout_lines
+            record["stderr"] += op_meta.stderr_lines
+
+            self._remaining[key] -= 1
+            if self._remaining[key] == 0:
+                del self._remaining[key]
+                self._write(self._pending.pop(key))
+
+    def close(self, state: State) -> None:
+        """
+        Write any remaining records and close the report.
+
+        Checks whose ops didn't all run, such as on failed hosts or in a dry
+        run, are reported as not run.
+
+        Args:
+            state (State): State that ran the checks
+
+        """
+        self.flush(state)
+        for record in self._pending.values():
+            record["status"] = "not_run"
+            self._write(record)
+        self._pending.clear()
+        self._remaining.clear()
+        self.file.close()
+
+    @staticmethod
+    def _record(host_name: str, check_name: str) -> dict[str, Any]:
+        return {
+            "host": host_name,
+            "check": check_name,
+            "status": "success",
+            "changed": False,
+            "duration": 0.0,
+            "stdout": [],
+            "stderr": [],
+            "result": None,
+        }
+
+    def _write(self, record: dict[str, Any]) -> None:
+        self.file.write(json.dumps(record, default=str) + "\n")
+        self.file.flush()
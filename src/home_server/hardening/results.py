@@ -0,0 +1,283 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Summarize the results of checks across a fleet of hosts.
+
+Results are stored by column with host and check names replaced by indices into
+lists of names so that reports of thousands of hosts stay compact. Summaries,
+such as which checks fail on which hosts, are computed in one pass over the
+columns. Only the latest result of each check on each host is summarized so
+reports of several runs can be combined.
+
+This module doesn't import pyinfra so reports can be summarized quickly without
+connecting to hosts.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+    from typing import Any
+
+# statuses that JsonlReport writes
+STATUSES = ("success", "error", "timeout", "not_run", "skipped")
+# statuses that mean a check doesn't pass on a host
+FAILED_STATUSES = frozenset({"error", "timeout"})
+
+
+class ResultTable:
+    """Results of checks on hosts stored by column."""
+
+    def __init__(self) -> None:
+        """Build an empty ResultTable instance."""
+        self.hosts: list[str] = []
+        self.checks: list[str] = []
+        self._host_ids: dict[str, int] = {}
+        self._check_ids: dict[str, int] = {}
+        self._status_ids = {status: i for i, status in enumerate(STATUSES)}
+        self._failed_ids = frozenset(
+            self._status_ids[status] for status in FAILED_STATUSES
+        )
+        self.host_column = array("I")
+        self.check_column = array("I")
+        self.status_column = array("B")
+        self.changed_column = array("B")
+        self.duration_column = array("d")
+        # rows of the latest results, found again once results are added
+        self._latest: list[int] | None = None
+
+    def __len__(self) -> int:
+        """Get the number of results in the table."""
+        return len(self.status_column)
+
+    @classmethod
+    def read_jsonl(cls, paths: Iterable[Path]) -> ResultTable:
+        """
+        Read reports written by JsonlReport into a table.
+
+        Args:
+            paths (Iterable[Path]): Reports to read in the order they were
+                written
+
+        Returns:
+            ResultTable: Results of all the reports
+
+        """
+        table = cls()
+        for path in paths:
+            with path.open() as file:
+                for line in file:
+                    if line.strip():
+                        table.add_record(json.loads(line))
+        return table
+
+    def add(
+        self,
+        host_name: str,
+        check_name: str,
+        status: str,
+        *,
+        changed: bool = False,
+        duration: float = 0.0,
+    ) -> None:
+        """
+        Add the result of a check on a host.
+
+        Args:
+            host_name (str): Host the check ran on
+            check_name (str): Name of the check
+            status (str): Status of the check, one of STATUSES
+            changed (bool): Whether the check changed the host
+            duration (float): Seconds the check took on the host
+
+        Raises:
+            ValueError: Raised if the status is unknown
+
+        """
+        status_id = self._status_ids.get(status)
+        if status_id is None:
+            err_msg = f"Unknown status of {check_name} on {host_name}: {status}"
+            raise ValueError(err_msg)
+        self.host_column.append(self._id(host_name, self.hosts, self._host_ids))
+        self.check_column.append(
+            self._id(check_name, self.checks, self._check_ids)
+        )
+        self._latest = None
+        self.status_column.append(status_id)
+        self.changed_column.append(changed)
+        self.duration_column.append(duration or 0.0)
+
+    def add_record(self, record: dict[str, Any]) -> None:
+        """
+        Add a record of a JsonlReport to the table.
+
+        Args:
+            record (dict[str, Any]): Record of a check's result on a host
+
+        """
+        self.add(
+            record["host"],
+            record["check"],
+            record["status"],
+            changed=bool(record.get("changed")),
+            duration=record.get("duration") or 0.0,
+        )
+
+    def latest(self) -> list[int]:
+        """
+        Get the rows of the latest result of each check on each host.
+
+        Returns:
+            list[int]: Indices of the rows in the order they were added
+
+        """
+        if self._latest is None:
+            rows: dict[tuple[int, int], int] = {}
+            columns = zip(self.host_column, self.check_column, strict=True)
+            for row, key in enumerate(columns):
+                # moved to the end so rows stay in the order they were added
+                rows.pop(key, None)
+                rows[key] = row
+            self._latest = list(rows.values())
+        return self._latest
+
+    def status_counts(self) -> dict[str, int]:
+        """
+        Count the latest results of each status.
+
+        Returns:
+            dict[str, int]: Statuses mapped to how many results have them
+
+        """
+        counts = [0] * len(STATUSES)
+        for row in self.latest():
+            counts[self.status_column[row]] += 1
+        return {
+            status: count
+            for status, count in zip(STATUSES, counts, strict=True)
+            if count
+        }
+
+    def matrix(self) -> dict[str, dict[str, str]]:
+        """
+        Get the latest status of each check on each host.
+
+        Returns:
+            dict[str, dict[str, str]]: Host names mapped to check names mapped
+                to statuses. Checks that didn't run on a host are left out.
+
+        """
+        matrix: dict[str, dict[str, str]] = {host: {} for host in self.hosts}
+        for row in self.latest():
+            host = self.hosts[self.host_column[row]]
+            check = self.checks[self.check_column[row]]
+            matrix[host][check] = STATUSES[self.status_column[row]]
+        return matrix
+
+    def worst_hosts(self, count: int) -> list[tuple[str, int, int]]:
+        """
+        Get the hosts that fail the most checks.
+
+        Args:
+            count (int): Number of hosts to get
+
+        Returns:
+            list[tuple[str, int, int]]: Host names with the number of checks
+                that failed and ran on them, most failures first
+
+        """
+        return self._worst(self.host_column, self.hosts, count)
+
+    def worst_checks(self, count: int) -> list[tuple[str, int, int]]:
+        """
+        Get the checks that fail on the most hosts.
+
+        Args:
+            count (int): Number of checks to get
+
+        Returns:
+            list[tuple[str, int, int]]: Check names with the number of hosts
+                they failed and ran on, most failures first
+
+        """
+        return self._worst(self.check_column, self.checks, count)
+
+    def write_csv(self, path: Path) -> None:
+        """
+        Write every result in the table to a CSV file.
+
+        Args:
+            path (Path): Path to write the CSV file to
+
+        """
+        with path.open("w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["host", "check", "status", "changed", "duration"])
+            for row in range(len(self)):
+                writer.writerow(
+                    [
+                        self.hosts[self.host_column[row]],
+                        self.checks[self.check_column[row]],
+                        STATUSES[self.status_column[row]],
+                        bool(self.changed_column[row]),
+                        self.duration_column[row],
+                    ]
+                )
+
+    def print_matrix(self) -> None:
+        """Print the latest status of each check on each host as a grid."""
+        matrix = self.matrix()
+        host_width = max(map(len, ["host", *self.hosts]))
+        widths = [max(len(check), *map(len, STATUSES)) for check in self.checks]
+        print(
+            "  ".join(
+                [
+                    "host".ljust(host_width),
+                    *(
+                        check.ljust(width)
+                        for check, width in zip(
+                            self.checks, widths, strict=True
+                        )
+                    ),
+                ]
+            ).rstrip()
+        )
+        for host, statuses in matrix.items():
+            cells = [
+                statuses.get(check, "").ljust(width)
+                for check, width in zip(self.checks, widths, strict=True)
+            ]
+            print("  ".join([host.ljust(host_width), *cells]).rstrip())
+
+    def _worst(
+        self, column: array[int], names: list[str], count: int
+    ) -> list[tuple[str, int, int]]:
+        failed = [0] * len(names)
+        total = [0] * len(names)
+        for row in self.latest():
+            name_id = column[row]
+            total[name_id] += 1
+            if self.status_column[row] in self._failed_ids:
+                failed[name_id] += 1
+        # ties keep the order the names were first seen in
+        ranked = sorted(
+            range(len(names)), key=lambda i: (-failed[i], -total[i])
+        )
+        return [
+            (names[i], failed[i], total[i]) for i in ranked[:count] if failed[i]
+        ]
+
+    @staticmethod
+    def _id(name: str, names: list[str], ids: dict[str, int]) -> int:
+        name_id = ids.get(name)
+        if name_id is None:
+            name_id = ids[name] = len(names)
+            names.append(name)
+        return name_id
@@ -1,48 +1,341 @@
 # Copyright (c) 2026 sharm294
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-"""Inventories define the system to configure."""
+"""
+Inventories define the system to configure.
 
+An inventory is a YAML file or a directory of YAML files. Each file maps group
+names to the group's hosts and data and may include other files or directories
+with a top-level _include list. Keys starting with _ are used so they can't
+clash with the names of groups. Files are validated as they're loaded and the
+merged inventory is cached until any of the files it was loaded from change.
+
+Guests of Proxmox clusters can be added with a top-level _proxmox mapping. The
+listed nodes are queried for their guests when the inventory is made. See
+home_server.proxmox_inventory for its keys.
+
+.. code:: yaml
+
+    _include:
+      - nodes/
+    _proxmox:
+      nodes:
+        - pve1:
+            key: value
+    servers:
+      data:
+        key: value
+      hosts:
+        - host1:
+            key: value
+"""
+
+import hashlib
+import os
+import pickle
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pyinfra.api import Inventory
+from pyinfra.api import Config, Inventory
+
+from home_server.proxmox_inventory import add_proxmox_guests
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+INCLUDE_KEY = "_include"
+PROXMOX_KEY = "_proxmox"
+PROXMOX_KEYS = {"nodes", "data", "domain", "ttl", "include_stopped"}
+YAML_SUFFIXES = {".yaml", ".yml"}
+
+# host name -> host data
+type Hosts = dict[str, dict[str, Any]]
+# group name -> (host names, group data)
+type Groups = dict[str, tuple[list[str], dict[str, Any]]]
+# _proxmox mappings of the inventory
+type ProxmoxSources = list[dict[str, Any]]
 
 
-def make_inventory_from_yaml(path: Path) -> Inventory:
+def default_cache_dir() -> Path:
     """
-    Construct an inventory object from a YAML config file.
+    Get the default directory to store compiled inventories in.
+
+    Returns:
+        Path: Directory for compiled inventories
+
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(cache_home) / "home-server" / "inventory"
+
+
+def validate(inventory_yaml: Any, path: Path) -> list[str]:  # noqa: ANN401
+    """
+    Validate the structure of an inventory file.
 
     Args:
-        path (Path): Path to the yaml config file
+        inventory_yaml (Any): Contents of the file
+        path (Path): Path of the file for error messages
 
     Returns:
-        Inventory: Built Inventory
+        list[str]: Errors found in the file
 
     """
-    with path.open() as f:
-        inventory_yaml: dict[str, Any] = yaml.safe_load(f)
-    names = []
-    groups: dict[str, tuple[list[str], dict[str, str]]] = {}
+    if inventory_yaml is None:
+        return []
+    if not isinstance(inventory_yaml, dict):
+        return [f"{path}: expected a mapping of groups"]
+
+    errors = []
+    includes = inventory_yaml.get(INCLUDE_KEY, [])
+    if not isinstance(includes, list) or not all(
+        isinstance(include, str) for include in includes
+    ):
+        errors.append(f"{path}: {INCLUDE_KEY}: expected a list of paths")
+
     for group_name, group in inventory_yaml.items():
-        hosts = group["hosts"]
-        group_data = group.get("data", {})
-        groups[group_name] = ([], group_data)
-        for host in hosts:
-            host_name, host_data = next(iter(host.items()))
-            groups[group_name][0].append(host_name)
-            names.append((host_name, host_data or {}))
+        where = f"{path}: {group_name}"
+        if group_name == PROXMOX_KEY:
+            errors.extend(_validate_proxmox(group, where))
+        elif group_name != INCLUDE_KEY:
+            errors.extend(_validate_group(group, where))
+    return errors
+
+
+def _validate_group(group: Any, where: str) -> list[str]:  # noqa: ANN401
+    if not isinstance(group, dict):
+        return [f"{where}: expected a mapping with hosts"]
+
+    errors = []
+    unknown = group.keys() - {"hosts", "data"}
+    if unknown:
+        errors.append(f"{where}: unexpected keys {sorted(unknown)}")
+    if not isinstance(group.get("data", {}), dict):
+        errors.append(f"{where}: data: expected a mapping")
+    return errors + _validate_hosts(group.get("hosts"), f"{where}: hosts")
+
+
+def _validate_proxmox(proxmox: Any, where: str) -> list[str]:  # noqa: ANN401
+    if not isinstance(proxmox, dict):
+        return [f"{where}: expected a mapping with nodes"]
+
+    errors = []
+    unknown = proxmox.keys() - PROXMOX_KEYS
+    if unknown:
+        errors.append(f"{where}: unexpected keys {sorted(unknown)}")
+    if not isinstance(proxmox.get("data", {}), dict):
+        errors.append(f"{where}: data: expected a mapping")
+    if not isinstance(proxmox.get("domain", ""), str):
+        errors.append(f"{where}: domain: expected a string")
+    ttl = proxmox.get("ttl", 0)
+    if not isinstance(ttl, int | float) or isinstance(ttl, bool):
+        errors.append(f"{where}: ttl: expected a number of seconds")
+    if not isinstance(proxmox.get("include_stopped", False), bool):
+        errors.append(f"{where}: include_stopped: expected a boolean")
+    return errors + _validate_hosts(proxmox.get("nodes"), f"{where}: nodes")
+
+
+def _validate_hosts(hosts: Any, where: str) -> list[str]:  # noqa: ANN401
+    if not isinstance(hosts, list):
+        return [f"{where}: expected a list"]
+
+    errors = []
+    for i, host in enumerate(hosts):
+        if (
+            not isinstance(host, dict)
+            or len(host) != 1
+            or not isinstance(next(iter(host)), str)
+            or not isinstance(next(iter(host.values())), dict | None)
+        ):
+            errors.append(
+                f"{where}[{i}]: expected a host name mapped to its data"
+            )
+    return errors
+
+
+class InventoryLoader:
+    """Load and merge the files of an inventory."""
+
+    def __init__(self) -> None:
+        """Build an InventoryLoader instance."""
+        self.hosts: Hosts = {}
+        self.groups: Groups = {}
+        self.proxmox: ProxmoxSources = []
+        self.errors: list[str] = []
+        # paths of the files and directories read mapped to their mtimes
+        self.mtimes: dict[str, int] = {}
+        self._loading: set[Path] = set()
+
+    def load(self, path: Path) -> None:
+        """
+        Load an inventory file or directory and anything it includes.
 
-    return Inventory((names, {}), **groups)
+        Args:
+            path (Path): Path to the inventory file or directory
+
+        """
+        path = path.resolve()
+        if not path.exists():
+            self.errors.append(f"Cannot find inventory at {path}")
+            return
+        self.mtimes[str(path)] = path.stat().st_mtime_ns
+        if path.is_dir():
+            for child in sorted(path.iterdir()):
+                if child.suffix in YAML_SUFFIXES and child.is_file():
+                    self.load(child)
+            return
+
+        if path in self._loading:
+            self.errors.append(f"{path}: included recursively")
+            return
+        self._loading.add(path)
+        with path.open() as f:
+            try:
+                inventory_yaml = yaml.load(f, Loader=SafeLoader)
+            except yaml.YAMLError as e:
+                self.errors.append(f"{path}: {e}")
+                inventory_yaml = None
+        errors = validate(inventory_yaml, path)
+        if errors:
+            self.errors.extend(errors)
+        elif inventory_yaml is not None:
+            self._merge(inventory_yaml, path)
+            for include in inventory_yaml.get(INCLUDE_KEY, []):
+                self.load(path.parent / include)
+        self._loading.remove(path)
+
+    def _merge(self, inventory_yaml: dict[str, Any], path: Path) -> None:
+        for group_name, group in inventory_yaml.items():
+            if group_name == PROXMOX_KEY:
+                self.proxmox.append(group)
+                continue
+            if group_name == INCLUDE_KEY:
+                continue
+            names, group_data = self.groups.setdefault(group_name, ([], {}))
+            self._update(group_data, group.get("data") or {}, path, group_name)
+            for host in group["hosts"]:
+                host_name, host_data = next(iter(host.items()))
+                if host_name not in names:
+                    names.append(host_name)
+                self._update(
+                    self.hosts.setdefault(host_name, {}),
+                    host_data or {},
+                    path,
+                    host_name,
+                )
+
+    def _update(
+        self,
+        data: dict[str, Any],
+        new_data: dict[str, Any],
+        path: Path,
+        name: str,
+    ) -> None:
+        for key, value in new_data.items():
+            if key in data and data[key] != value:
+                self.errors.append(
+                    f"{path}: {name}: conflicting values for {key}"
+                )
+            data[key] = value
+
+
+def load_inventory_data(
+    path: Path, cache_dir: Path | None = None
+) -> tuple[Hosts, Groups, ProxmoxSources]:
+    """
+    Load the hosts and groups of an inventory, using a compiled copy if valid.
+
+    Args:
+        path (Path): Path to the inventory file or directory
+        cache_dir (Path | None): Directory to cache compiled inventories in. If
+            None, the inventory isn't cached.
+
+    Raises:
+        ValueError: Raised if the inventory is invalid
+
+    Returns:
+        tuple[Hosts, Groups, ProxmoxSources]: Hosts, groups and Proxmox sources
+            of the inventory
+
+    """
+    cache_path = None
+    if cache_dir is not None:
+        key = hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+        cache_path = cache_dir / f"{key}.pickle"
+        compiled = _load_compiled(cache_path)
+        if compiled is not None:
+            return compiled
+
+    loader = InventoryLoader()
+    loader.load(path)
+    if loader.errors:
+        err_msg = "Invalid inventory:\n" + "\n".join(loader.errors)
+        raise ValueError(err_msg)
+
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with cache_path.open("wb") as f:
+            pickle.dump(
+                (loader.mtimes, loader.hosts, loader.groups, loader.proxmox), f
+            )
+        cache_path.chmod(0o600)
+    return loader.hosts, loader.groups, loader.proxmox
+
+
+def _load_compiled(
+    cache_path: Path,
+) -> tuple[Hosts, Groups, ProxmoxSources] | None:
+    if not cache_path.exists():
+        return None
+    try:
+        with cache_path.open("rb") as f:
+            # the cache is only written by this user to their own cache
+            mtimes, hosts, groups, proxmox = pickle.load(f)  # noqa: S301
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    for path_str, mtime in mtimes.items():
+        try:
+            if Path(path_str).stat().st_mtime_ns != mtime:
+                return None
+        except OSError:
+            return None
+    return hosts, groups, proxmox
+
+
+def make_inventory_from_yaml(
+    path: Path, cache_dir: Path | None = None, config: Config | None = None
+) -> Inventory:
+    """
+    Construct an inventory object from a YAML config file or directory.
+
+    Args:
+        path (Path): Path to the yaml config file or directory
+        cache_dir (Path | None): Directory to cache compiled inventories and
+            Proxmox guests in. If None, nothing is cached.
+        config (Config | None): Config to connect to Proxmox nodes with
+
+    Returns:
+        Inventory: Built Inventory
+
+    """
+    hosts, groups, proxmox = load_inventory_data(path, cache_dir)
+    if proxmox:
+        guests_dir = None if cache_dir is None else cache_dir / "proxmox"
+        add_proxmox_guests(proxmox, hosts, groups, guests_dir, config)
+    return Inventory((list(hosts.items()), {}), **groups)
 
 
-def make_inventory(inventory_path: Path) -> Inventory:
+def make_inventory(
+    inventory_path: Path, config: Config | None = None
+) -> Inventory:
     """
-    Parse a file as an inventory.
+    Parse a file or directory as an inventory.
 
     Args:
         inventory_path (Path): Path to inventory
+        config (Config | None): Config to connect to Proxmox nodes with
 
     Raises:
         ValueError: Raised on error
@@ -52,7 +345,9 @@ def make_inventory(inventory_path: Path) -> Inventory:
 
     """
     if inventory_path.exists():
-        inventory = make_inventory_from_yaml(inventory_path)
+        inventory = make_inventory_from_yaml(
+            inventory_path, default_cache_dir(), config
+        )
     else:
         err_msg = f"Cannot find inventory at {inventory_path}"
         raise ValueError(err_msg)
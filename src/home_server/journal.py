@@ -0,0 +1,226 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Record the progress of runs so failed runs can be resumed.
+
+Each op that succeeds on a host is appended to the run's journal as soon as it
+completes and hosts are marked complete once all their ops succeed. Resuming a
+run skips the complete hosts entirely and the ops that already succeeded on the
+rest so only failed and unreached ops run again.
+
+pyinfra identifies ops by their position so ops are recorded by their names,
+arguments and how many identical ops came before them on the host instead.
+pyinfra combines the arguments of an op across hosts so ops whose arguments
+differ between hosts may run again if fewer hosts are resumed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+from home_server.callbacks import OpCompleteCallback
+
+if TYPE_CHECKING:
+    import argparse
+    from typing import TextIO
+
+    from pyinfra.api import Host, State
+    from pyinfra.api.operation import OperationMeta
+
+
+def default_journal_dir() -> Path:
+    """
+    Get the default directory to store run journals in.
+
+    Returns:
+        Path: Directory for run journals
+
+    """
+    state_home = os.environ.get(
+        "XDG_STATE_HOME", Path.home() / ".local" / "state"
+    )
+    return Path(state_home) / "home-server" / "journals"
+
+
+def make_journal(args: argparse.Namespace, *parts: object) -> RunJournal:
+    """
+    Build the journal of a run from the CLI arguments.
+
+    Runs of the same command on the same inventory share a journal if the
+    parts that decide what they do match.
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments
+        parts (object): Options that change the ops of the run
+
+    Returns:
+        RunJournal: Journal of the run
+
+    """
+    inventory = Path(args.inventory)
+    if inventory.exists():
+        inventory = inventory.absolute()
+    name = " ".join([args.command, str(inventory), *map(str, parts)])
+    digest = hashlib.sha256(name.encode()).hexdigest()[:16]
+    journal_dir = args.journal_dir or default_journal_dir()
+    return RunJournal(journal_dir / f"{digest}.jsonl", name, resume=args.resume)
+
+
+class RunJournal(OpCompleteCallback):
+    """Append the ops that succeed on each host to a JSON Lines file."""
+
+    def __init__(self, path: Path, name: str, *, resume: bool) -> None:
+        """
+        Build a RunJournal instance.
+
+        Args:
+            path (Path): Path of the journal
+            name (str): Description of the run the journal is for
+            resume (bool): Whether to skip what the journal has recorded as
+                complete. Otherwise, the journal is started over.
+
+        """
+        super().__init__()
+        self.path = path
+        self.name = name
+        self.resume = resume
+        self.complete_hosts: set[str] = set()
+        # host name -> keys of the ops that succeeded
+        self.complete_ops: dict[str, set[str]] = {}
+        # host name -> op -> key of the op
+        self._keys: dict[str, dict[OperationMeta, str]] = {}
+        self._file: TextIO | None = None
+        if resume:
+            self._load()
+
+    def install(self, state: State) -> None:
+        """
+        Limit the state to the hosts that aren't complete and track its ops.
+
+        If the run isn't resumed, the previous run's journal is removed so a
+        run that fails before any op succeeds can't be resumed from it.
+
+        Args:
+            state (State): State to install the journal in
+
+        """
+        state.add_callback_handler(self)
+        if not self.resume:
+            self.path.unlink(missing_ok=True)
+        if self.complete_hosts:
+            state.limit_hosts = [
+                host
+                for host in state.inventory
+                if host.name not in self.complete_hosts
+            ]
+
+    def track(self, state: State) -> int:
+        """
+        Track the planned ops of hosts to record them as they succeed.
+
+        Ops that a resumed journal recorded as successful are removed from the
+        planned ops instead.
+
+        Args:
+            state (State): State with the planned ops
+
+        Returns:
+            int: Number of ops removed across all hosts
+
+        """
+        skipped = 0
+        for host in state.inventory.get_active_hosts():
+            host_keys = self._keys.setdefault(host.name, {})
+            complete = self.complete_ops.get(host.name, set())
+            counts: dict[str, int] = {}
+            for op_hash in host.op_hash_order:
+                op_data = state.ops[host].get(op_hash)
+                if op_data is None:
+                    continue
+                op_meta = state.get_op_meta(op_hash)
+                # pyinfra repeats the arguments of an op for each host
+                identity = json.dumps(
+                    [sorted(op_meta.names), sorted(set(op_meta.args))]
+                )
+                count = counts.get(identity, 0)
+                counts[identity] = count + 1
+                key = hashlib.sha256(
+                    f"{count}:{identity}".encode()
+                ).hexdigest()[:16]
+                if key in complete:
+                    del state.ops[host][op_hash]
+                    skipped += 1
+                else:
+                    host_keys[op_data.operation_meta] = key
+        return skipped
+
+    @override
+    def operation_host_complete(
+        self,
+        state: State,
+        host: Host,
+        op_meta: OperationMeta,
+        duration: float,
+    ) -> None:
+        key = self._keys.get(host.name, {}).get(op_meta)
+        if key is not None and op_meta.did_succeed():
+            self._write({"host": host.name, "op": key})
+
+    def close(self, state: State) -> None:
+        """
+        Mark the hosts whose ops all succeeded as complete.
+
+        Args:
+            state (State): State that ran the ops
+
+        """
+        self.flush(state)
+        for host in state.inventory:
+            if host.name not in self._keys or host in state.failed_hosts:
+                continue
+            if all(
+                op_data.operation_meta.is_complete()
+                and op_data.operation_meta.did_succeed()
+                for op_data in state.ops[host].values()
+            ):
+                self._write({"host": host.name, "complete": True})
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, record: dict[str, object]) -> None:
+        file = self._file
+        if file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # a resumed run adds to the journal of the run it resumes
+            if self.complete_hosts or self.complete_ops:
+                file = self.path.open("a")
+            else:
+                file = self.path.open("w")
+                file.write(json.dumps({"name": self.name}) + "\n")
+            self._file = file
+        file.write(json.dumps(record) + "\n")
+        file.flush()
+
+    def _load(self) -> None:
+        try:
+            lines = self.path.read_text().splitlines()
+        except OSError:
+            return
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # the last line may be cut short if the run was killed
+                continue
+            if record.get("complete"):
+                self.complete_hosts.add(record["host"])
+            elif "op" in record:
+                self.complete_ops.setdefault(record["host"], set()).add(
+                    record["op"]
+                )
@@ -6,18 +6,33 @@
 import argparse
 import logging
 
-from home_server import configure, hardening
+from home_server import configure, hardening, summarize, watch
 
 
-def main() -> None:
-    """Entry point for home_server."""
-    logging.basicConfig(level=logging.INFO)
+def make_parser() -> argparse.ArgumentParser:
+    """
+    Build the parser for the CLI.
+
+    Returns:
+        argparse.ArgumentParser: CLI parser
+
+    """
     parser = argparse.ArgumentParser(description="Home Server Management Tool")
 
     subparser = parser.add_subparsers(dest="command", required=True)
 
     hardening.configure_parser(subparser)
     configure.configure_parser(subparser)
+    watch.configure_parser(subparser)
+    summarize.configure_parser(subparser)
+
+    return parser
+
+
+def main() -> None:
+    """Entry point for home_server."""
+    logging.basicConfig(level=logging.INFO)
+    parser = make_parser()
 
     args = parser.parse_args()
 
@@ -0,0 +1,84 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Define operations to manage modprobe config files.
+
+Lines are only ever added to a config so modules blacklisted by other runs or
+by hand stay blacklisted.
+"""
+
+import io
+from collections.abc import Generator
+
+from pyinfra import host
+from pyinfra.api import operation
+from pyinfra.api.command import PyinfraCommand
+from pyinfra.facts.files import FileContents
+from pyinfra.operations import files
+
+
+def blacklist_lines(modules: list[str]) -> list[str]:
+    """
+    Get the modprobe config lines that remove and blacklist kernel modules.
+
+    Args:
+        modules (list[str]): Names of the kernel modules
+
+    Returns:
+        list[str]: Config lines in the order of the modules
+
+    """
+    lines = []
+    for module in modules:
+        lines.append(f"install {module} /bin/false")
+        lines.append(f"blacklist {module}")
+    return lines
+
+
+def merge_lines(existing: list[str] | None, lines: list[str]) -> list[str]:
+    """
+    Add lines to a config that doesn't have them yet.
+
+    Args:
+        existing (list[str] | None): Lines of the config or None if it doesn't
+            exist
+        lines (list[str]): Lines the config must have
+
+    Returns:
+        list[str]: Lines of the config with the missing lines at the end
+
+    """
+    existing = existing or []
+    present = {line.strip() for line in existing}
+    missing = [line for line in dict.fromkeys(lines) if line not in present]
+    return existing + missing
+
+
+@operation()  # type: ignore[untyped-decorator]
+def blacklist(modules: list[str], path: str) -> Generator[PyinfraCommand | str]:
+    """
+    Remove and blacklist kernel modules in a modprobe config.
+
+    Lines that are missing are added after the existing ones. Nothing in the
+    config is removed.
+
+    Args:
+        modules (list[str]): Names of the kernel modules
+        path (str): Path of the modprobe config
+
+    Yields:
+        PyinfraCommand | str: Commands to run
+
+    """
+    existing = host.get_fact(FileContents, path=path)
+    merged = merge_lines(existing, blacklist_lines(modules))
+    if existing is not None and len(merged) == len(existing):
+        host.noop(f"The modules are already blacklisted in {path}")
+        return
+
+    yield from files.put._inner(  # noqa: SLF001
+        src=io.StringIO("\n".join(merged) + "\n"),
+        dest=path,
+        mode="644",
+    )
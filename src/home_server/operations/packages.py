@@ -0,0 +1,127 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Define operations to manage apt packages as one transaction per host.
+
+Packages to install and remove are passed to a single apt-get call so apt
+resolves them together and the package lists are only updated once. Hosts can
+download packages through a caching proxy such as apt-cacher-ng by setting
+apt_proxy in their inventory data e.g. http://cache.lan:3142.
+"""
+
+import io
+from collections.abc import Generator
+
+from pyinfra import host
+from pyinfra.api import operation
+from pyinfra.api.command import PyinfraCommand
+from pyinfra.facts.apt import noninteractive_apt
+from pyinfra.facts.deb import DebPackages
+from pyinfra.operations import files
+
+PROXY_KEY = "apt_proxy"
+PROXY_CONF = "/etc/apt/apt.conf.d/01proxy"
+
+
+def get_proxy() -> str | None:
+    """
+    Get the apt proxy of the current host from its inventory data.
+
+    Returns:
+        str | None: URL of the proxy or None if it isn't set
+
+    """
+    proxy: str | None = host.data.get(PROXY_KEY)
+    return proxy
+
+
+def pending(
+    installed: dict[str, set[str]], install: list[str], remove: list[str]
+) -> tuple[list[str], list[str]]:
+    """
+    Get the packages that need to be installed and removed.
+
+    Args:
+        installed (dict[str, set[str]]): Installed packages mapped to their
+            versions
+        install (list[str]): Packages to install. Versions can be pinned as
+            name=version.
+        remove (list[str]): Packages to remove
+
+    Returns:
+        tuple[list[str], list[str]]: Packages to install and to remove
+
+    """
+    missing = []
+    for package in install:
+        name, _, version = package.partition("=")
+        if name not in installed or (
+            version and version not in installed[name]
+        ):
+            missing.append(package)
+    extra = [package for package in remove if package in installed]
+    return missing, extra
+
+
+@operation()  # type: ignore[untyped-decorator]
+def transaction(
+    install: list[str] | None = None,
+    remove: list[str] | None = None,
+    *,
+    update: bool = True,
+) -> Generator[PyinfraCommand | str]:
+    """
+    Install and remove packages in one apt transaction.
+
+    Only packages that aren't already in the requested state are passed to apt.
+
+    Args:
+        install (list[str] | None): Packages to install
+        remove (list[str] | None): Packages to remove
+        update (bool): Whether to update the package lists first if anything
+            needs to change
+
+    Yields:
+        PyinfraCommand | str: Commands to run
+
+    """
+    missing, extra = pending(
+        host.get_fact(DebPackages), install or [], remove or []
+    )
+    if not missing and not extra:
+        host.noop("The packages are already in place")
+        return
+
+    if update:
+        yield noninteractive_apt("update")
+    # apt-get install removes packages suffixed with -
+    yield noninteractive_apt(
+        " ".join(["install", *missing, *(f"{package}-" for package in extra)])
+    )
+
+
+@operation()  # type: ignore[untyped-decorator]
+def proxy() -> Generator[PyinfraCommand | str]:
+    """
+    Download packages through the apt proxy set in the host's data.
+
+    HTTPS repositories are fetched directly since they can't be cached. If the
+    host has no proxy, any proxy set before is removed.
+
+    Yields:
+        PyinfraCommand | str: Commands to run
+
+    """
+    url = get_proxy()
+    if url is None:
+        yield from files.file._inner(path=PROXY_CONF, present=False)  # noqa: SLF001
+        return
+
+    yield from files.put._inner(  # noqa: SLF001
+        src=io.StringIO(
+            f'Acquire::http::Proxy "{url}";\nAcquire::https::Proxy "DIRECT";\n'
+        ),
+        dest=PROXY_CONF,
+        mode="644",
+    )
@@ -0,0 +1,275 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Define operations to set up a Proxmox VE host after installation.
+
+These replace the post-install and microcode scripts from the Proxmox VE
+community scripts. Each one only runs commands for what isn't already in place.
+"""
+
+import io
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import yaml
+from pyinfra import host
+from pyinfra.api import operation
+from pyinfra.api.command import PyinfraCommand
+from pyinfra.api.exceptions import OperationError
+from pyinfra.facts.files import File, FindInFile
+from pyinfra.operations import files, systemd
+
+from home_server.facts.hardware import CpuVendor
+from home_server.operations import packages
+
+SOURCES_DIR = "/etc/apt/sources.list.d"
+DEBIAN_KEYRING = "/usr/share/keyrings/debian-archive-keyring.gpg"
+PROXMOX_KEYRING = "/usr/share/keyrings/proxmox-archive-keyring.gpg"
+# repository files that the Proxmox VE installer and older versions add
+ENTERPRISE_SOURCES = [
+    f"{SOURCES_DIR}/pve-enterprise.sources",
+    f"{SOURCES_DIR}/pve-enterprise.list",
+    f"{SOURCES_DIR}/pve-install-repo.list",
+    f"{SOURCES_DIR}/ceph.list",
+    f"{SOURCES_DIR}/pvetest-for-beta.list",
+]
+
+NAG_SCRIPT = (
+    Path(__file__).parents[1]
+    / "configure"
+    / "proxmox_community_scripts"
+    / "pve-remove-nag.sh"
+)
+NAG_SCRIPT_DEST = "/usr/local/bin/pve-remove-nag.sh"
+NAG_HOOK = "/etc/apt/apt.conf.d/no-nag-script"
+WEB_JS = "/usr/share/javascript/proxmox-widget-toolkit/proxmoxlib.js"
+MOBILE_TPL = "/usr/share/pve-yew-mobile-gui/index.html.tpl"
+MOBILE_MARKER = "<!-- MANAGED BLOCK FOR MOBILE NAG -->"
+SNIPPETS_DIR = "/var/lib/vz/snippets"
+
+MICROCODE_PACKAGES = {
+    "GenuineIntel": ["intel-microcode", "iucode-tool"],
+    "AuthenticAMD": ["amd64-microcode"],
+}
+
+
+def deb822_source(
+    uris: str,
+    suites: str,
+    components: str,
+    keyring: str,
+    *,
+    enabled: bool = True,
+) -> str:
+    """
+    Render an apt source in the deb822 format.
+
+    Args:
+        uris (str): URIs of the repository
+        suites (str): Suites to use from the repository
+        components (str): Components to use from the suites
+        keyring (str): Path of the keyring that signs the repository
+        enabled (bool): Whether apt uses the source
+
+    Returns:
+        str: Stanza of the source
+
+    """
+    lines = [
+        "Types: deb",
+        f"URIs: {uris}",
+        f"Suites: {suites}",
+        f"Components: {components}",
+        f"Signed-By: {keyring}",
+    ]
+    if not enabled:
+        lines.append("Enabled: false")
+    return "\n".join(lines) + "\n"
+
+
+@operation()  # type: ignore[untyped-decorator]
+def apt_sources(suite: str = "trixie") -> Generator[PyinfraCommand | str]:
+    """
+    Use the Debian and Proxmox VE no-subscription repositories.
+
+    The enterprise repositories are removed and any legacy entries in
+    /etc/apt/sources.list are commented out. The test repository is added but
+    disabled.
+
+    Args:
+        suite (str): Debian suite the host runs
+
+    Yields:
+        PyinfraCommand | str: Commands to run
+
+    """
+    sources = {
+        "debian.sources": "\n".join(
+            [
+                deb822_source(
+                    "http://deb.debian.org/debian",
+                    f"{suite} {suite}-updates",
+                    "main contrib non-free-firmware",
+                    DEBIAN_KEYRING,
+                ),
+                deb822_source(
+                    "http://security.debian.org/debian-security",
+                    f"{suite}-security",
+                    "main contrib non-free-firmware",
+                    DEBIAN_KEYRING,
+                ),
+            ]
+        ),
+        "proxmox.sources": deb822_source(
+            "http://download.proxmox.com/debian/pve",
+            suite,
+            "pve-no-subscription",
+            PROXMOX_KEYRING,
+        ),
+        "ceph.sources": deb822_source(
+            "http://download.proxmox.com/debian/ceph-squid",
+            suite,
+            "no-subscription",
+            PROXMOX_KEYRING,
+        ),
+        "pve-test.sources": deb822_source(
+            "http://download.proxmox.com/debian/pve",
+            suite,
+            "pve-test",
+            PROXMOX_KEYRING,
+            enabled=False,
+        ),
+    }
+    for name, content in sources.items():
+        yield from files.put._inner(  # noqa: SLF001
+            src=io.StringIO(content), dest=f"{SOURCES_DIR}/{name}", mode="644"
+        )
+
+    for path in ENTERPRISE_SOURCES:
+        yield from files.file._inner(path=path, present=False)  # noqa: SLF001
+
+    if host.get_fact(File, path="/etc/apt/sources.list"):
+        yield from files.replace._inner(  # noqa: SLF001
+            path="/etc/apt/sources.list", text="^deb ", replace="# deb "
+        )
+
+
+@operation()  # type: ignore[untyped-decorator]
+def no_subscription_nag() -> Generator[PyinfraCommand | str]:
+    """
+    Remove the subscription nag from the web and mobile UIs.
+
+    A script that patches the UIs is installed as an apt hook so the patch is
+    reapplied after upgrades. It's only run now if the UIs aren't patched.
+
+    Yields:
+        PyinfraCommand | str: Commands to run
+
+    """
+    yield from files.put._inner(  # noqa: SLF001
+        src=str(NAG_SCRIPT), dest=NAG_SCRIPT_DEST, mode="755"
+    )
+    yield from files.put._inner(  # noqa: SLF001
+        src=io.StringIO(f'DPkg::Post-Invoke {{ "{NAG_SCRIPT_DEST}"; }};\n'),
+        dest=NAG_HOOK,
+        mode="644",
+    )
+
+    # missing files are left alone by the script so they count as patched
+    web_patched = host.get_fact(
+        FindInFile, path=WEB_JS, pattern="NoMoreNagging"
+    )
+    mobile_patched = host.get_fact(
+        FindInFile, path=MOBILE_TPL, pattern=MOBILE_MARKER
+    )
+    if web_patched == [] or mobile_patched == []:
+        yield NAG_SCRIPT_DEST
+    else:
+        host.noop("The subscription nag is already removed")
+
+
+@operation()  # type: ignore[untyped-decorator]
+def disable_ha() -> Generator[PyinfraCommand | str]:
+    """
+    Disable the high availability services that a single node doesn't need.
+
+    Yields:
+        PyinfraCommand | str: Commands to run
+
+    """
+    for service in ["pve-ha-lrm", "pve-ha-crm", "corosync"]:
+        yield from systemd.service._inner(  # noqa: SLF001
+            service=service, running=False, enabled=False
+        )
+
+
+def microcode_packages() -> list[str]:
+    """
+    Get the microcode packages for the current host's CPU.
+
+    The packages come from Debian's non-free-firmware component which
+    apt_sources enables. A reboot is needed to load new microcode.
+
+    Raises:
+        OperationError: Raised if the CPU vendor isn't supported
+
+    Returns:
+        list[str]: Packages to install
+
+    """
+    vendor = host.get_fact(CpuVendor)
+    if vendor not in MICROCODE_PACKAGES:
+        err_msg = f"No microcode packages for CPU vendor {vendor}"
+        raise OperationError(err_msg)
+    return MICROCODE_PACKAGES[vendor]
+
+
+@operation()  # type: ignore[untyped-decorator]
+def host_packages(
+    install: list[str], remove: list[str]
+) -> Generator[PyinfraCommand | str]:
+    """
+    Install and remove packages with the host's microcode in one transaction.
+
+    Args:
+        install (list[str]): Packages to install
+        remove (list[str]): Packages to remove
+
+    Yields:
+        PyinfraCommand | str: Commands to run
+
+    """
+    yield from packages.transaction._inner(  # noqa: SLF001
+        install=[*install, *microcode_packages()], remove=remove
+    )
+
+
+@operation()  # type: ignore[untyped-decorator]
+def cloudinit_snippet(
+    name: str, config: dict[str, Any]
+) -> Generator[PyinfraCommand | str]:
+    """
+    Add a cloud-init config as a snippet for guests to use.
+
+    If the host has an apt proxy, guests are configured to use it too.
+
+    Args:
+        name (str): File name of the snippet
+        config (dict[str, Any]): cloud-init config
+
+    Yields:
+        PyinfraCommand | str: Commands to run
+
+    """
+    apt_proxy = packages.get_proxy()
+    if apt_proxy is not None:
+        config = {
+            **config,
+            "apt": {**config.get("apt", {}), "proxy": apt_proxy},
+        }
+    content = "#cloud-config\n" + yaml.safe_dump(config, sort_keys=False)
+    yield from files.put._inner(  # noqa: SLF001
+        src=io.StringIO(content), dest=f"{SNIPPETS_DIR}/{name}", mode="644"
+    )
@@ -36,6 +36,95 @@ def kwargs_to_flags(**kwargs: Any) -> str:
     return " ".join(flags)
 
 
+def index_vms(
+    vms: list[dict[str, Any]],
+) -> tuple[dict[int, dict[str, Any]], dict[str, dict[str, Any]]]:
+    """
+    Index VMs by ID and by name.
+
+    Args:
+        vms (list[dict[str, Any]]): VMs as returned by the qm.List fact
+
+    Returns:
+        tuple[dict[int, dict[str, Any]], dict[str, dict[str, Any]]]: VMs keyed
+            by ID and VMs keyed by name
+
+    """
+    by_id = {vm["id"]: vm for vm in vms}
+    by_name = {vm["name"]: vm for vm in vms}
+    return by_id, by_name
+
+
+def vm_exists(
+    vm_id: int,
+    vm_name: str,
+    by_id: dict[int, dict[str, Any]],
+    by_name: dict[str, dict[str, Any]],
+) -> bool:
+    """
+    Determine if a VM exists.
+
+    Args:
+        vm_id (int): ID of the VM
+        vm_name (str): Name of the VM
+        by_id (dict[int, dict[str, Any]]): Existing VMs keyed by ID
+        by_name (dict[str, dict[str, Any]]): Existing VMs keyed by name
+
+    Raises:
+        OperationError: Raised if a different VM has the ID or name
+
+    Returns:
+        bool: Whether a VM with the ID and name exists
+
+    """
+    vm = by_id.get(vm_id)
+    if vm is not None and vm["name"] == vm_name:
+        return True
+    if vm is not None:
+        # if a VM exists that matches one field only, raise an error
+        err_msg = f"VM {vm['name']} already exists with ID {vm_id}"
+        raise OperationError(err_msg)
+    vm = by_name.get(vm_name)
+    if vm is not None:
+        err_msg = f"VM {vm_name} already exists with ID {vm['id']}"
+        raise OperationError(err_msg)
+    return False
+
+
+def create_command(
+    vm_id: int,
+    vm_name: str,
+    by_id: dict[int, dict[str, Any]],
+    by_name: dict[str, dict[str, Any]],
+    **kwargs: Any,
+) -> str | None:
+    """
+    Get the command to create a VM if it doesn't exist.
+
+    Args:
+        vm_id (int): ID of the VM
+        vm_name (str): Name of the VM
+        by_id (dict[int, dict[str, Any]]): Existing VMs keyed by ID
+        by_name (dict[str, dict[str, Any]]): Existing VMs keyed by name
+        kwargs (Any): Flags to "qm create"
+
+    Returns:
+        str | None: Command to create the VM or None if it already exists
+
+    """
+    if vm_exists(vm_id, vm_name, by_id, by_name):
+        host.noop(f"VM {vm_name} with ID {vm_id} already exists")
+        return None
+    flags = kwargs_to_flags(**kwargs)
+    return f"qm create {vm_id} --name {shlex.quote(vm_name)} {flags}".rstrip()
+
+
+def _check_proxmox() -> None:
+    if not host.get_fact(Which, command="pveversion"):
+        err_msg = "Cannot run on a non-proxmox system"
+        raise OperationError(err_msg)
+
+
 @operation()  # type: ignore[untyped-decorator]
 def create(vm_id: int, vm_name: str, **kwargs: Any) -> Generator[str]:
     """
@@ -46,6 +135,29 @@ def create(vm_id: int, vm_name: str, **kwargs: Any) -> Generator[str]:
         vm_name (str): Name of the VM
         kwargs (Any): Flags to "qm create"
 
+    Yields:
+        str | None: A string denoting the command or None for no-ops
+
+    """
+    _check_proxmox()
+    by_id, by_name = index_vms(host.get_fact(qm.List))
+    command = create_command(vm_id, vm_name, by_id, by_name, **kwargs)
+    if command is not None:
+        yield command
+
+
+@operation()  # type: ignore[untyped-decorator]
+def ensure_vms(vms: list[dict[str, Any]]) -> Generator[str]:
+    """
+    Create any VMs that don't exist.
+
+    The existing VMs are fetched once and indexed so ensuring many VMs on a
+    node only needs one fact.
+
+    Args:
+        vms (list[dict[str, Any]]): VMs to create. Each has an "id" and a
+            "name". Any other keys are passed as flags to "qm create".
+
     Raises:
         OperationError: Raised on errors
 
@@ -53,18 +165,117 @@ def create(vm_id: int, vm_name: str, **kwargs: Any) -> Generator[str]:
         str | None: A string denoting the command or None for no-ops
 
     """
-    if not host.get_fact(Which, command="pveversion"):
-        err_msg = "Cannot run on a non-proxmox system"
-        raise OperationError(err_msg)
+    _check_proxmox()
+    by_id, by_name = index_vms(host.get_fact(qm.List))
+    for spec in vms:
+        flags = dict(spec)
+        vm_id = flags.pop("id")
+        vm_name = flags.pop("name")
+        command = create_command(vm_id, vm_name, by_id, by_name, **flags)
+        if command is None:
+            continue
+        # later specs must not reuse the ID or name of a VM created here
+        vm = {"id": vm_id, "name": vm_name}
+        by_id[vm_id] = vm
+        by_name[vm_name] = vm
+        yield command
+
+
+@operation()  # type: ignore[untyped-decorator]
+def cloudinit_template(  # noqa: PLR0913
+    vm_id: int,
+    vm_name: str,
+    image_url: str,
+    checksums_url: str,
+    *,
+    storage: str,
+    disk_options: str = "",
+    **kwargs: Any,
+) -> Generator[str]:
+    """
+    Create a VM template from a cloud image if it doesn't exist.
+
+    The image is downloaded, verified against the SHA512 checksums published
+    with it and imported as the first SCSI disk when the VM is created.
+
+    Args:
+        vm_id (int): ID of the template
+        vm_name (str): Name of the template
+        image_url (str): URL of the cloud image
+        checksums_url (str): URL of the SHA512SUMS file listing the image
+        storage (str): Storage to import the image to
+        disk_options (str): Options of the imported disk e.g. 'iothread=1'
+        kwargs (Any): Flags to "qm create"
+
+    Yields:
+        str | None: A string denoting the command or None for no-ops
+
+    """
+    _check_proxmox()
+    by_id, by_name = index_vms(host.get_fact(qm.List))
+    if vm_exists(vm_id, vm_name, by_id, by_name):
+        host.noop(f"Template {vm_name} with ID {vm_id} already exists")
+        return
+
+    image_name = image_url.rsplit("/", 1)[-1]
+    image = f"/tmp/{image_name}"  # noqa: S108
+    scsi0 = ",".join(
+        option
+        for option in [f"{storage}:0", f"import-from={image}", disk_options]
+        if option
+    )
+    yield f"wget -q -O {shlex.quote(image)} {shlex.quote(image_url)}"
+    yield (
+        f"cd /tmp && wget -qO- {shlex.quote(checksums_url)}"
+        f" | awk -v image={shlex.quote(image_name)} '$2 == image'"
+        " | sha512sum -c -"
+    )
+    yield (
+        f"qm create {vm_id} --name {shlex.quote(vm_name)} "
+        f"{kwargs_to_flags(scsi0=scsi0, **kwargs)}"
+    )
+    yield f"qm template {vm_id}"
+    yield f"rm -f {shlex.quote(image)}"
+
+
+@operation()  # type: ignore[untyped-decorator]
+def clone(
+    template_id: int,
+    vm_id: int,
+    vm_name: str,
+    resize: dict[str, str] | None = None,
+    *,
+    start: bool = False,
+    **kwargs: Any,
+) -> Generator[str]:
+    """
+    Create a VM as a full clone of a template if it doesn't exist.
+
+    Args:
+        template_id (int): ID of the template to clone
+        vm_id (int): ID of the VM
+        vm_name (str): Name of the VM
+        resize (dict[str, str] | None): Disks mapped to the size to grow them
+            to e.g. {"scsi0": "50G"}
+        start (bool): Whether to start the VM once it's created
+        kwargs (Any): Flags to "qm set" once it's cloned
+
+    Yields:
+        str | None: A string denoting the command or None for no-ops
+
+    """
+    _check_proxmox()
+    by_id, by_name = index_vms(host.get_fact(qm.List))
+    if vm_exists(vm_id, vm_name, by_id, by_name):
+        host.noop(f"VM {vm_name} with ID {vm_id} already exists")
+        return
 
-    vms = host.get_fact(qm.List)
-    for vm in vms:
-        if vm["id"] == vm_id and vm["name"] == vm_name:
-            host.noop(f"VM {vm_name} with ID {vm_id} already exists")
-            return
-        if vm["name"] == vm_name or vm["id"] == vm_id:
-            # if a VM exists that matches one field only, raise an error
-            err_msg = f"VM {vm_name} already exists with ID {vm['id']}"
-            raise OperationError(err_msg)
-    flags = {kwargs_to_flags(**kwargs)}
-    yield f"qm create {vm_id} --name {shlex.quote(vm_name)} {flags}"
+    yield (
+        f"qm clone {template_id} {vm_id} --name {shlex.quote(vm_name)} --full 1"
+    )
+    if kwargs:
+        yield f"qm set {vm_id} {kwargs_to_flags(**kwargs)}"
+    for disk, size in (resize or {}).items():
+        yield f"qm resize {vm_id} {shlex.quote(disk)} {shlex.quote(size)}"
+    if start:
+        yield f"qm start {vm_id}"
@@ -0,0 +1,206 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Add the guests of Proxmox clusters to an inventory.
+
+The _proxmox mapping of an inventory has these keys:
+
+- nodes: Proxmox nodes to query in the same form as a group's hosts
+- data: Host data to set on every guest
+- domain: Domain appended to guest names to get their host names
+- ttl: Seconds to reuse the guests of a node between runs. Defaults to 300.
+- include_stopped: Add guests that aren't running. Defaults to false.
+
+Each node is queried once for all the guests of its cluster. Guests are added
+with data about where they run and grouped as proxmox_guests and by their
+node, type, status and tags e.g. proxmox_node_pve1, proxmox_qemu,
+proxmox_running and proxmox_tag_web.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING
+
+from pyinfra.api import Config, Inventory, State
+from pyinfra.api.connect import connect_all, disconnect_all
+from pyinfra.api.facts import get_facts
+
+from home_server.facts.proxmox import ClusterGuests
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+DEFAULT_TTL = 300
+
+
+def add_proxmox_guests(
+    sources: list[dict[str, Any]],
+    hosts: dict[str, dict[str, Any]],
+    groups: dict[str, tuple[list[str], dict[str, Any]]],
+    cache_dir: Path | None,
+    config: Config | None = None,
+) -> None:
+    """
+    Add the guests of Proxmox nodes to the hosts and groups of an inventory.
+
+    Data set on a guest's host in the inventory files takes precedence over the
+    data from Proxmox.
+
+    Args:
+        sources (list[dict[str, Any]]): _proxmox mappings of the inventory
+        hosts (dict[str, dict[str, Any]]): Host names mapped to their data
+        groups (dict[str, tuple[list[str], dict[str, Any]]]): Group names
+            mapped to their host names and data
+        cache_dir (Path | None): Directory to cache guests in. If None, the
+            nodes are always queried.
+        config (Config | None): Config to connect to the nodes with
+
+    """
+    for source in sources:
+        nodes = {
+            node_name: node_data or {}
+            for node in source["nodes"]
+            for node_name, node_data in node.items()
+        }
+        domain = source.get("domain")
+        seen: set[tuple[str, int]] = set()
+        guests = get_guests(
+            nodes, source.get("ttl", DEFAULT_TTL), cache_dir, config
+        )
+        for guest in (guest for node in guests.values() for guest in node):
+            # nodes of the same cluster return the same guests
+            key = (guest["node"], guest["id"])
+            if key in seen:
+                continue
+            seen.add(key)
+            if guest["status"] != "running" and not source.get(
+                "include_stopped", False
+            ):
+                continue
+
+            host_name = (
+                guest["name"] if not domain else f"{guest['name']}.{domain}"
+            )
+            hosts[host_name] = {
+                **source.get("data", {}),
+                "proxmox_node": guest["node"],
+                "proxmox_id": guest["id"],
+                "proxmox_type": guest["type"],
+                "proxmox_status": guest["status"],
+                "proxmox_tags": guest["tags"],
+                **hosts.get(host_name, {}),
+            }
+            group_names = [
+                "proxmox_guests",
+                f"proxmox_node_{guest['node']}",
+                f"proxmox_{guest['type']}",
+                f"proxmox_{guest['status']}",
+                *(f"proxmox_tag_{tag}" for tag in guest["tags"]),
+            ]
+            for group_name in group_names:
+                names, _ = groups.setdefault(group_name, ([], {}))
+                if host_name not in names:
+                    names.append(host_name)
+
+
+def get_guests(
+    nodes: dict[str, dict[str, Any]],
+    ttl: float,
+    cache_dir: Path | None,
+    config: Config | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    Get the guests of the clusters of Proxmox nodes.
+
+    Nodes whose guests were cached within the TTL aren't queried again.
+
+    Args:
+        nodes (dict[str, dict[str, Any]]): Node names mapped to their data
+        ttl (float): Seconds to reuse cached guests for
+        cache_dir (Path | None): Directory to cache guests in
+        config (Config | None): Config to connect to the nodes with
+
+    Returns:
+        dict[str, list[dict[str, Any]]]: Node names mapped to the guests of
+            their cluster
+
+    """
+    guests: dict[str, list[dict[str, Any]]] = {}
+    stale: dict[str, dict[str, Any]] = {}
+    for node_name, node_data in nodes.items():
+        cached = None if cache_dir is None else _load(cache_dir, node_name, ttl)
+        if cached is None:
+            stale[node_name] = node_data
+        else:
+            guests[node_name] = cached
+
+    if stale:
+        for node_name, node_guests in query_nodes(stale, config).items():
+            guests[node_name] = node_guests
+            if cache_dir is not None:
+                _save(cache_dir, node_name, node_guests)
+    return {node_name: guests[node_name] for node_name in nodes}
+
+
+def query_nodes(
+    nodes: dict[str, dict[str, Any]], config: Config | None = None
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    Connect to Proxmox nodes and get the guests of their clusters.
+
+    Args:
+        nodes (dict[str, dict[str, Any]]): Node names mapped to their data
+        config (Config | None): Config to connect to the nodes with e.g. the
+            connect timeout of the run. If None, pyinfra's defaults are used.
+
+    Raises:
+        ValueError: Raised if a node can't be queried
+
+    Returns:
+        dict[str, list[dict[str, Any]]]: Node names mapped to the guests of
+            their cluster
+
+    """
+    state = State(Inventory((list(nodes.items()), {})), config or Config())
+    connect_all(state)
+    try:
+        facts = get_facts(state, ClusterGuests)
+    finally:
+        disconnect_all(state)
+
+    failed = sorted(host.name for host in state.failed_hosts)
+    if failed:
+        err_msg = f"Cannot query Proxmox nodes: {', '.join(failed)}"
+        raise ValueError(err_msg)
+    return {host.name: value for host, value in facts.items()}
+
+
+def _path(cache_dir: Path, node_name: str) -> Path:
+    return cache_dir / f"{node_name.replace('/', '_')}.json"
+
+
+def _load(
+    cache_dir: Path, node_name: str, ttl: float
+) -> list[dict[str, Any]] | None:
+    path = _path(cache_dir, node_name)
+    try:
+        cached = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if time.time() - cached.get("time", 0) >= ttl:
+        return None
+    guests: list[dict[str, Any]] = cached.get("guests", [])
+    return guests
+
+
+def _save(
+    cache_dir: Path, node_name: str, guests: list[dict[str, Any]]
+) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _path(cache_dir, node_name).write_text(
+        json.dumps({"time": time.time(), "guests": guests}) + "\n"
+    )
@@ -0,0 +1,107 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Roll planned operations out to an inventory a few hosts at a time.
+
+Running ops across the whole inventory changes every host at once so a bad
+change breaks every host at once as well. A rolling run changes a few canary
+hosts first and only continues if all of them succeed. The rest of the hosts
+then run with a fixed number in progress: a new host starts as soon as another
+finishes rather than waiting for its whole batch. Once more hosts have failed
+than allowed, no more hosts are started and the ones in progress finish.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from gevent.pool import Pool
+from pyinfra.api.operations import run_host_op
+from pyinfra.context import ctx_host, ctx_state
+
+if TYPE_CHECKING:
+    from pyinfra.api import Host, State
+
+
+class RollingRun:
+    """Run the planned ops on canary hosts and then the rest in batches."""
+
+    def __init__(self, canary: int, batch_size: int, max_failures: int) -> None:
+        """
+        Build a RollingRun instance.
+
+        Args:
+            canary (int): Number of hosts that must all succeed before any
+                other host is changed
+            batch_size (int): Number of hosts to run on at once after the
+                canaries. If 0, all remaining hosts run at once.
+            max_failures (int): Number of hosts that may fail after the
+                canaries before no more hosts are started
+
+        """
+        self.canary = canary
+        self.batch_size = batch_size
+        self.max_failures = max_failures
+        self.failed: list[Host] = []
+        self.not_started: list[Host] = []
+
+    @property
+    def halted(self) -> bool:
+        """Whether hosts were left unchanged because too many failed."""
+        return bool(self.not_started)
+
+    def run(self, state: State) -> None:
+        """
+        Run the planned ops on the active hosts in inventory order.
+
+        Args:
+            state (State): State with the planned ops
+
+        """
+        hosts = [host for host in state.inventory if host in state.active_hosts]
+        canaries, rest = hosts[: self.canary], hosts[self.canary :]
+
+        state.is_executing = True
+        with ctx_state.use(state):
+            if canaries:
+                self._run_batch(state, canaries, len(canaries), 0)
+            if self.failed:
+                self.not_started = rest
+            else:
+                self._run_batch(
+                    state, rest, self.batch_size or len(rest), self.max_failures
+                )
+        state.fail_hosts(set(self.failed))
+
+    def print(self) -> None:
+        """Print why the run halted, if it did."""
+        if not self.halted:
+            return
+        failed = ", ".join(host.name for host in self.failed)
+        print(
+            f"Rolling run halted after {len(self.failed)} hosts failed "
+            f"({failed}). {len(self.not_started)} hosts weren't changed: "
+            f"{', '.join(host.name for host in self.not_started)}"
+        )
+
+    def _run_batch(
+        self, state: State, hosts: list[Host], size: int, max_failures: int
+    ) -> None:
+        if not hosts:
+            return
+        pool = Pool(size)
+        for index, host in enumerate(hosts):
+            pool.wait_available()
+            if len(self.failed) > max_failures:
+                self.not_started = hosts[index:]
+                break
+            pool.spawn(self._run_host, state, host)
+        pool.join(raise_error=True)
+
+    def _run_host(self, state: State, host: Host) -> None:
+        with ctx_host.use(host):
+            for op_hash in state.get_op_order():
+                if not run_host_op(state, host, op_hash):
+                    self.failed.append(host)
+                    return
@@ -0,0 +1,288 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Shared helpers to connect to an inventory and run operations on it."""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, override
+
+from pyinfra.api import Config, State
+from pyinfra.api.connect import connect_all
+from pyinfra.api.operations import run_ops
+from pyinfra.api.state import BaseStateCallback
+
+from home_server.callbacks import OpCompleteCallback
+from home_server.facts.cache import FactCache, default_cache_dir
+from home_server.facts.prefetch import FactPrefetch
+from home_server.journal import RunJournal
+from home_server.rolling import RollingRun
+from home_server.trace import Tracer
+
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Iterator
+    from typing import Any
+
+    from pyinfra.api import Host, Inventory
+
+
+def make_config(args: argparse.Namespace) -> Config:
+    """
+    Build the pyinfra config from the CLI arguments.
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments
+
+    Returns:
+        Config: Config to use for the state
+
+    """
+    return Config(
+        PARALLEL=args.parallel,
+        CONNECT_TIMEOUT=args.connect_timeout,
+    )
+
+
+class PhaseTimer(BaseStateCallback):
+    """
+    Record how long each phase of a run takes.
+
+    Connecting and executing are recorded per host using state callbacks.
+    Planning is recorded for the whole inventory as pyinfra plans each operation
+    across all hosts at once. If a tracer is set, phases and spans are also
+    recorded in its trace.
+    """
+
+    def __init__(self, tracer: Tracer | None = None) -> None:
+        """
+        Build a PhaseTimer instance.
+
+        Args:
+            tracer (Tracer | None): Tracer to record spans in
+
+        """
+        self.tracer = tracer
+        self.phases: dict[str, float] = {}
+        self.connect: dict[str, float] = {}
+        self.execute: dict[str, float] = defaultdict(float)
+        self._starts: dict[str, float] = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a phase of the run.
+
+        Args:
+            name (str): Name of the phase
+
+        """
+        start = time.perf_counter()
+        try:
+            with self.span(name, "phase"):
+                yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[None]:
+        """
+        Trace a block of the run if there's a tracer.
+
+        Args:
+            name (str): Name of the span
+            category (str): Kind of span e.g. 'plan'
+            args (Any): Details to show with the span
+
+        """
+        if self.tracer is None:
+            yield
+            return
+        with self.tracer.span(name, category, **args):
+            yield
+
+    @override
+    def host_before_connect(  # type: ignore[override]
+        self, state: State, host: Host
+    ) -> None:
+        self._starts[host.name] = time.perf_counter()
+
+    @override
+    def host_connect(  # type: ignore[override]
+        self, state: State, host: Host
+    ) -> None:
+        self._stop_connect(host)
+
+    @override
+    def host_connect_error(  # type: ignore[override]
+        self, state: State, host: Host, error: Exception
+    ) -> None:
+        self._stop_connect(host)
+
+    @override
+    def operation_host_start(  # type: ignore[override]
+        self, state: State, host: Host, op_hash: str
+    ) -> None:
+        self._starts[host.name] = time.perf_counter()
+
+    @override
+    def operation_host_success(  # type: ignore[override]
+        self, state: State, host: Host, op_hash: str, retry_count: int = 0
+    ) -> None:
+        self._stop_execute(host)
+
+    @override
+    def operation_host_error(  # type: ignore[override]
+        self,
+        state: State,
+        host: Host,
+        op_hash: str,
+        retry_count: int = 0,
+        max_retries: int = 0,
+    ) -> None:
+        self._stop_execute(host)
+
+    def _stop_connect(self, host: Host) -> None:
+        start = self._starts.pop(host.name, None)
+        if start is not None:
+            self.connect[host.name] = time.perf_counter() - start
+
+    def _stop_execute(self, host: Host) -> None:
+        start = self._starts.pop(host.name, None)
+        if start is not None:
+            self.execute[host.name] += time.perf_counter() - start
+
+    def print(self) -> None:
+        """Print the recorded timings."""
+        print("Timings (s)")
+        for name, duration in self.phases.items():
+            print(f"  {name}: {duration:.3f}")
+        for host_name in sorted(self.connect.keys() | self.execute.keys()):
+            connect = self.connect.get(host_name, 0.0)
+            execute = self.execute.get(host_name, 0.0)
+            print(
+                f"  {host_name}: connect {connect:.3f}, execute {execute:.3f}"
+            )
+
+
+def make_timer(args: argparse.Namespace) -> PhaseTimer:
+    """
+    Build the timer of a run from the CLI arguments.
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments
+
+    Returns:
+        PhaseTimer: Timer with a tracer if the run is traced
+
+    """
+    return PhaseTimer(Tracer() if args.trace is not None else None)
+
+
+def make_state(
+    inventory: Inventory,
+    args: argparse.Namespace,
+    timer: PhaseTimer,
+    journal: RunJournal | None = None,
+) -> State:
+    """
+    Build a state from the CLI arguments and connect to its hosts.
+
+    Args:
+        inventory (Inventory): Hosts to connect to
+        args (argparse.Namespace): Parsed CLI arguments
+        timer (PhaseTimer): Timer to record the run's phases
+        journal (RunJournal | None): Journal to record the run's progress in.
+            If resuming, hosts it has recorded as complete aren't connected to.
+
+    Returns:
+        State: Connected state
+
+    """
+    state = State(inventory, make_config(args))
+    state.add_callback_handler(timer)
+    if journal is not None:
+        journal.install(state)
+    if args.fact_cache_ttl > 0:
+        cache_dir = args.fact_cache_dir or default_cache_dir()
+        FactCache(cache_dir, args.fact_cache_ttl).install(state)
+    # installed after the cache so traced facts include cache hits
+    if timer.tracer is not None:
+        timer.tracer.install(state)
+    with timer.phase("connect"):
+        connect_all(state)
+    return state
+
+
+def execute(state: State, args: argparse.Namespace, timer: PhaseTimer) -> None:
+    """
+    Run the planned operations in the state.
+
+    With the rolling strategy, hosts run in batches after a group of canary
+    hosts and no more hosts start once too many fail. Ops that a resumed run's
+    journal recorded as successful are skipped. Once the run finishes, the last
+    op on each host is reported as complete to any OpCompleteCallback handlers,
+    even if the run was cut short.
+
+    Args:
+        state (State): State with the planned operations
+        args (argparse.Namespace): Parsed CLI arguments
+        timer (PhaseTimer): Timer to record the run's phases
+
+    """
+    for handler in state.callback_handlers:
+        if not isinstance(handler, RunJournal):
+            continue
+        skipped = handler.track(state)
+        if args.resume:
+            print(
+                f"Resuming: skipping {len(handler.complete_hosts)} complete "
+                f"hosts and {skipped} ops that succeeded"
+            )
+    try:
+        with timer.phase("execute"):
+            if args.strategy == "rolling":
+                rolling = RollingRun(
+                    args.canary,
+                    args.batch_size or args.parallel,
+                    args.max_failures,
+                )
+                rolling.run(state)
+                rolling.print()
+            else:
+                run_ops(state, no_wait=args.no_wait)
+    finally:
+        for handler in state.callback_handlers:
+            if isinstance(handler, RunJournal):
+                handler.close(state)
+            elif isinstance(handler, OpCompleteCallback):
+                handler.flush(state)
+
+
+def finish(state: State, args: argparse.Namespace, timer: PhaseTimer) -> None:
+    """
+    Clean up after a run.
+
+    Args:
+        state (State): State of the run
+        args (argparse.Namespace): Parsed CLI arguments
+        timer (PhaseTimer): Timer that recorded the run's phases
+
+    """
+    for handler in state.callback_handlers:
+        if isinstance(handler, FactCache):
+            handler.save(state)
+            if args.timings:
+                print(
+                    f"Fact cache: {handler.hits} hits, {handler.misses} misses"
+                )
+        if isinstance(handler, FactPrefetch) and args.timings:
+            print(f"Fact prefetch: {handler.hits} hits")
+
+    if args.timings:
+        timer.print()
+    if timer.tracer is not None:
+        timer.tracer.write(args.trace)
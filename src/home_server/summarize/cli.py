@@ -0,0 +1,65 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Define the home_server summarize CLI.
+
+Parsing arguments shouldn't import the summaries so they are only imported by
+main once the summarize command runs.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+    from argparse import ArgumentParser, _SubParsersAction
+
+
+def configure_parser(subparser: _SubParsersAction[ArgumentParser]) -> None:
+    """
+    Define the subparser for the summarize command.
+
+    Args:
+        subparser (_SubParsersAction[ArgumentParser]): Parent parser
+
+    """
+    summarize = subparser.add_parser(
+        "summarize",
+        help="Summarize the results of harden reports across hosts",
+    )
+    summarize.add_argument(
+        "reports",
+        type=Path,
+        nargs="+",
+        help=(
+            "Reports written by 'harden --output'. If a check ran on a host in "
+            "more than one report, the result in the last report is used."
+        ),
+    )
+    summarize.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of the worst hosts and checks to show. Defaults to '10'.",
+    )
+    summarize.add_argument(
+        "--matrix",
+        action="store_true",
+        help="Print the status of every check on every host",
+    )
+    summarize.add_argument(
+        "--csv",
+        type=Path,
+        help="Write every result in the reports to this file as CSV",
+    )
+    summarize.set_defaults(func=main)
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for home_server summarize CLI."""
+    from .main import main as summarize  # noqa: PLC0415
+
+    summarize(args)
@@ -0,0 +1,53 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Entry point for home_server summarize CLI.
+
+Summarizing reads the reports of previous harden runs so it doesn't connect to
+any hosts.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from home_server.hardening.results import ResultTable
+
+if TYPE_CHECKING:
+    import argparse
+
+
+def print_worst(title: str, rows: list[tuple[str, int, int]]) -> None:
+    """
+    Print the names that failed the most.
+
+    Args:
+        title (str): Heading of the list
+        rows (list[tuple[str, int, int]]): Names with their failures and totals
+
+    """
+    print(title)
+    if not rows:
+        print("  none")
+    width = max((len(name) for name, _, _ in rows), default=0)
+    for name, failed, total in rows:
+        print(f"  {name:<{width}}  {failed}/{total} failed")
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for home_server summarize CLI."""
+    table = ResultTable.read_jsonl(args.reports)
+
+    counts = table.status_counts()
+    print(
+        f"{len(table.hosts)} hosts, {len(table.checks)} checks: "
+        + ", ".join(f"{count} {status}" for status, count in counts.items())
+    )
+    print_worst("Worst hosts", table.worst_hosts(args.top))
+    print_worst("Worst checks", table.worst_checks(args.top))
+
+    if args.matrix:
+        table.print_matrix()
+    if args.csv is not None:
+        table.write_csv(args.csv)
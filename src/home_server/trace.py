@@ -0,0 +1,285 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Record where the time of a run goes as a trace.
+
+Traces are written in the Chrome trace event format which Perfetto,
+speedscope and chrome://tracing show as a flame view. Each host gets a track
+with spans for connecting, fetching facts, executing ops and the checks the ops
+belong to. Facts prefetched in one command share a single FactPrefetch span.
+pyinfra plans each operation across all hosts at once so the phases of the run
+and planning are on a separate track.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+import time
+from typing import TYPE_CHECKING, override
+
+from pyinfra.api.state import BaseStateCallback
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+    from typing import Any
+
+    from pyinfra.api import FactBase, Host, State
+    from pyinfra.api.operation import OperationMeta
+
+    from home_server.hardening.checks import CheckMeta
+
+# track of the spans that aren't specific to a host
+RUN_TRACK = 0
+
+
+class Tracer(BaseStateCallback):
+    """Record spans of a run and write them as a Chrome trace."""
+
+    def __init__(self) -> None:
+        """Build a Tracer instance."""
+        self.events: list[dict[str, Any]] = []
+        self.tracks: dict[str, int] = {"run": RUN_TRACK}
+        self._start = time.perf_counter()
+        # host name -> start time of the connection or op in progress
+        self._starts: dict[str, float] = {}
+        # host name -> op -> names of the checks that include the op
+        self._op_checks: dict[str, dict[OperationMeta, list[str]]] = {}
+        # (host name, check name) -> start and end of the check's ops
+        self._check_spans: dict[tuple[str, str], tuple[float, float]] = {}
+
+    def install(self, state: State) -> None:
+        """
+        Trace the connections, facts and ops of all hosts in the state.
+
+        Args:
+            state (State): State to trace
+
+        """
+        state.add_callback_handler(self)
+        for host in state.inventory:
+            host.get_fact = functools.partial(  # type: ignore[method-assign]
+                self.get_fact, host, host.get_fact
+            )
+
+    def add_checks(self, op_metas: dict[str, CheckMeta]) -> None:
+        """
+        Attribute the ops of checks to them in the trace.
+
+        Args:
+            op_metas (dict[str, CheckMeta]): Check names mapped to their
+                metadata
+
+        """
+        for check_name, meta in op_metas.items():
+            for host_name, host_op_metas in meta.op_metas.items():
+                host_ops = self._op_checks.setdefault(host_name, {})
+                for op_meta in host_op_metas:
+                    host_ops.setdefault(op_meta, []).append(check_name)
+
+    @contextlib.contextmanager
+    def span(
+        self, name: str, category: str, track: str = "run", **args: Any
+    ) -> Iterator[None]:
+        """
+        Record a span around a block.
+
+        Args:
+            name (str): Name of the span
+            category (str): Kind of span e.g. 'plan'
+            track (str): Host name or 'run' to put the span on
+            args (Any): Details to show with the span
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(
+                name,
+                category,
+                track,
+                start=start,
+                end=time.perf_counter(),
+                args=args,
+            )
+
+    def add_span(  # noqa: PLR0913
+        self,
+        name: str,
+        category: str,
+        track: str,
+        *,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Record a span that has finished.
+
+        Args:
+            name (str): Name of the span
+            category (str): Kind of span e.g. 'plan'
+            track (str): Host name or 'run' to put the span on
+            start (float): perf_counter time the span started
+            end (float): perf_counter time the span ended
+            args (dict[str, Any] | None): Details to show with the span
+
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self._start) * 1e6, 3),
+            "dur": round((end - start) * 1e6, 3),
+            "pid": os.getpid(),
+            "tid": self.tracks.setdefault(track, len(self.tracks)),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def get_fact[T](
+        self,
+        host: Host,
+        fetch: Callable[..., T],
+        fact_cls: type[FactBase[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Get a fact for a host and record how long it took.
+
+        Args:
+            host (Host): Host to get the fact from
+            fetch (Callable[..., T]): Function that gets the fact
+            fact_cls (type[FactBase[T]]): Fact to get
+            args (Any): Positional arguments to the fact
+            kwargs (Any): Keyword arguments to the fact
+
+        Returns:
+            T: Value of the fact
+
+        """
+        details = {"args": [str(arg) for arg in args]} if args else {}
+        with self.span(fact_cls.__name__, "fact", host.name, **details):
+            return fetch(fact_cls, *args, **kwargs)
+
+    def write(self, path: Path) -> None:
+        """
+        Write the recorded spans to a file.
+
+        Args:
+            path (Path): Path to write the trace to
+
+        """
+        for (host_name, check_name), (start, end) in self._check_spans.items():
+            self.add_span(check_name, "check", host_name, start=start, end=end)
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": track},
+            }
+            for track, tid in self.tracks.items()
+        ]
+        path.write_text(
+            json.dumps(
+                {
+                    "traceEvents": metadata + self.events,
+                    "displayTimeUnit": "ms",
+                }
+            )
+        )
+
+    @override
+    def host_before_connect(  # type: ignore[override]
+        self, state: State, host: Host
+    ) -> None:
+        self._starts[host.name] = time.perf_counter()
+
+    @override
+    def host_connect(  # type: ignore[override]
+        self, state: State, host: Host
+    ) -> None:
+        self._stop_connect(host, success=True)
+
+    @override
+    def host_connect_error(  # type: ignore[override]
+        self, state: State, host: Host, error: Exception
+    ) -> None:
+        self._stop_connect(host, success=False)
+
+    @override
+    def operation_host_start(  # type: ignore[override]
+        self, state: State, host: Host, op_hash: str
+    ) -> None:
+        self._starts[host.name] = time.perf_counter()
+
+    @override
+    def operation_host_success(  # type: ignore[override]
+        self, state: State, host: Host, op_hash: str, retry_count: int = 0
+    ) -> None:
+        self._stop_execute(state, host, op_hash, success=True)
+
+    @override
+    def operation_host_error(  # type: ignore[override]
+        self,
+        state: State,
+        host: Host,
+        op_hash: str,
+        retry_count: int = 0,
+        max_retries: int = 0,
+    ) -> None:
+        self._stop_execute(state, host, op_hash, success=False)
+
+    def _stop_connect(self, host: Host, *, success: bool) -> None:
+        start = self._starts.pop(host.name, None)
+        if start is not None:
+            self.add_span(
+                "connect",
+                "connect",
+                host.name,
+                start=start,
+                end=time.perf_counter(),
+                args={"success": success},
+            )
+
+    def _stop_execute(
+        self, state: State, host: Host, op_hash: str, *, success: bool
+    ) -> None:
+        start = self._starts.pop(host.name, None)
+        if start is None:
+            return
+        end = time.perf_counter()
+        op_meta = state.get_op_meta(op_hash)
+        op_data = state.ops[host].get(op_hash)
+        check_names = []
+        if op_data is not None:
+            check_names = self._op_checks.get(host.name, {}).get(
+                op_data.operation_meta, []
+            )
+        args: dict[str, Any] = {"success": success}
+        if check_names:
+            args["checks"] = check_names
+        self.add_span(
+            ", ".join(sorted(op_meta.names)),
+            "execute",
+            host.name,
+            start=start,
+            end=end,
+            args=args,
+        )
+        for check_name in check_names:
+            key = (host.name, check_name)
+            check_start, check_end = self._check_spans.get(key, (start, end))
+            self._check_spans[key] = (
+                min(start, check_start),
+                max(end, check_end),
+            )
@@ -0,0 +1,6 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from .cli import configure_parser
+
+__all__ = ["configure_parser"]
@@ -0,0 +1,77 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Define the home_server watch CLI.
+
+Parsing arguments shouldn't import pyinfra or the checks so they are only
+imported by main once the watch command runs.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from home_server.cli import add_connect_arguments
+from home_server.hardening.cli import add_check_arguments
+
+if TYPE_CHECKING:
+    import argparse
+    from argparse import ArgumentParser, _SubParsersAction
+
+
+def configure_parser(subparser: _SubParsersAction[ArgumentParser]) -> None:
+    """
+    Define the subparser for the watch command.
+
+    Args:
+        subparser (_SubParsersAction[ArgumentParser]): Parent parser
+
+    """
+    watch = subparser.add_parser(
+        "watch",
+        help="Audit hosts again whenever their state drifts",
+    )
+    inventory_help = (
+        "Path to an inventory file, a directory of inventory files or "
+        "hostname/IP address to run commands on. Use @local to run on this "
+        "host."
+    )
+    watch.add_argument(
+        "inventory",
+        type=Path,
+        help=inventory_help,
+    )
+    add_check_arguments(watch)
+    watch.add_argument(
+        "--interval",
+        type=float,
+        default=300,
+        help="Seconds between checks for drift. Defaults to '300'.",
+    )
+    watch.add_argument(
+        "--count",
+        type=int,
+        default=0,
+        help=(
+            "Number of times to check for drift before exiting. Defaults to "
+            "'0' which watches until interrupted."
+        ),
+    )
+    watch.add_argument(
+        "--output",
+        type=Path,
+        help=(
+            "Append events to this file as JSON Lines instead of printing them"
+        ),
+    )
+    add_connect_arguments(watch)
+    watch.set_defaults(func=main)
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for home_server watch CLI."""
+    from .main import main as watch  # noqa: PLC0415
+
+    watch(args)
@@ -0,0 +1,276 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Entry point for home_server watch CLI.
+
+Watching keeps connections to the inventory's hosts open and fetches their
+fingerprints on an interval. The first poll audits every host. After that, a
+host is only audited again if the fingerprint components that the checks depend
+on have changed. Each drift and audit result is emitted as a JSON line as soon
+as it's found.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+from pyinfra.api import State
+from pyinfra.api.connect import connect_all, disconnect_all
+from pyinfra.api.exceptions import PyinfraError
+from pyinfra.api.operations import run_ops
+
+from home_server.facts.fingerprint import COMPONENTS, Fingerprint
+from home_server.hardening.checks import get_facts, get_profile
+from home_server.hardening.checks.debian_13 import load_checks
+from home_server.hardening.main import set_presets
+from home_server.inventory import make_inventory
+from home_server.run import make_config
+
+if TYPE_CHECKING:
+    import argparse
+    from pathlib import Path
+    from typing import TextIO
+
+    from pyinfra.api import Host
+
+    from home_server.hardening.checks import Check, CheckMeta
+
+
+def watched_components(checks: list[type[Check]]) -> tuple[str, ...]:
+    """
+    Get the fingerprint components to watch for drift.
+
+    Args:
+        checks (list[type[Check]]): Checks whose state to watch
+
+    Returns:
+        tuple[str, ...]: Components that any of the checks depend on or all
+            components if any of them don't declare theirs
+
+    """
+    if not all(check.fingerprint for check in checks):
+        return tuple(sorted(COMPONENTS))
+    components = {
+        component for check in checks for component in check.fingerprint
+    }
+    return tuple(sorted(components))
+
+
+class EventWriter:
+    """Write events as JSON Lines to a file or stdout."""
+
+    def __init__(self, path: Path | None) -> None:
+        """
+        Build an EventWriter instance.
+
+        Args:
+            path (Path | None): File to append events to. If None, events are
+                printed.
+
+        """
+        self.file: TextIO = sys.stdout if path is None else path.open("a")
+
+    def emit(self, kind: str, host_name: str, **fields: Any) -> None:
+        """
+        Write an event.
+
+        Args:
+            kind (str): Type of the event e.g. 'drift'
+            host_name (str): Host the event is about
+            fields (Any): Details of the event
+
+        """
+        record = {"time": time.time(), "type": kind, "host": host_name}
+        record.update(fields)
+        self.file.write(json.dumps(record, default=str) + "\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        """Close the file events are written to."""
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+class Watcher:
+    """Poll the fingerprints of hosts and audit the ones that drift."""
+
+    def __init__(
+        self,
+        state: State,
+        checks: list[type[Check]],
+        components: tuple[str, ...],
+        events: EventWriter,
+    ) -> None:
+        """
+        Build a Watcher instance.
+
+        Args:
+            state (State): Connected state of the hosts to watch
+            checks (list[type[Check]]): Audit checks to run on drifted hosts
+            components (tuple[str, ...]): Fingerprint components to compare
+            events (EventWriter): Writer to emit events with
+
+        """
+        self.state = state
+        self.checks = checks
+        self.components = components
+        self.events = events
+        # host name -> watched components of its last fingerprint
+        self.fingerprints: dict[str, dict[str, str]] = {}
+
+    def reconnect(self) -> None:
+        """Try to connect to hosts that failed again."""
+        for host in list(self.state.failed_hosts):
+            host.disconnect()
+            host.connect()
+            if host.connected:
+                self.state.failed_hosts.discard(host)
+                self.state.activate_host(host)
+                self.events.emit("reconnected", host.name)
+
+    def poll(self) -> list[Host]:
+        """
+        Fetch the fingerprints of hosts and find the ones that drifted.
+
+        Returns:
+            list[Host]: Hosts seen for the first time or whose fingerprint
+                changed
+
+        """
+        hosts = self.state.inventory.get_active_hosts()
+        fingerprints = get_facts(self.state, hosts, Fingerprint)
+        drifted = []
+        for host in hosts:
+            if host in self.state.failed_hosts:
+                self.events.emit("unreachable", host.name)
+                continue
+            value, _ = fingerprints[host.name]
+            current = {
+                component: value.get(component) for component in self.components
+            }
+            previous = self.fingerprints.get(host.name)
+            self.fingerprints[host.name] = current
+            if previous is None:
+                drifted.append(host)
+                continue
+            changed = [
+                component
+                for component in self.components
+                if previous[component] != current[component]
+            ]
+            if changed:
+                self.events.emit("drift", host.name, components=changed)
+                drifted.append(host)
+        return drifted
+
+    def audit(self, hosts: list[Host]) -> None:
+        """
+        Run the audit checks on hosts and emit their results.
+
+        Args:
+            hosts (list[Host]): Hosts to audit
+
+        """
+        try:
+            metas = {
+                check.name: check.run(self.state, hosts)
+                for check in self.checks
+            }
+            if any(meta.op_metas for meta in metas.values()):
+                run_ops(self.state)
+        finally:
+            self._reset_ops()
+        for check_name, meta in metas.items():
+            self._emit_results(check_name, meta)
+
+    def run(self, interval: float, count: int) -> None:
+        """
+        Poll hosts and audit the drifted ones until stopped.
+
+        Args:
+            interval (float): Seconds between polls
+            count (int): Number of polls to run. If 0, polls until interrupted.
+
+        """
+        polls = 0
+        while True:
+            start = time.monotonic()
+            try:
+                self.reconnect()
+                drifted = self.poll()
+                if drifted:
+                    self.audit(drifted)
+            except PyinfraError as e:
+                # raised once every host has failed. They're retried next time.
+                self.events.emit("error", "", error=str(e))
+
+            polls += 1
+            if count and polls >= count:
+                return
+            time.sleep(max(0.0, interval - (time.monotonic() - start)))
+
+    def _emit_results(self, check_name: str, meta: CheckMeta) -> None:
+        for host_name, value in meta.facts.items():
+            host = self.state.inventory.get_host(host_name)
+            status = "error" if host in self.state.failed_hosts else "success"
+            self.events.emit(
+                "audit",
+                host_name,
+                check=check_name,
+                status=status,
+                result=value,
+            )
+        for host_name, op_metas in meta.op_metas.items():
+            succeeded = all(
+                op_meta.is_complete() and op_meta.did_succeed()
+                for op_meta in op_metas
+            )
+            self.events.emit(
+                "audit",
+                host_name,
+                check=check_name,
+                status="success" if succeeded else "error",
+                stdout=[line for op in op_metas for line in op.stdout_lines],
+            )
+
+    def _reset_ops(self) -> None:
+        # the state is kept between audits so its ops have to be forgotten or
+        # they'd run again with the next audit's. run_ops leaves the state
+        # executing, which would run the next audit's ops as they're added.
+        self.state.is_executing = False
+        self.state.op_meta.clear()
+        for host in self.state.inventory:
+            self.state.ops[host].clear()
+            host.op_hash_order.clear()
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for home_server watch CLI."""
+    set_presets(args)
+
+    profile = get_profile(args.platform, args.level)
+    index = load_checks(args.sections)
+    features = set(args.features)
+    checks = index.select(profile, features, audit=True)
+    components = watched_components(
+        checks + index.select(profile, features, audit=False)
+    )
+
+    state = State(
+        make_inventory(args.inventory, make_config(args)), make_config(args)
+    )
+    connect_all(state)
+    events = EventWriter(args.output)
+    try:
+        Watcher(state, checks, components, events).run(
+            args.interval, args.count
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        events.close()
+        disconnect_all(state)
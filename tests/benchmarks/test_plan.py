@@ -0,0 +1,132 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Benchmark how planning harden and configure scales with the number of hosts.
+
+Each benchmark plans a run against synthetic hosts on the @stub connector in
+conftest.py so no commands leave this machine. The plan time, number of
+operations and peak memory are printed for each size. Planning is timed while
+memory is traced so compare times between runs of this suite, not with real
+runs.
+
+- HOME_SERVER_PLAN_BUDGET: seconds of planning allowed per host
+- HOME_SERVER_BENCHMARK_MAX_HOSTS: largest size to run. Defaults to 100 since
+  1000 hosts takes minutes.
+- HOME_SERVER_BENCHMARK_OUTPUT: JSON Lines file to append results to
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pyinfra.api import Inventory, State
+
+from home_server.configure import proxmox_container, proxmox_host
+from home_server.hardening.checks import get_profile
+from home_server.hardening.checks.debian_13 import load_checks
+from home_server.hardening.main import plan_checks
+from home_server.main import make_parser
+from home_server.run import PhaseTimer, make_state
+
+PLAN_BUDGET = float(os.environ.get("HOME_SERVER_PLAN_BUDGET", "0.25"))
+MAX_HOSTS = int(os.environ.get("HOME_SERVER_BENCHMARK_MAX_HOSTS", "100"))
+BENCHMARK_OUTPUT = os.environ.get("HOME_SERVER_BENCHMARK_OUTPUT")
+HOST_COUNTS = [10, 100, 1000]
+
+# answers to the commands that need output to plan on a Proxmox host
+STUB_RESPONSES = {
+    "uname -s": "Linux",
+    "/proc/cpuinfo": ["vendor_id\t: GenuineIntel"],
+    "pveversion": "/usr/bin/pveversion",
+}
+
+
+def make_inventory(count: int) -> Inventory:
+    """Make an inventory of synthetic hosts that answer instantly."""
+    data = {"stub_responses": STUB_RESPONSES}
+    return Inventory(
+        ([(f"@stub/host{i}", dict(data)) for i in range(count)], {})
+    )
+
+
+def plan_harden(state: State, timer: PhaseTimer) -> None:
+    """Select the default checks and plan them on every host."""
+    checks = load_checks(None).select(
+        get_profile("server", 1), set(), audit=False
+    )
+    plan_checks(state, checks, None, timer)
+
+
+def plan_proxmox_host(state: State, _: PhaseTimer) -> None:
+    """Plan the proxmox-host preset on every host."""
+    proxmox_host.main(state)
+
+
+def plan_proxmox_container(state: State, _: PhaseTimer) -> None:
+    """Plan the proxmox-container preset on every host."""
+    proxmox_container.main(state)
+
+
+@pytest.mark.parametrize("count", HOST_COUNTS)
+@pytest.mark.parametrize(
+    ("name", "argv", "plan"),
+    [
+        ("harden", ["harden", "--dry-run"], plan_harden),
+        (
+            "configure proxmox-host",
+            ["configure", "inventory", "--preset", "proxmox-host"],
+            plan_proxmox_host,
+        ),
+        (
+            "configure proxmox-container",
+            ["configure", "inventory", "--preset", "proxmox-container"],
+            plan_proxmox_container,
+        ),
+    ],
+)
+def test_plan(
+    name: str,
+    argv: list[str],
+    plan: Callable[[State, PhaseTimer], None],
+    count: int,
+) -> None:
+    """Planning should stay within the budget for each host."""
+    if count > MAX_HOSTS:
+        pytest.skip(f"HOME_SERVER_BENCHMARK_MAX_HOSTS is {MAX_HOSTS}")
+    args = make_parser().parse_args(argv)
+    timer = PhaseTimer()
+    state = make_state(make_inventory(count), args, timer)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        plan(state, timer)
+        duration = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    ops = sum(len(state.ops[host]) for host in state.inventory)
+    result = {
+        "name": name,
+        "hosts": count,
+        "plan_s": round(duration, 4),
+        "ops": ops,
+        "peak_mib": round(peak / 2**20, 2),
+    }
+    print(
+        f"{name} x{count}: plan {duration:.3f}s, {ops} ops, "
+        f"peak {result['peak_mib']} MiB"
+    )
+    if BENCHMARK_OUTPUT is not None:
+        with Path(BENCHMARK_OUTPUT).open("a") as f:
+            f.write(json.dumps(result) + "\n")
+
+    assert not state.failed_hosts
+    assert ops > 0
+    assert duration / count < PLAN_BUDGET
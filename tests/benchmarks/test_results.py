@@ -0,0 +1,48 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Benchmark summarizing the results of checks across a large fleet.
+
+Results of synthetic hosts are added to a table and then summarized the way the
+summarize command does.
+
+- HOME_SERVER_SUMMARY_BUDGET: seconds allowed for all the summaries
+"""
+
+import os
+import time
+
+from home_server.hardening.results import ResultTable
+
+SUMMARY_BUDGET = float(os.environ.get("HOME_SERVER_SUMMARY_BUDGET", "1.0"))
+HOSTS = 5000
+CHECKS = [f"1.1.1.{i}" for i in range(1, 12)]
+TOP = 10
+
+
+def test_summarize() -> None:
+    """Summarizing thousands of hosts should stay within the budget."""
+    table = ResultTable()
+    for host in range(HOSTS):
+        for check_index, check in enumerate(CHECKS):
+            failed = (host + check_index) % 7 == 0
+            table.add(
+                f"host-{host}",
+                check,
+                "error" if failed else "success",
+                duration=0.01,
+            )
+
+    start = time.perf_counter()
+    counts = table.status_counts()
+    worst_hosts = table.worst_hosts(TOP)
+    worst_checks = table.worst_checks(TOP)
+    matrix = table.matrix()
+    duration = time.perf_counter() - start
+    print(f"summarize x{HOSTS}: {duration:.3f}s ({len(table)} results)")
+
+    assert sum(counts.values()) == HOSTS * len(CHECKS)
+    assert len(worst_hosts) == len(worst_checks) == TOP
+    assert len(matrix) == HOSTS
+    assert duration < SUMMARY_BUDGET
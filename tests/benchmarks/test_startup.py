@@ -0,0 +1,61 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Benchmark how long the CLI takes to start.
+
+Each measurement runs in a fresh interpreter so nothing is already imported.
+The budget can be tuned for slower machines with HOME_SERVER_STARTUP_BUDGET.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+STARTUP_BUDGET = float(os.environ.get("HOME_SERVER_STARTUP_BUDGET", "1.0"))
+RUNS = 5
+
+# parse the arguments of each subcommand without running it
+PARSE_ARGS = """
+import json
+import sys
+
+from home_server.main import make_parser
+
+parser = make_parser()
+parser.parse_args(["harden", "inventory.yaml"])
+parser.parse_args(["configure", "inventory.yaml", "--preset", "proxmox-host"])
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def run_parse_args() -> tuple[float, list[str]]:
+    """Time parsing arguments and get the modules that were imported."""
+    start = time.perf_counter()
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", PARSE_ARGS],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return time.perf_counter() - start, json.loads(result.stdout)
+
+
+def test_parse_args_defers_imports() -> None:
+    """Parsing arguments shouldn't import pyinfra or the checks."""
+    _, modules = run_parse_args()
+    heavy = [
+        module
+        for module in modules
+        if module.startswith(("pyinfra", "home_server.hardening.checks"))
+    ]
+    assert heavy == []
+
+
+def test_startup_time() -> None:
+    """Parsing arguments should stay within the startup budget."""
+    duration = min(run_parse_args()[0] for _ in range(RUNS))
+    print(f"startup: {duration:.3f}s (budget {STARTUP_BUDGET:.3f}s)")
+    assert duration < STARTUP_BUDGET
@@ -0,0 +1,36 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Register the connectors that only the tests use.
+
+The connectors aren't installed as entry points with the package so hosts can
+only use them while the tests run.
+"""
+
+import pytest
+from pyinfra.api import connectors
+
+from sandbox.connector import SandboxConnector
+from sandbox.stub import StubConnector
+
+
+@pytest.fixture(autouse=True)
+def test_connectors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Let inventories use @sandbox and @stub hosts."""
+    all_connectors = {
+        **connectors.get_all_connectors(),
+        "sandbox": SandboxConnector,
+        "stub": StubConnector,
+    }
+    monkeypatch.setattr(
+        "pyinfra.api.inventory.get_all_connectors", lambda: all_connectors
+    )
+    monkeypatch.setattr(
+        "pyinfra.api.inventory.get_execution_connectors",
+        lambda: {
+            name: connector
+            for name, connector in all_connectors.items()
+            if connector.handles_execution
+        },
+    )
@@ -0,0 +1,15 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Emulate hosts for the tests to run harden and configure offline.
+
+Hosts named @sandbox/NAME use the connector in sandbox.connector and hosts
+named @stub/NAME use the one in sandbox.stub. conftest.py registers both for
+the tests. This package doesn't import them so the stub commands in
+sandbox.commands start quickly.
+
+The sandbox runs commands on this machine as the current user and only moves
+literal absolute paths into its root. Paths built at runtime reach the real
+filesystem, so it's kept with the tests instead of shipped with the package.
+"""
@@ -0,0 +1,273 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Define the @sandbox connector that runs commands in a sandbox directory."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, override
+
+from pyinfra.api.util import get_file_io
+from pyinfra.connectors.base import BaseConnector, ConnectorData, DataMeta
+from pyinfra.connectors.util import (
+    CommandOutput,
+    OutputLine,
+    make_unix_command_for_host,
+)
+
+from .root import (
+    STATE_DIR,
+    Flavour,
+    check_root,
+    create_root,
+    install_stubs,
+    restore_paths,
+    rewrite_paths,
+    rewrite_script,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from io import IOBase
+
+    from pyinfra.api import Host, State
+    from pyinfra.api.command import StringCommand
+
+
+def default_sandbox_dir() -> Path:
+    """
+    Get the default directory to create sandboxes in.
+
+    Returns:
+        Path: Directory for sandboxes
+
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(cache_home) / "home-server" / "sandbox"
+
+
+def read_commands(root: Path) -> list[dict[str, Any]]:
+    """
+    Read the commands recorded in a sandbox.
+
+    Args:
+        root (Path): Root of the sandbox
+
+    Returns:
+        list[dict[str, Any]]: Recorded commands in the order they ran
+
+    """
+    path = root / STATE_DIR / "commands.jsonl"
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class SandboxConnectorData(ConnectorData, total=False):
+    """Host data used by the @sandbox connector."""
+
+    sandbox_root: str
+    sandbox_flavour: str
+    sandbox_reset: bool
+
+
+class SandboxConnector(BaseConnector):
+    """
+    Run commands against a stand-in for a Debian 13 or Proxmox VE host.
+
+    Each host has a root directory that holds the files of its filesystem.
+    Absolute paths in commands and uploaded scripts are moved into the root and
+    the commands that would change or describe the real system are replaced by
+    stubs, so full runs work offline. Everything else runs on this machine as
+    the current user so this isn't a security boundary.
+
+    Every command and file transfer is recorded in commands and appended to
+    .sandbox/commands.jsonl in the root with the operation it was for and how
+    long it took. Uploaded scripts are rewritten so they're uploaded again on
+    every run.
+
+    .. code:: yaml
+
+        sandboxes:
+          hosts:
+            - "@sandbox/pve":
+                sandbox_flavour: proxmox
+                sandbox_reset: true
+    """
+
+    handles_execution = True
+
+    data_cls = SandboxConnectorData
+    data_meta = {  # noqa: RUF012
+        "sandbox_root": DataMeta(
+            "Directory of the host's filesystem. Defaults to a directory "
+            "named after the host in the user's cache directory."
+        ),
+        "sandbox_flavour": DataMeta(
+            "System to emulate: debian-13 or proxmox", default="debian-13"
+        ),
+        "sandbox_reset": DataMeta(
+            "Recreate the host's filesystem when connecting", default=False
+        ),
+    }
+
+    def __init__(self, state: State, host: Host) -> None:
+        """Build a SandboxConnector instance."""
+        super().__init__(state, host)
+        self.flavour = Flavour(self.data.get("sandbox_flavour", "debian-13"))
+        name = host.name.removeprefix("@sandbox").lstrip("/") or "default"
+        self.root = Path(
+            self.data.get("sandbox_root") or default_sandbox_dir() / name
+        ).absolute()
+        check_root(self.root)
+        self.commands: list[dict[str, Any]] = []
+        self.env: dict[str, str] = {}
+
+    @override
+    @staticmethod
+    def make_names_data(
+        name: str | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any], list[str]]]:
+        host_name = "@sandbox" if not name else f"@sandbox/{name}"
+        yield host_name, {}, ["@sandbox"]
+
+    @override
+    def connect(self) -> None:
+        config_path = self.root / STATE_DIR / "config.json"
+        flavour = None
+        if config_path.exists():
+            flavour = json.loads(config_path.read_text())["flavour"]
+        if self.data.get("sandbox_reset") or flavour != self.flavour:
+            create_root(self.root, self.flavour)
+
+        bin_dir = install_stubs(self.root, self.flavour)
+        self.env = {
+            **os.environ,
+            "HOME": str(self.root / "root"),
+            "HOME_SERVER_SANDBOX": str(self.root),
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+        }
+        # temporary files go to /tmp which is moved into the root
+        self.env.pop("TMPDIR", None)
+
+    @override
+    def run_shell_command(
+        self,
+        command: StringCommand,
+        print_output: bool = False,
+        print_input: bool = False,
+        **arguments: Any,
+    ) -> tuple[bool, CommandOutput]:
+        arguments.pop("_get_pty", None)
+        timeout = arguments.pop("_timeout", None)
+        stdin = arguments.pop("_stdin", None)
+        success_exit_codes = arguments.pop("_success_exit_codes", None)
+        if isinstance(stdin, list):
+            stdin = "\n".join(stdin) + "\n"
+
+        unix_command = make_unix_command_for_host(
+            self.state, self.host, command, **arguments
+        )
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(  # noqa: S603
+                [
+                    "/bin/sh",
+                    "-c",
+                    rewrite_paths(unix_command.get_raw_value(), self.root),
+                ],
+                check=False,
+                capture_output=True,
+                env=self.env,
+                input=stdin,
+                text=True,
+                timeout=timeout,
+            )
+            return_code = result.returncode
+            lines = [
+                OutputLine(buffer_name, line)
+                for buffer_name, output in [
+                    ("stdout", result.stdout),
+                    ("stderr", result.stderr),
+                ]
+                for line in restore_paths(output, self.root).splitlines()
+            ]
+        except subprocess.TimeoutExpired:
+            return_code = -1
+            lines = [OutputLine("stderr", f"Timed out after {timeout}s")]
+
+        if success_exit_codes:
+            success = return_code in success_exit_codes
+        else:
+            success = return_code == 0
+        self._record(
+            "command",
+            command if isinstance(command, str) else command.get_masked_value(),
+            time.perf_counter() - start,
+            success=success,
+        )
+        return success, CommandOutput(lines)
+
+    @override
+    def put_file(
+        self,
+        filename_or_io: str | IOBase,
+        remote_filename: str,
+        remote_temp_filename: str | None = None,
+        print_output: bool = False,
+        print_input: bool = False,
+        **arguments: Any,
+    ) -> bool:
+        start = time.perf_counter()
+        with get_file_io(filename_or_io) as file_io:  # type: ignore[arg-type]
+            data = file_io.read()
+        if isinstance(data, str):
+            data = data.encode()
+        # scripts run in the sandbox so their paths have to be moved too
+        if data.startswith(b"#!"):
+            data = rewrite_script(data, self.root)
+        path = self._path(remote_filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self._record("put", remote_filename, time.perf_counter() - start)
+        return True
+
+    @override
+    def get_file(
+        self,
+        remote_filename: str,
+        filename_or_io: str | IOBase,
+        remote_temp_filename: str | None = None,
+        print_output: bool = False,
+        print_input: bool = False,
+        **arguments: Any,
+    ) -> bool:
+        start = time.perf_counter()
+        data = self._path(remote_filename).read_bytes()
+        with get_file_io(filename_or_io, "wb") as file_io:  # type: ignore[arg-type]
+            file_io.write(data)
+        self._record("get", remote_filename, time.perf_counter() - start)
+        return True
+
+    def _path(self, remote_filename: str) -> Path:
+        return Path(rewrite_paths(remote_filename, self.root))
+
+    def _record(
+        self, kind: str, command: str, duration: float, *, success: bool = True
+    ) -> None:
+        record = {
+            "type": kind,
+            "command": command,
+            # facts fetched outside of an operation have no hash
+            "op": self.host.current_op_hash,
+            "duration": round(duration, 6),
+            "success": success,
+        }
+        self.commands.append(record)
+        with (self.root / STATE_DIR / "commands.jsonl").open("a") as f:
+            f.write(json.dumps(record) + "\n")
@@ -0,0 +1,367 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Create the directory that stands in for a sandbox host's filesystem.
+
+A new root is seeded with the files that the checks and presets read on a
+fresh Debian 13 or Proxmox VE install. Commands that would change or describe
+the real system are replaced by stubs that run sandbox/commands.py.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import shutil
+import sys
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from . import commands
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+STATE_DIR = ".sandbox"
+# top-level directories of the host whose paths are moved into the root.
+# /dev, /bin and /sbin are shared so /dev/null and shells keep working.
+ROOT_DIRS = [
+    "boot",
+    "etc",
+    "home",
+    "lib",
+    "media",
+    "mnt",
+    "opt",
+    "proc",
+    "root",
+    "run",
+    "srv",
+    "sys",
+    "tmp",
+    "usr",
+    "var",
+]
+ABSOLUTE_PATH = re.compile(
+    rf"(?<![\w.~/$}}-])/(?=(?:{'|'.join(ROOT_DIRS)})(?:[/\s'\";|&)]|$))"
+)
+SAFE_ROOT = re.compile(r"[\w./-]+")
+
+CLOUD_IMAGE = "debian-13-generic-amd64.qcow2"
+
+
+class Flavour(StrEnum):
+    """Systems that a sandbox can emulate."""
+
+    DEBIAN_13 = "debian-13"
+    PROXMOX = "proxmox"
+
+
+# network interfaces. The installer creates vmbr0 on Proxmox VE hosts.
+LINKS = {
+    Flavour.DEBIAN_13: ["lo", "enp1s0"],
+    Flavour.PROXMOX: ["lo", "enp1s0", "vmbr0"],
+}
+KERNEL_RELEASES = {
+    Flavour.DEBIAN_13: "6.12.43+deb13-amd64",
+    Flavour.PROXMOX: "6.14.11-2-pve",
+}
+LOADED_MODULES = ["ext4", "jbd2", "mbcache", "vfat", "fat", "loop"]
+FS_MODULES = [
+    "afs",
+    "ceph",
+    "cifs",
+    "cramfs",
+    "exfat",
+    "ext4",
+    "fat",
+    "freevxfs",
+    "fuse",
+    "gfs2",
+    "hfs",
+    "hfsplus",
+    "isofs",
+    "jffs2",
+    "nfs",
+    "overlayfs",
+    "smb",
+    "squashfs",
+    "udf",
+    "vfat",
+    "xfs",
+]
+MOUNTS = [
+    "/dev/sda2 / ext4 rw,relatime,errors=remount-ro 0 0",
+    "/dev/sda1 /boot/efi vfat rw,relatime 0 0",
+    "proc /proc proc rw,nosuid,nodev,noexec,relatime 0 0",
+    "sysfs /sys sysfs rw,nosuid,nodev,noexec,relatime 0 0",
+    "tmpfs /run tmpfs rw,nosuid,nodev,noexec,relatime 0 0",
+    "devpts /dev/pts devpts rw,nosuid,noexec,relatime 0 0",
+]
+PACKAGES = {
+    Flavour.DEBIAN_13: [
+        "bash",
+        "coreutils",
+        "kmod",
+        "openssh-server",
+        "os-prober",
+        "sudo",
+        "systemd",
+    ],
+    Flavour.PROXMOX: [
+        "bash",
+        "chrony",
+        "coreutils",
+        "kmod",
+        "open-iscsi",
+        "openssh-server",
+        "postfix",
+        "proxmox-ve",
+        "pve-manager",
+        "qemu-server",
+        "systemd",
+    ],
+}
+SERVICES = {
+    Flavour.DEBIAN_13: ["ssh", "systemd-journald"],
+    Flavour.PROXMOX: [
+        "corosync",
+        "pve-cluster",
+        "pve-ha-crm",
+        "pve-ha-lrm",
+        "pveproxy",
+        "ssh",
+        "systemd-journald",
+    ],
+}
+
+
+def check_root(root: Path) -> None:
+    """
+    Check that a root can be used in commands without quoting.
+
+    Args:
+        root (Path): Root of the sandbox
+
+    Raises:
+        ValueError: Raised if the path has characters that need quoting
+
+    """
+    if not root.is_absolute() or not SAFE_ROOT.fullmatch(str(root)):
+        err_msg = (
+            f"Sandbox root must be an absolute path without spaces: {root}"
+        )
+        raise ValueError(err_msg)
+
+
+def rewrite_paths(command: str, root: Path) -> str:
+    """
+    Move the absolute paths of a command into a sandbox's root.
+
+    Paths that are already in the root are left alone.
+
+    Args:
+        command (str): Shell command for the host
+        root (Path): Root of the sandbox
+
+    Returns:
+        str: Command for the sandbox
+
+    """
+    root_str = str(root)
+
+    def replace(match: re.Match[str]) -> str:
+        if command.startswith(root_str, match.start()):
+            return match.group()
+        return f"{root_str}/"
+
+    return ABSOLUTE_PATH.sub(replace, command)
+
+
+def restore_paths(output: str, root: Path) -> str:
+    """
+    Move paths in a sandbox's root back to where they'd be on the host.
+
+    Args:
+        output (str): Output of a command in the sandbox
+        root (Path): Root of the sandbox
+
+    Returns:
+        str: Output as the host would print it
+
+    """
+    return output.replace(f"{root}/", "/")
+
+
+def rewrite_script(script: bytes, root: Path) -> bytes:
+    """
+    Move the absolute paths of a script into a sandbox's root.
+
+    The interpreter on the first line is kept so the script can run.
+
+    Args:
+        script (bytes): Contents of the script
+        root (Path): Root of the sandbox
+
+    Returns:
+        bytes: Script for the sandbox
+
+    """
+    shebang, sep, body = script.decode().partition("\n")
+    return (shebang + sep + rewrite_paths(body, root)).encode()
+
+
+def write(path: Path, content: str) -> None:
+    """Write a file, creating its parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def install_stubs(root: Path, flavour: Flavour) -> Path:
+    """
+    Write the stub commands of a sandbox.
+
+    Args:
+        root (Path): Root of the sandbox
+        flavour (Flavour): System the sandbox emulates
+
+    Returns:
+        Path: Directory of the stubs to put first on PATH
+
+    """
+    bin_dir = root / STATE_DIR / "bin"
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    names = list(commands.COMMANDS)
+    if flavour == Flavour.PROXMOX:
+        names += list(commands.PROXMOX_COMMANDS)
+    for name in names:
+        stub = bin_dir / name
+        stub.write_text(
+            "#!/bin/sh\n"
+            f'exec "{sys.executable}" -I "{commands.__file__}" {name} "$@"\n'
+        )
+        stub.chmod(0o755)
+    return bin_dir
+
+
+def create_root(root: Path, flavour: Flavour) -> None:
+    """
+    Create the files of a freshly installed host in a sandbox's root.
+
+    An existing root is only replaced if it was created as a sandbox so a
+    mistyped root can't delete anything else.
+
+    Args:
+        root (Path): Root of the sandbox
+        flavour (Flavour): System the sandbox emulates
+
+    Raises:
+        ValueError: Raised if the root is a directory with files that isn't a
+            sandbox
+
+    """
+    check_root(root)
+    if (root / STATE_DIR / "config.json").exists():
+        shutil.rmtree(root)
+    elif root.exists() and (not root.is_dir() or any(root.iterdir())):
+        err_msg = (
+            f"Sandbox root isn't empty and isn't a sandbox, not replacing it: "
+            f"{root}"
+        )
+        raise ValueError(err_msg)
+
+    release = KERNEL_RELEASES[flavour]
+    hostname = "pve" if flavour == Flavour.PROXMOX else "debian"
+    write(
+        root / STATE_DIR / "config.json",
+        json.dumps(
+            {
+                "flavour": flavour,
+                "links": LINKS[flavour],
+            }
+        )
+        + "\n",
+    )
+    write(
+        root / STATE_DIR / "units.json",
+        json.dumps(
+            {
+                f"{service}.service": {"running": True, "enabled": True}
+                for service in SERVICES[flavour]
+            },
+            indent=2,
+        ),
+    )
+    write(root / "etc" / "hostname", f"{hostname}\n")
+    write(root / "etc" / "debian_version", "13.1\n")
+    write(
+        root / "etc" / "os-release",
+        'PRETTY_NAME="Debian GNU/Linux 13 (trixie)"\nNAME="Debian GNU/Linux"\n'
+        'VERSION_ID="13"\nVERSION_CODENAME=trixie\nID=debian\n',
+    )
+    (root / "etc" / "modprobe.d").mkdir(parents=True)
+    (root / "tmp").mkdir()
+    (root / "root").mkdir()
+    write(root / "proc" / "sys" / "kernel" / "osrelease", f"{release}\n")
+    write(
+        root / "proc" / "modules",
+        "".join(
+            f"{name} 16384 0 - Live 0x0000000000000000\n"
+            for name in LOADED_MODULES
+        ),
+    )
+    write(
+        root / "proc" / "cpuinfo",
+        "processor\t: 0\nvendor_id\t: GenuineIntel\ncpu family\t: 6\n",
+    )
+    write(root / "proc" / "mounts", "".join(f"{x}\n" for x in MOUNTS))
+    for name in FS_MODULES:
+        write(
+            root
+            / "usr"
+            / "lib"
+            / "modules"
+            / release
+            / "kernel"
+            / "fs"
+            / name
+            / f"{name}.ko.xz",
+            "",
+        )
+    write(
+        root
+        / "usr"
+        / "lib"
+        / "modules"
+        / release
+        / "kernel"
+        / "drivers"
+        / "usb"
+        / "storage"
+        / "usb-storage.ko.xz",
+        "",
+    )
+    write(
+        root / "var" / "lib" / "dpkg" / "status",
+        "\n".join(
+            f"Package: {name}\nStatus: install ok installed\nVersion: 1.0\n"
+            "Architecture: amd64\n"
+            for name in PACKAGES[flavour]
+        ),
+    )
+    (root / "var" / "lib" / "apt" / "periodic").mkdir(parents=True)
+
+    if flavour == Flavour.PROXMOX:
+        (root / "etc" / "pve" / "qemu-server").mkdir(parents=True)
+        (root / "var" / "lib" / "vz" / "snippets").mkdir(parents=True)
+        # a stand-in cloud image with checksums so templates can be created
+        image = b"sandbox cloud image\n"
+        downloads = root / STATE_DIR / "downloads"
+        downloads.mkdir(parents=True)
+        (downloads / CLOUD_IMAGE).write_bytes(image)
+        write(
+            downloads / "SHA512SUMS",
+            f"{hashlib.sha512(image).hexdigest()}  {CLOUD_IMAGE}\n",
+        )
@@ -0,0 +1,91 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Define the @stub connector that answers commands from a table.
+
+pyinfra only added its own @fake connector after the oldest version this
+package supports so the benchmarks bring their own.
+"""
+
+from collections.abc import Iterator
+from io import IOBase
+from typing import Any, override
+
+from pyinfra.api.command import StringCommand
+from pyinfra.connectors.base import BaseConnector, ConnectorData, DataMeta
+from pyinfra.connectors.util import CommandOutput, OutputLine
+
+
+class StubConnectorData(ConnectorData, total=False):
+    """Host data used by the @stub connector."""
+
+    stub_responses: dict[str, str | list[str]]
+
+
+class StubConnector(BaseConnector):
+    """
+    Answer commands instantly without running them.
+
+    Commands that contain a key of the host's stub_responses succeed with its
+    lines as their output. Every other command succeeds with no output.
+    """
+
+    handles_execution = True
+
+    data_cls = StubConnectorData
+    data_meta = {  # noqa: RUF012
+        "stub_responses": DataMeta(
+            "Substrings of commands mapped to their output", default={}
+        ),
+    }
+
+    @override
+    @staticmethod
+    def make_names_data(
+        name: str | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any], list[str]]]:
+        yield f"@stub/{name}" if name else "@stub", {}, ["@stub"]
+
+    @override
+    def run_shell_command(
+        self,
+        command: StringCommand,
+        print_output: bool = False,
+        print_input: bool = False,
+        **arguments: Any,
+    ) -> tuple[bool, CommandOutput]:
+        command_str = (
+            command if isinstance(command, str) else command.get_raw_value()
+        )
+        for matcher, response in self.data.get("stub_responses", {}).items():
+            if matcher in command_str:
+                lines = [response] if isinstance(response, str) else response
+                return True, CommandOutput(
+                    [OutputLine("stdout", line) for line in lines]
+                )
+        return True, CommandOutput([])
+
+    @override
+    def put_file(
+        self,
+        filename_or_io: str | IOBase,
+        remote_filename: str,
+        remote_temp_filename: str | None = None,
+        print_output: bool = False,
+        print_input: bool = False,
+        **arguments: Any,
+    ) -> bool:
+        return True
+
+    @override
+    def get_file(
+        self,
+        remote_filename: str,
+        filename_or_io: str | IOBase,
+        remote_temp_filename: str | None = None,
+        print_output: bool = False,
+        print_input: bool = False,
+        **arguments: Any,
+    ) -> bool:
+        return True
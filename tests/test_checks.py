@@ -0,0 +1,31 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Load and select the hardening checks."""
+
+import pytest
+
+from home_server.hardening.checks.debian_13 import load_checks
+
+
+@pytest.mark.parametrize(
+    ("sections", "names"),
+    [
+        (["1"], {f"1.1.1.{i}" for i in range(1, 12)}),
+        (["1.1.1.1"], {"1.1.1.1"}),
+        (["1.1.1.1", "1.1.1.10"], {"1.1.1.1", "1.1.1.10"}),
+    ],
+)
+def test_sections(sections: list[str], names: set[str]) -> None:
+    """Sections should select the checks in them."""
+    index = load_checks(sections)
+    assert {
+        check.name for plan in index.plans.values() for check in plan
+    } == names
+
+
+@pytest.mark.parametrize("section", ["1.1.1.99", "1,1", "2"])
+def test_unknown_sections(section: str) -> None:
+    """Sections without checks should be rejected with the valid ones."""
+    with pytest.raises(ValueError, match=r"Unknown sections.*1\.1\.1\.11"):
+        load_checks([section])
@@ -0,0 +1,54 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Cache host facts on disk between runs."""
+
+from pathlib import Path
+
+from pyinfra.api import Config, Inventory, State
+from pyinfra.facts.server import Kernel
+
+from home_server.facts.cache import FactCache, cache_key
+
+HOST_NAME = "@sandbox/host"
+TTL = 300
+
+
+def make_state(**config: object) -> State:
+    """Make a state with one host that isn't connected to."""
+    return State(Inventory(([(HOST_NAME, {})], {})), Config(**config))
+
+
+def test_cache_key() -> None:
+    """Facts fetched as other users should be cached separately."""
+    host = make_state().inventory.get_host(HOST_NAME)
+    sudo_host = make_state(SUDO=True).inventory.get_host(HOST_NAME)
+
+    key = cache_key(host, Kernel, (), {})
+    assert cache_key(host, Kernel, (), {"_sudo": False}) == key
+    assert cache_key(host, Kernel, (), {"_sudo": True}) != key
+    assert cache_key(sudo_host, Kernel, (), {}) != key
+    assert cache_key(sudo_host, Kernel, (), {}) == cache_key(
+        host, Kernel, (), {"_sudo": True}
+    )
+    assert "secret" not in cache_key(
+        host, Kernel, (), {"_sudo": True, "_sudo_password": "secret"}
+    )
+
+
+def test_remove_before_ops(tmp_path: Path) -> None:
+    """A host's cached facts shouldn't outlive a run that stops part way."""
+    state = make_state()
+    host = state.inventory.get_host(HOST_NAME)
+    cache = FactCache(tmp_path, TTL)
+    cache.install(state)
+    host.get_fact(Kernel)
+    cache.save(state)
+    cache_file = next(tmp_path.iterdir())
+
+    cache = FactCache(tmp_path, TTL)
+    cache.install(state)
+    cache.operation_host_start(state, host, "op")
+    assert not cache_file.exists()
+    cache.save(state)
+    assert cache_file.exists()
@@ -0,0 +1,248 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Parse the output of facts' commands."""
+
+import json
+
+import pytest
+
+from home_server.facts.kernel import FilesystemModules
+from home_server.facts.qm import (
+    List,
+    VmIds,
+    Vms,
+    parse_config,
+    parse_nic,
+    parse_property_string,
+)
+from home_server.facts.util import SECTION_PREFIX, split_sections
+
+FS = "/usr/lib/modules/6.12.0/kernel/fs"
+MAC = "BC:24:11:00:00:01"
+
+
+def sections(**lines: list[str]) -> list[str]:
+    """Join lines into the output of a fact with sections."""
+    output = []
+    for name, section_lines in lines.items():
+        output.append(f"{SECTION_PREFIX}{name}")
+        output.extend(section_lines)
+    return output
+
+
+@pytest.mark.parametrize(
+    ("output", "prefix", "expected"),
+    [
+        ([], SECTION_PREFIX, {}),
+        (["no sections"], SECTION_PREFIX, {}),
+        (
+            ["before", f"{SECTION_PREFIX}a", "1", "2", f"{SECTION_PREFIX}b"],
+            SECTION_PREFIX,
+            {"a": ["1", "2"], "b": []},
+        ),
+        (
+            [f"{SECTION_PREFIX}a", "1", f"{SECTION_PREFIX}a", "2"],
+            SECTION_PREFIX,
+            {"a": ["1", "2"]},
+        ),
+        (
+            ["@@0", "1", f"{SECTION_PREFIX}a", "@@1"],
+            "@@",
+            {"0": ["1", f"{SECTION_PREFIX}a"], "1": []},
+        ),
+    ],
+)
+def test_split_sections(
+    output: list[str], prefix: str, expected: dict[str, list[str]]
+) -> None:
+    """Output should be split by the lines that start with the prefix."""
+    assert split_sections(output, prefix) == expected
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        ([], {"mounted": [], "loaded": [], "loadable": []}),
+        (["garbage", ""], {"mounted": [], "loaded": [], "loadable": []}),
+        (
+            sections(available=[f"{FS}/cramfs/cramfs.ko.xz"]),
+            {"mounted": [], "loaded": [], "loadable": ["cramfs"]},
+        ),
+        (
+            sections(
+                mounted=["ext4", "tmpfs"],
+                loaded=["Module", "udf"],
+                available=[
+                    f"{FS}/ext4/ext4.ko",
+                    f"{FS}/udf/udf.ko.zst",
+                    f"{FS}/nls/nls_utf8.ko",
+                ],
+            ),
+            {"mounted": ["ext4"], "loaded": ["udf"], "loadable": []},
+        ),
+        (
+            sections(
+                config=["install cramfs /bin/false", "blacklist cramfs"],
+                available=[f"{FS}/cramfs/cramfs.ko", f"{FS}/hfs/hfs.ko"],
+            ),
+            {"mounted": [], "loaded": [], "loadable": ["hfs"]},
+        ),
+        (
+            sections(
+                config=["blacklist hfs", "install hfsplus /bin/false"],
+                available=[f"{FS}/hfs/hfs.ko", f"{FS}/hfsplus/hfsplus.ko"],
+            ),
+            {"mounted": [], "loaded": [], "loadable": ["hfs", "hfsplus"]},
+        ),
+        (
+            sections(
+                config=["install fuse_blk /bin/false", "blacklist fuse_blk"],
+                available=[f"{FS}/fuse-blk/fuse-blk.ko"],
+            ),
+            {"mounted": [], "loaded": [], "loadable": []},
+        ),
+    ],
+)
+def test_filesystem_modules(
+    output: list[str], expected: dict[str, list[str]]
+) -> None:
+    """Modules should be mounted, loaded or loadable unless blacklisted."""
+    assert FilesystemModules().process(output) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("", {"volume": ""}),
+        ("local:vm-100-disk-0", {"volume": "local:vm-100-disk-0"}),
+        (
+            "local:vm-100-disk-0,size=8G,ssd=1",
+            {"volume": "local:vm-100-disk-0", "size": "8G", "ssd": "1"},
+        ),
+        ("size=8G", {"size": "8G"}),
+        ("a=b=c", {"a": "b=c"}),
+    ],
+)
+def test_parse_property_string(value: str, expected: dict[str, str]) -> None:
+    """Items without a key should use the default key."""
+    assert parse_property_string(value, "volume") == expected
+
+
+@pytest.mark.parametrize(
+    ("lines", "expected"),
+    [
+        ([], {}),
+        (["no separator", ""], {}),
+        (["#description: kept out", "name: web"], {"name": "web"}),
+        (
+            ["name: web", "net0: virtio=X,bridge=vmbr0", "[snapshot]", "x: y"],
+            {"name": "web", "net0": "virtio=X,bridge=vmbr0"},
+        ),
+    ],
+)
+def test_parse_config(lines: list[str], expected: dict[str, str]) -> None:
+    """Only the current config should be parsed."""
+    assert parse_config(lines) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (
+            f"virtio={MAC},bridge=vmbr0",
+            {"model": "virtio", "mac": MAC, "bridge": "vmbr0"},
+        ),
+        ("e1000,bridge=vmbr0", {"model": "e1000", "bridge": "vmbr0"}),
+        (f"unknown={MAC}", {"unknown": MAC}),
+    ],
+)
+def test_parse_nic(value: str, expected: dict[str, str]) -> None:
+    """The model's value should be the MAC address."""
+    assert parse_nic(value) == expected
+
+
+def vms_output(status: list[dict[str, object]], **configs: str) -> list[str]:
+    """Make the output of the Vms fact's command."""
+    output = [f"{SECTION_PREFIX}status", json.dumps(status)]
+    for vm_id, config in configs.items():
+        output.append(f"{SECTION_PREFIX}config:{vm_id.removeprefix('vm')}")
+        output.extend(config.splitlines())
+    return output
+
+
+def test_vms() -> None:
+    """VMs should combine their status with their config."""
+    output = vms_output(
+        [
+            {
+                "vmid": 101,
+                "status": "stopped",
+                "maxmem": 512 * 1024**2,
+                "maxdisk": 0,
+            },
+            {
+                "vmid": "100",
+                "name": "web",
+                "status": "running",
+                "maxmem": 2048 * 1024**2,
+                "maxdisk": 8 * 1024**3,
+                "pid": "1234",
+            },
+        ],
+        vm100=(
+            "name: old\n"
+            "scsi0: local:vm-100-disk-0,size=8G\n"
+            f"net0: virtio={MAC},bridge=vmbr0\n"
+            "[pending]\n"
+            "net1: e1000\n"
+        ),
+    )
+    vms = Vms().process(output)
+    assert list(vms) == [100, 101]
+    assert vms[100] == {
+        "id": 100,
+        "name": "web",
+        "status": "running",
+        "mem": 2048,
+        "boot_disk": 8.0,
+        "pid": 1234,
+        "config": {
+            "name": "old",
+            "scsi0": "local:vm-100-disk-0,size=8G",
+            "net0": f"virtio={MAC},bridge=vmbr0",
+        },
+        "disks": {"scsi0": {"volume": "local:vm-100-disk-0", "size": "8G"}},
+        "nics": {"net0": {"model": "virtio", "mac": MAC, "bridge": "vmbr0"}},
+    }
+    assert vms[101]["name"] == ""
+    assert vms[101]["pid"] is None
+    assert vms[101]["config"] == {}
+
+    assert List().process_data(vms) == [
+        {
+            "id": 100,
+            "name": "web",
+            "status": "running",
+            "mem": 2048,
+            "boot_disk": 8.0,
+            "pid": 1234,
+        },
+        {
+            "id": 101,
+            "name": "",
+            "status": "stopped",
+            "mem": 512,
+            "boot_disk": 0.0,
+            "pid": 0,
+        },
+    ]
+    assert VmIds().process_data(vms) == frozenset({100, 101})
+
+
+@pytest.mark.parametrize(
+    "output", [[], [f"{SECTION_PREFIX}status"], vms_output([])]
+)
+def test_vms_empty(output: list[str]) -> None:
+    """A host without VMs or pvesh output should have no VMs."""
+    assert Vms().process(output) == {}
@@ -0,0 +1,233 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Load inventories from YAML files and directories."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from pyinfra.api import Config, State, connect
+
+from home_server.inventory import (
+    load_inventory_data,
+    make_inventory_from_yaml,
+    validate,
+)
+from sandbox.root import Flavour, create_root
+
+# seconds to connect to Proxmox nodes that the inventory should use
+CONNECT_TIMEOUT = 3
+SERVERS = {"hosts": [{"web": {"port": 22}}]}
+PATH = Path("inventory.yaml")
+
+
+def write(path: Path, inventory: dict[str, object]) -> Path:
+    """Write an inventory file, creating its directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(inventory))
+    return path
+
+
+@pytest.mark.parametrize(
+    ("inventory", "errors"),
+    [
+        (None, []),
+        ({}, []),
+        ({"servers": SERVERS}, []),
+        ({"servers": {"hosts": [{"web": None}]}}, []),
+        ([], ["expected a mapping of groups"]),
+        ({"servers": []}, ["servers: expected a mapping with hosts"]),
+        ({"servers": {}}, ["servers: hosts: expected a list"]),
+        (
+            {"servers": {**SERVERS, "host": []}},
+            ["servers: unexpected keys ['host']"],
+        ),
+        (
+            {"servers": {**SERVERS, "data": []}},
+            ["servers: data: expected a mapping"],
+        ),
+        (
+            {"servers": {"hosts": ["web", {"a": {}, "b": {}}, {"c": []}]}},
+            [
+                f"servers: hosts[{i}]: expected a host name mapped to its data"
+                for i in range(3)
+            ],
+        ),
+        ({"_include": ["a.yaml", "b/"]}, []),
+        ({"_include": "a.yaml"}, ["_include: expected a list of paths"]),
+        ({"_include": [1]}, ["_include: expected a list of paths"]),
+        ({"_proxmox": {"nodes": [{"pve1": {}}], "ttl": 60}}, []),
+        ({"_proxmox": []}, ["_proxmox: expected a mapping with nodes"]),
+        ({"_proxmox": {}}, ["_proxmox: nodes: expected a list"]),
+        (
+            {
+                "_proxmox": {
+                    "nodes": [],
+                    "data": [],
+                    "domain": 1,
+                    "ttl": True,
+                    "include_stopped": "yes",
+                    "node": [],
+                }
+            },
+            [
+                "_proxmox: unexpected keys ['node']",
+                "_proxmox: data: expected a mapping",
+                "_proxmox: domain: expected a string",
+                "_proxmox: ttl: expected a number of seconds",
+                "_proxmox: include_stopped: expected a boolean",
+            ],
+        ),
+    ],
+)
+def test_validate(inventory: object, errors: list[str]) -> None:
+    """Files should be checked against the structure of an inventory."""
+    assert validate(inventory, PATH) == [f"{PATH}: {error}" for error in errors]
+
+
+def test_includes(tmp_path: Path) -> None:
+    """Included files and directories should be merged into the inventory."""
+    write(tmp_path / "nodes" / "b.yaml", {"servers": {"hosts": [{"b": {}}]}})
+    write(
+        tmp_path / "nodes" / "a.yml",
+        {"servers": {"data": {"user": "root"}, "hosts": [{"a": {}}]}},
+    )
+    (tmp_path / "nodes" / "notes.txt").write_text("not yaml")
+    write(
+        tmp_path / "shared" / "web.yaml",
+        {"servers": {"hosts": [{"web": {"port": 22}}]}},
+    )
+    inventory = write(
+        tmp_path / "inventory.yaml",
+        {
+            "_include": ["nodes/", "shared/web.yaml"],
+            "servers": {"hosts": [{"web": {"user": "admin"}}]},
+        },
+    )
+    hosts, groups, _ = load_inventory_data(inventory)
+    assert groups == {"servers": (["web", "a", "b"], {"user": "root"})}
+    assert hosts == {
+        "web": {"user": "admin", "port": 22},
+        "a": {},
+        "b": {},
+    }
+
+
+@pytest.mark.parametrize(
+    ("files", "error"),
+    [
+        ({"inventory.yaml": "servers: [unclosed"}, "inventory.yaml: while"),
+        (
+            {"inventory.yaml": {"_include": ["missing.yaml"]}},
+            "Cannot find inventory at",
+        ),
+        (
+            {
+                "inventory.yaml": {"_include": ["other.yaml"]},
+                "other.yaml": {"_include": ["inventory.yaml"]},
+            },
+            "inventory.yaml: included recursively",
+        ),
+        (
+            {
+                "inventory.yaml": {"_include": ["other.yaml"], "s": SERVERS},
+                "other.yaml": {"s": {"hosts": [{"web": {"port": 2222}}]}},
+            },
+            "other.yaml: web: conflicting values for port",
+        ),
+        ({"inventory.yaml": {"servers": {}}}, "servers: hosts: expected"),
+    ],
+)
+def test_invalid(
+    tmp_path: Path, files: dict[str, dict[str, object] | str], error: str
+) -> None:
+    """Invalid inventories should be rejected with every error found."""
+    for name, content in files.items():
+        if isinstance(content, str):
+            (tmp_path / name).write_text(content)
+        else:
+            write(tmp_path / name, content)
+    with pytest.raises(ValueError, match="Invalid inventory") as e:
+        load_inventory_data(tmp_path / "inventory.yaml")
+    assert error in str(e.value)
+
+
+def test_compiled_cache(tmp_path: Path) -> None:
+    """Compiled inventories should be used until a file they read changes."""
+    cache_dir = tmp_path / "cache"
+    included = write(tmp_path / "nodes" / "a.yaml", {"servers": SERVERS})
+    inventory = write(tmp_path / "inventory.yaml", {"_include": ["nodes/"]})
+    hosts, _, _ = load_inventory_data(inventory, cache_dir)
+    assert hosts == {"web": {"port": 22}}
+
+    # a cached inventory doesn't read the files again
+    stat = included.stat()
+    included.write_text("servers: [unclosed")
+    os.utime(included, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    hosts, _, _ = load_inventory_data(inventory, cache_dir)
+    assert hosts == {"web": {"port": 22}}
+
+    write(tmp_path / "nodes" / "b.yaml", {"db": {"hosts": [{"db": {}}]}})
+    write(included, {"servers": SERVERS})
+    hosts, groups, _ = load_inventory_data(inventory, cache_dir)
+    assert list(groups) == ["servers", "db"]
+
+
+def test_group_names(tmp_path: Path) -> None:
+    """Groups named like the inventory's own keys should stay groups."""
+    inventory = write(
+        tmp_path / "inventory.yaml",
+        {
+            "include": {"hosts": [{"web": {}}]},
+            "proxmox": {"data": {"ssh_user": "root"}, "hosts": [{"pve1": {}}]},
+        },
+    )
+    hosts, groups, proxmox = load_inventory_data(inventory)
+    assert groups == {
+        "include": (["web"], {}),
+        "proxmox": (["pve1"], {"ssh_user": "root"}),
+    }
+    assert list(hosts) == ["web", "pve1"]
+    assert proxmox == []
+
+
+def test_proxmox_guests(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Guests should be added by querying nodes with the run's config."""
+    root = tmp_path / "pve"
+    create_root(root, Flavour.PROXMOX)
+    vm_config = root / "etc" / "pve" / "qemu-server" / "101.conf"
+    vm_config.parent.mkdir(parents=True, exist_ok=True)
+    vm_config.write_text("name: web\ntags: app\n")
+    inventory = write(
+        tmp_path / "inventory.yaml",
+        {
+            "_proxmox": {
+                "nodes": [
+                    {
+                        "@sandbox/pve": {
+                            "sandbox_root": str(root),
+                            "sandbox_flavour": "proxmox",
+                        }
+                    }
+                ],
+                "include_stopped": True,
+            },
+        },
+    )
+    timeouts: list[int] = []
+
+    def connect_all(state: State) -> None:
+        timeouts.append(state.config.CONNECT_TIMEOUT)
+        connect.connect_all(state)
+
+    monkeypatch.setattr(
+        "home_server.proxmox_inventory.connect_all", connect_all
+    )
+    config = Config(CONNECT_TIMEOUT=CONNECT_TIMEOUT)
+    hosts = make_inventory_from_yaml(inventory, config=config)
+    assert timeouts == [CONNECT_TIMEOUT]
+    assert [host.name for host in hosts.get_group("proxmox_tag_app")] == ["web"]
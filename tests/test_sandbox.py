@@ -0,0 +1,520 @@
+# Copyright (c) 2026 sharm294
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Run harden and configure end to end against sandbox hosts.
+
+Nothing leaves this machine so these run offline. The commands each run sends
+are counted to catch changes that add round trips to hosts.
+"""
+
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, override
+
+import pytest
+from pyinfra.api import Config, Host, State
+from pyinfra.api.connect import connect_all
+from pyinfra.api.exceptions import ConnectError, PyinfraError
+from pyinfra.operations import server
+
+from home_server.hardening.checks import Check, CheckMeta, Profile
+from home_server.inventory import make_inventory_from_yaml
+from home_server.main import make_parser
+from home_server.watch.main import EventWriter, Watcher, watched_components
+from sandbox.connector import SandboxConnector, read_commands
+from sandbox.root import (
+    CLOUD_IMAGE,
+    STATE_DIR,
+    Flavour,
+    create_root,
+)
+
+# round trips allowed for hardening a fresh host with the default checks
+HARDEN_ROUND_TRIPS = 6
+# seconds an audit with a stalled host may take with a 2 second host timeout
+AUDIT_TIMEOUT_SECONDS = 10
+
+
+@pytest.fixture(autouse=True)
+def xdg_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep caches and state out of the user's directories."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+
+
+def make_inventory(tmp_path: Path, flavour: str) -> tuple[Path, Path]:
+    """Write an inventory with one sandbox host and get it and its root."""
+    root = tmp_path / "root"
+    inventory = tmp_path / "inventory.yaml"
+    inventory.write_text(
+        json.dumps(
+            {
+                "sandboxes": {
+                    "hosts": [
+                        {
+                            "@sandbox/host": {
+                                "sandbox_root": str(root),
+                                "sandbox_flavour": flavour,
+                            }
+                        }
+                    ]
+                }
+            }
+        )
+    )
+    return inventory, root
+
+
+def make_fleet_inventory(
+    tmp_path: Path, roots: dict[str, Path], flavour: str
+) -> Path:
+    """Write an inventory with a sandbox host for each named root."""
+    inventory = tmp_path / "inventory.yaml"
+    inventory.write_text(
+        json.dumps(
+            {
+                "sandboxes": {
+                    "hosts": [
+                        {
+                            f"@sandbox/{name}": {
+                                "sandbox_root": str(root),
+                                "sandbox_flavour": flavour,
+                            }
+                        }
+                        for name, root in roots.items()
+                    ]
+                }
+            }
+        )
+    )
+    return inventory
+
+
+def run(*argv: str) -> None:
+    """Run the CLI with arguments."""
+    args = make_parser().parse_args(argv)
+    args.func(args)
+
+
+def test_harden(tmp_path: Path) -> None:
+    """Hardening should blacklist modules and leave none loadable."""
+    inventory, root = make_inventory(tmp_path, "debian-13")
+    run("harden", str(inventory), "--full")
+
+    commands = read_commands(root)
+    print(f"harden: {len(commands)} round trips")
+    assert len(commands) <= HARDEN_ROUND_TRIPS
+    # the kernel is fetched to build the prefetch command. The rest of the
+    # facts are prefetched in one command instead of while planning.
+    assert not [record for record in commands[2:] if record["op"] is None]
+    config = (root / "etc" / "modprobe.d" / "cis.conf").read_text()
+    assert "install cramfs /bin/false" in config
+    assert "blacklist cramfs" in config
+
+    report = tmp_path / "report.jsonl"
+    run("harden", str(inventory), "--audit", "--output", str(report))
+    results = [json.loads(line) for line in report.read_text().splitlines()]
+    audit = next(result for result in results if result["check"] == "1.1.1.11")
+    assert "cramfs" not in audit["result"]["loadable"]
+
+
+def test_harden_fact_cache(tmp_path: Path) -> None:
+    """Hardening a converged host should take every fact from the cache."""
+    inventory, root = make_inventory(tmp_path, "debian-13")
+    argv = ("harden", str(inventory), "--full", "--fact-cache-ttl", "600")
+    # the first run changes the host and the second caches its new facts
+    run(*argv)
+    run(*argv)
+
+    converged = len(read_commands(root))
+    run(*argv)
+    # a prefetch that ignored the cache would fetch every fact again here
+    assert read_commands(root)[converged:] == []
+
+
+def test_harden_keeps_blacklist(tmp_path: Path) -> None:
+    """Hardening should keep lines blacklisted by other selections or admins."""
+    inventory, root = make_inventory(tmp_path, "debian-13")
+    run("harden", str(inventory), "--level", "2", "--full")
+    config = root / "etc" / "modprobe.d" / "cis.conf"
+    config.write_text(config.read_text() + "blacklist nouveau\n")
+
+    run("harden", str(inventory), "--sections", "1.1.1.1", "--full")
+    run("harden", str(inventory), "--level", "1", "--full")
+    lines = config.read_text().splitlines()
+    for module in ("cramfs", "overlay", "squashfs", "udf", "usb-storage"):
+        assert lines.count(f"install {module} /bin/false") == 1
+        assert lines.count(f"blacklist {module}") == 1
+    assert "blacklist nouveau" in lines
+
+
+def test_configure_proxmox_host(tmp_path: Path) -> None:
+    """Configuring should create the VMs once and then change nothing."""
+    inventory, root = make_inventory(tmp_path, "proxmox")
+    run("configure", str(inventory), "--preset", "proxmox-host")
+    vm_configs = root / "etc" / "pve" / "qemu-server"
+    assert sorted(path.name for path in vm_configs.iterdir()) == [
+        "100.conf",
+        "8000.conf",
+    ]
+    assert "template: 1" in (vm_configs / "8000.conf").read_text()
+    assert (root / "run" / "qemu-server" / "100.pid").exists()
+    commands = [record["command"] for record in read_commands(root)]
+    assert "apt-get update" in commands
+
+    first_run = len(commands)
+    run("configure", str(inventory), "--preset", "proxmox-host")
+    commands = [record["command"] for record in read_commands(root)[first_run:]]
+    assert not [
+        command
+        for command in commands
+        if command.startswith(("qm ", "DEBIAN_FRONTEND", "apt-get update"))
+    ]
+
+
+def test_trace(tmp_path: Path) -> None:
+    """Tracing should record each kind of span on the host's track."""
+    inventory, _ = make_inventory(tmp_path, "debian-13")
+    trace = tmp_path / "trace.json"
+    run("harden", str(inventory), "--full", "--trace", str(trace))
+
+    events = json.loads(trace.read_text())["traceEvents"]
+    tracks = {
+        event["args"]["name"]: event["tid"]
+        for event in events
+        if event["ph"] == "M"
+    }
+    spans = [event for event in events if event["ph"] == "X"]
+    host_spans = {
+        (span["cat"], span["name"])
+        for span in spans
+        if span["tid"] == tracks["@sandbox/host"]
+    }
+    assert {category for category, _ in host_spans} == {
+        "connect",
+        "fact",
+        "execute",
+        "check",
+    }
+    assert ("fact", "FactPrefetch") in host_spans
+    run_spans = {
+        (span["cat"], span["name"])
+        for span in spans
+        if span["tid"] == tracks["run"]
+    }
+    assert ("phase", "execute") in run_spans
+    assert ("plan", "1.1.1.1") in run_spans
+    assert ("check", "1.1.1.1") in {
+        (span["cat"], span["name"]) for span in spans
+    }
+
+
+def test_resume(tmp_path: Path) -> None:
+    """Resuming should skip complete hosts and the ops that succeeded."""
+    roots = {name: tmp_path / name for name in ("good", "bad")}
+    inventory = make_fleet_inventory(tmp_path, roots, "proxmox")
+    # creating the template fails without the cloud image
+    create_root(roots["bad"], Flavour.PROXMOX)
+    image = roots["bad"] / STATE_DIR / "downloads" / CLOUD_IMAGE
+    image.rename(tmp_path / CLOUD_IMAGE)
+    run("configure", str(inventory), "--preset", "proxmox-host")
+    assert not (
+        roots["bad"] / "etc" / "pve" / "qemu-server" / "100.conf"
+    ).exists()
+
+    first_run = {name: len(read_commands(root)) for name, root in roots.items()}
+    (tmp_path / CLOUD_IMAGE).rename(image)
+    run("configure", str(inventory), "--preset", "proxmox-host", "--resume")
+    assert len(read_commands(roots["good"])) == first_run["good"]
+    commands = [
+        record["command"]
+        for record in read_commands(roots["bad"])[first_run["bad"] :]
+    ]
+    assert not [
+        command for command in commands if command.startswith("DEBIAN_FRONTEND")
+    ]
+    assert "qm template 8000" in commands
+    assert (roots["bad"] / "etc" / "pve" / "qemu-server" / "100.conf").exists()
+
+
+def test_create_root(tmp_path: Path) -> None:
+    """Only sandboxes and empty directories should become sandbox roots."""
+    root = tmp_path / "root"
+    root.mkdir()
+    create_root(root, Flavour.DEBIAN_13)
+    # an existing sandbox is replaced
+    (root / "etc" / "hostname").unlink()
+    create_root(root, Flavour.PROXMOX)
+    assert (root / "etc" / "hostname").read_text() == "pve\n"
+
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "notes.txt").write_text("keep\n")
+    with pytest.raises(ValueError, match="isn't a sandbox"):
+        create_root(data, Flavour.DEBIAN_13)
+    assert (data / "notes.txt").read_text() == "keep\n"
+
+
+def test_resume_after_connect_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Resuming shouldn't use the journal of the run before a failed one."""
+    inventory, root = make_inventory(tmp_path, "debian-13")
+    run("harden", str(inventory), "--full")
+    config = root / "etc" / "modprobe.d" / "cis.conf"
+    config.unlink()
+
+    def refuse(_: SandboxConnector) -> None:
+        err_msg = "connection refused"
+        raise ConnectError(err_msg)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(SandboxConnector, "connect", refuse)
+        with pytest.raises(PyinfraError):
+            run("harden", str(inventory), "--full")
+
+    run("harden", str(inventory), "--full", "--resume")
+    assert config.exists()
+
+
+def test_audit_timeout(tmp_path: Path) -> None:
+    """A host that stalls should time out without holding back the others."""
+    roots = {name: tmp_path / name for name in ("fast", "slow")}
+    inventory = make_fleet_inventory(tmp_path, roots, "debian-13")
+    # reading mounts blocks until something writes to the pipe
+    create_root(roots["slow"], Flavour.DEBIAN_13)
+    mounts = roots["slow"] / "proc" / "mounts"
+    mounts.unlink()
+    os.mkfifo(mounts)
+
+    report = tmp_path / "report.jsonl"
+    start = time.perf_counter()
+    try:
+        run(
+            "harden",
+            str(inventory),
+            "--audit",
+            "--host-timeout",
+            "2",
+            "--output",
+            str(report),
+        )
+    finally:
+        # let the stalled command finish
+        os.close(os.open(mounts, os.O_WRONLY | os.O_NONBLOCK))
+    assert time.perf_counter() - start < AUDIT_TIMEOUT_SECONDS
+
+    results = [json.loads(line) for line in report.read_text().splitlines()]
+    assert [(result["host"], result["status"]) for result in results] == [
+        ("@sandbox/fast", "success"),
+        ("@sandbox/slow", "timeout"),
+    ]
+    assert "cramfs" in results[0]["result"]["loadable"]
+
+
+def test_rolling(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A rolling run should stop starting hosts once one fails."""
+    roots = {name: tmp_path / name for name in ("a", "b", "c", "d")}
+    inventory = make_fleet_inventory(tmp_path, roots, "debian-13")
+    put_file = SandboxConnector.put_file
+
+    def fail_on_b(self: SandboxConnector, *args: Any, **kwargs: Any) -> bool:
+        if self.host.name == "@sandbox/b":
+            return False
+        return put_file(self, *args, **kwargs)
+
+    monkeypatch.setattr(SandboxConnector, "put_file", fail_on_b)
+
+    run(
+        "harden",
+        str(inventory),
+        "--full",
+        "--strategy",
+        "rolling",
+        "--canary",
+        "1",
+        "--batch-size",
+        "1",
+    )
+    changed = {
+        name
+        for name, root in roots.items()
+        if (root / "etc" / "modprobe.d" / "cis.conf").exists()
+    }
+    assert changed == {"a"}
+
+
+def test_fact_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A host that errors while facts are fetched shouldn't stop the others."""
+    roots = {name: tmp_path / name for name in ("good", "bad")}
+    inventory = make_fleet_inventory(tmp_path, roots, "debian-13")
+    run_shell_command = SandboxConnector.run_shell_command
+
+    def fail_on_bad(
+        self: SandboxConnector, *args: Any, **kwargs: Any
+    ) -> tuple[bool, Any]:
+        if self.host.name == "@sandbox/bad":
+            err_msg = "connection reset"
+            raise OSError(err_msg)
+        return run_shell_command(self, *args, **kwargs)
+
+    monkeypatch.setattr(SandboxConnector, "run_shell_command", fail_on_bad)
+
+    run("harden", str(inventory), "--full")
+    assert (roots["good"] / "etc" / "modprobe.d" / "cis.conf").exists()
+    assert not (roots["bad"] / "etc" / "modprobe.d" / "cis.conf").exists()
+
+    report = tmp_path / "report.jsonl"
+    run("harden", str(inventory), "--audit", "--output", str(report))
+    results = [json.loads(line) for line in report.read_text().splitlines()]
+    assert {(result["host"], result["status"]) for result in results} == {
+        ("@sandbox/good", "success"),
+        ("@sandbox/bad", "error"),
+    }
+
+
+def test_summarize(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Summaries should rank the hosts and checks that failed."""
+    roots = {name: tmp_path / name for name in ("a", "b")}
+    inventory = make_fleet_inventory(tmp_path, roots, "debian-13")
+    put_file = SandboxConnector.put_file
+
+    def fail_on_b(self: SandboxConnector, *args: Any, **kwargs: Any) -> bool:
+        if self.host.name == "@sandbox/b":
+            return False
+        return put_file(self, *args, **kwargs)
+
+    monkeypatch.setattr(SandboxConnector, "put_file", fail_on_b)
+    report = tmp_path / "report.jsonl"
+    run("harden", str(inventory), "--full", "--output", str(report))
+    capsys.readouterr()
+
+    table_csv = tmp_path / "results.csv"
+    run("summarize", str(report), "--matrix", "--csv", str(table_csv))
+    output = capsys.readouterr().out
+    records = report.read_text().splitlines()
+    checks = len(records) // len(roots)
+    worst_hosts = output.split("Worst hosts\n")[1].splitlines()
+    assert worst_hosts[0].split() == [
+        "@sandbox/b",
+        f"{checks}/{checks}",
+        "failed",
+    ]
+    assert "@sandbox/a" not in output.split("Worst checks")[0]
+    rows = table_csv.read_text().splitlines()
+    assert rows[0] == "host,check,status,changed,duration"
+    assert len(rows) == 1 + len(records)
+
+
+def add_blacklist(root: Path) -> None:
+    """Blacklist a module in a new modprobe config file."""
+    (root / "etc" / "modprobe.d" / "local.conf").write_text(
+        "blacklist usb-storage\n"
+    )
+
+
+def add_mount(root: Path) -> None:
+    """Mount a filesystem."""
+    mounts = root / "proc" / "mounts"
+    mounts.write_text(mounts.read_text() + "/dev/sr0 /media udf ro 0 0\n")
+
+
+def add_module_file(root: Path) -> None:
+    """Install a filesystem module."""
+    fs_dir = next((root / "usr" / "lib" / "modules").glob("*/kernel/fs"))
+    (fs_dir / "examplefs").mkdir()
+    (fs_dir / "examplefs" / "examplefs.ko.xz").write_text("")
+
+
+@pytest.mark.parametrize(
+    ("change", "component"),
+    [
+        (add_blacklist, "modprobe_config"),
+        (add_mount, "mounts"),
+        (add_module_file, "module_files"),
+    ],
+)
+def test_watch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    change: Callable[[Path], None],
+    component: str,
+) -> None:
+    """Watching should audit hosts at first and again only once they drift."""
+    inventory, root = make_inventory(tmp_path, "debian-13")
+    events_path = tmp_path / "events.jsonl"
+    changed = False
+
+    def drift(_seconds: float) -> None:
+        nonlocal changed
+        if not changed:
+            change(root)
+            changed = True
+
+    monkeypatch.setattr("home_server.watch.main.time.sleep", drift)
+    run(
+        "watch",
+        str(inventory),
+        "--count",
+        "3",
+        "--interval",
+        "0",
+        "--output",
+        str(events_path),
+    )
+
+    events = [json.loads(line) for line in events_path.read_text().splitlines()]
+    kinds = [event["type"] for event in events]
+    audits = [event for event in events if event["type"] == "audit"]
+    # a baseline audit, a drift and its audit and then nothing
+    assert kinds.count("drift") == 1
+    drift_index = kinds.index("drift")
+    assert events[drift_index]["components"] == [component]
+    assert 0 < drift_index < len(events) - 1
+    assert len(audits) == 2 * drift_index
+    assert {event["status"] for event in audits} == {"success"}
+
+
+class AuditWithOp(Check):
+    """Audit a host with an op."""
+
+    name = "audit-op"
+    audit = True
+
+    @classmethod
+    @override
+    def run(cls, state: State, hosts: list[Host]) -> CheckMeta:
+        meta = CheckMeta(state, hosts)
+        meta.add_op(server.shell, "echo audited")
+        return meta
+
+    @staticmethod
+    @override
+    def _minimum_profiles() -> frozenset[Profile]:
+        return frozenset(Profile)
+
+
+def test_watch_ops(tmp_path: Path) -> None:
+    """Ops added by an audit should run once, even after an earlier audit."""
+    inventory, root = make_inventory(tmp_path, "debian-13")
+    state = State(make_inventory_from_yaml(inventory), Config())
+    connect_all(state)
+    watcher = Watcher(
+        state,
+        [AuditWithOp],
+        watched_components([AuditWithOp]),
+        EventWriter(tmp_path / "events.jsonl"),
+    )
+    hosts = state.inventory.get_active_hosts()
+    watcher.audit(hosts)
+    watcher.audit(hosts)
+    commands = [record["command"] for record in read_commands(root)]
+    assert commands.count("echo audited") == len(["first", "second"])